@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Streaming parser for arXiv API (Atom 1.0) responses.
+Yields one normalized paper dict per <entry> without building a full tree.
+"""
+from __future__ import annotations
+
+import re
+from typing import IO, Iterator
+from xml.etree.ElementTree import iterparse
+
+PARSER_VERSION = 2  # bump when parse_entry's fields change (2: affiliations), so stored records are refreshed
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+ARXIV_NS = "{http://arxiv.org/schemas/atom}"
+
+ENTRY_TAG = f"{ATOM_NS}entry"
+WHITESPACE_RE = re.compile(r"\s+")
+VERSION_RE = re.compile(r"v\d+$")
+
+
+def clean_text(text: str | None) -> str:
+    """Collapse runs of whitespace (arXiv wraps titles and abstracts)."""
+    if not text:
+        return ""
+    return WHITESPACE_RE.sub(" ", text).strip()
+
+
+def parse_entry(entry) -> dict:
+    """Normalize one Atom <entry> element into the fields fetch_papers stores."""
+    raw_id = entry.findtext(f"{ATOM_NS}id", "")
+    arxiv_id = raw_id.split("/abs/")[-1]
+    authors: list[str] = []
+    affiliations: list[str] = []
+    for author in entry.iterfind(f"{ATOM_NS}author"):
+        name = clean_text(author.findtext(f"{ATOM_NS}name"))
+        if name:
+            authors.append(name)
+        for aff in author.iterfind(f"{ARXIV_NS}affiliation"):
+            cleaned = clean_text(aff.text)
+            if cleaned:
+                affiliations.append(cleaned)
+
+    pdf_url = ""
+    for link in entry.iterfind(f"{ATOM_NS}link"):
+        if link.get("type") == "application/pdf":
+            pdf_url = link.get("href", "")
+            break
+
+    return {
+        # Remove version suffix for dedup (e.g., "2401.12345v2" -> "2401.12345")
+        "id": VERSION_RE.sub("", arxiv_id),
+        "title": clean_text(entry.findtext(f"{ATOM_NS}title")),
+        "authors": authors,
+        # De-duplicate while preserving order
+        "affiliations": list(dict.fromkeys(affiliations)),
+        "abstract": clean_text(entry.findtext(f"{ATOM_NS}summary")),
+        "published": (entry.findtext(f"{ATOM_NS}published") or "").strip(),
+        "updated": (entry.findtext(f"{ATOM_NS}updated") or "").strip(),
+        "categories": [c.get("term", "") for c in entry.iterfind(f"{ATOM_NS}category") if c.get("term")],
+        "pdf_url": pdf_url,
+    }
+
+
+def iter_arxiv_entries(source: IO[bytes] | str) -> Iterator[dict]:
+    """Incrementally parse an arXiv Atom feed from a file-like byte stream or path.
+
+    Each <entry> is normalized and then discarded, so peak memory stays at
+    one entry rather than the whole page.
+    """
+    root = None
+    for event, elem in iterparse(source, events=("start", "end")):
+        if root is None:
+            root = elem
+            continue
+        if event == "end" and elem.tag == ENTRY_TAG:
+            yield parse_entry(elem)
+            root.clear()
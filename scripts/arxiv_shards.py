@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Sharded arXiv harvesting: split one search query into date-window
+sub-queries and merge their results through an ID-keyed dedup index.
+
+Each shard is an independent paginated result set, so a backfill is no
+longer limited to MAX_TOTAL_RESULTS overall, shards can run concurrently,
+and a failing shard is retried on its own.
+"""
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+
+from arxiv_atom import VERSION_RE
+
+SUBMITTED_DATE_FORMAT = "%Y%m%d%H%M"  # arXiv submittedDate range bounds (GMT)
+
+
+def canonical_id(arxiv_id: str) -> str:
+    """Versionless arXiv ID ("2401.12345v2" -> "2401.12345"), as parse_entry stores it."""
+    return VERSION_RE.sub("", arxiv_id.strip())
+
+
+def id_version(arxiv_id: str) -> int:
+    """Version number of an arXiv ID, 0 when it has no suffix."""
+    match = VERSION_RE.search(arxiv_id.strip())
+    return int(match.group(0)[1:]) if match else 0
+
+
+class Shard:
+    """One sub-query of the harvest: the base query limited to [start, end)."""
+
+    __slots__ = ("name", "query", "start", "end")
+
+    def __init__(self, base_query: str, start: datetime, end: datetime):
+        self.start = start
+        self.end = end
+        self.name = f"{start:%Y-%m}..{add_months(end, -1):%Y-%m}"
+        # Bounds are inclusive to the minute, so stop one minute before the next shard
+        lo = start.strftime(SUBMITTED_DATE_FORMAT)
+        hi = datetime.fromtimestamp(end.timestamp() - 60, timezone.utc).strftime(SUBMITTED_DATE_FORMAT)
+        self.query = f"({base_query}) AND submittedDate:[{lo} TO {hi}]"
+
+    def __repr__(self) -> str:
+        return f"Shard({self.name})"
+
+
+def add_months(when: datetime, months: int) -> datetime:
+    month = when.month - 1 + months
+    return when.replace(year=when.year + month // 12, month=month % 12 + 1, day=1)
+
+
+def date_shards(base_query: str, since: datetime, until: datetime, months: int) -> list[Shard]:
+    """Month-aligned windows of ``months`` months covering [since, until], newest first."""
+    shards: list[Shard] = []
+    start = since.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    while start <= until:
+        end = add_months(start, months)
+        shards.append(Shard(base_query, start, end))
+        start = end
+    shards.reverse()
+    return shards
+
+
+class DedupIndex:
+    """Papers from all shards keyed by versionless ID; thread-safe.
+
+    When two shards return the same paper, the higher version wins, then the
+    later ``updated`` timestamp; the first one seen wins ties.
+    """
+
+    def __init__(self):
+        self._papers: dict[str, dict] = {}
+        self._rank: dict[str, tuple[int, str]] = {}
+        self.duplicates = 0
+        self._lock = threading.Lock()
+
+    def add(self, paper: dict) -> bool:
+        """Index a paper; return True when its ID had not been seen before."""
+        pid = canonical_id(paper["id"])
+        rank = (id_version(paper["id"]), paper.get("updated", ""))
+        with self._lock:
+            if pid in self._papers:
+                self.duplicates += 1
+                if rank > self._rank[pid]:
+                    self._papers[pid] = {**paper, "id": pid}
+                    self._rank[pid] = rank
+                return False
+            self._papers[pid] = paper if paper["id"] == pid else {**paper, "id": pid}
+            self._rank[pid] = rank
+            return True
+
+    def __len__(self) -> int:
+        return len(self._papers)
+
+    def papers(self) -> list[dict]:
+        """All indexed papers, newest submission first (the API's sort order)."""
+        with self._lock:
+            papers = list(self._papers.values())
+        papers.sort(key=lambda p: (p.get("published", ""), p["id"]), reverse=True)
+        return papers
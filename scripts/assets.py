@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Post-build asset helpers: content-hashed file names, precompressed
+.gz / .br siblings, a size manifest and incremental build state for dist/.
+"""
+from __future__ import annotations
+
+import contextlib
+import gzip
+import hashlib
+import json
+from pathlib import Path
+from typing import Iterable
+
+from file_io import atomic_write
+
+HASH_LENGTH = 10
+COMPRESSIBLE_SUFFIXES = (".html", ".css", ".js", ".json", ".xml", ".svg", ".txt")
+MANIFEST_NAME = "asset-manifest.json"
+STATE_NAME = ".build-state.json"
+STATE_VERSION = 1
+BROTLI_QUALITY = 11       # the few large, long-cached outputs (index.html, search index, css/js)
+BROTLI_BULK_QUALITY = 9   # outputs written by the dozen (detail shards, per-tag feeds)
+
+_BROTLI = None  # the brotli module once imported, False when it is missing
+
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def content_hash(data: bytes) -> str:
+    return sha256_hex(data)[:HASH_LENGTH]
+
+
+def hashed_name(name: str, data: bytes) -> str:
+    """Insert the content hash before the extension: app.js -> app.<hash>.js."""
+    stem, dot, suffix = name.rpartition(".")
+    if not dot:
+        return f"{name}.{content_hash(data)}"
+    return f"{stem}.{content_hash(data)}.{suffix}"
+
+
+def source_version(*paths: Path) -> str:
+    """Hash of script sources, so code changes invalidate the build state."""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def get_brotli():
+    """Return the brotli module, imported on first use; None when it is not installed.
+
+    Optional dependency: .br siblings are skipped without it.
+    """
+    global _BROTLI
+    if _BROTLI is None:
+        try:
+            import brotli
+        except ImportError:
+            brotli = False
+        _BROTLI = brotli
+    return _BROTLI or None
+
+
+def compress_siblings(path: Path, data: bytes, quality: int = BROTLI_QUALITY) -> dict:
+    """Write <path>.gz (level 9) and <path>.br (``quality``); return their sizes."""
+    sizes: dict[str, int] = {}
+    if path.suffix not in COMPRESSIBLE_SUFFIXES:
+        return sizes
+    # mtime=0 keeps the .gz bytes stable across builds
+    gz = gzip.compress(data, compresslevel=9, mtime=0)
+    atomic_write(path.with_name(path.name + ".gz"), gz)
+    sizes["gzip"] = len(gz)
+    brotli = get_brotli()
+    if brotli is not None:
+        br = brotli.compress(data, quality=quality)
+        atomic_write(path.with_name(path.name + ".br"), br)
+        sizes["br"] = len(br)
+    return sizes
+
+
+class BuildState:
+    """Input and output hashes of one build step ("site", "rss", ...).
+
+    All steps share dist/.build-state.json. Outputs whose bytes match the
+    previous build are not rewritten, so their mtimes stay stable. Outputs
+    from the previous build that were not produced again are removed.
+    """
+
+    def __init__(self, root: Path, step: str):
+        self.root = root
+        self.step = step
+        self.path = root / STATE_NAME
+        previous = self._load().get("steps", {}).get(step, {})
+        self.prev_inputs: dict[str, str] = previous.get("inputs", {})
+        self.prev_outputs: dict[str, dict] = previous.get("outputs", {})
+        self.inputs: dict[str, str] = {}
+        self.outputs: dict[str, dict] = {}
+        self.written = 0
+        self.unchanged = 0
+        self.removed = 0
+
+    def _load(self) -> dict:
+        if not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return data if data.get("version") == STATE_VERSION else {}
+
+    @property
+    def has_previous(self) -> bool:
+        return bool(self.prev_outputs)
+
+    def add_input(self, name: str, data: bytes) -> None:
+        self.inputs[name] = sha256_hex(data)
+
+    def _on_disk(self, rel: str, entry: dict) -> bool:
+        path = self.root / rel
+        try:
+            if path.stat().st_size != entry.get("bytes"):
+                return False
+        except FileNotFoundError:
+            return False
+        return all(
+            path.with_name(path.name + ext).exists()
+            for key, ext in (("gzip", ".gz"), ("br", ".br")) if key in entry
+        )
+
+    def is_fresh(self) -> bool:
+        """True when inputs match the last build and its outputs are still on disk."""
+        if not self.prev_outputs or self.inputs != self.prev_inputs:
+            return False
+        if not all(self._on_disk(rel, entry) for rel, entry in self.prev_outputs.items()):
+            return False
+        self.outputs = dict(self.prev_outputs)
+        return True
+
+    def write(self, rel: str, data: bytes, quality: int = BROTLI_QUALITY) -> dict:
+        """Write an output (plus compressed siblings at brotli ``quality``) unless it is unchanged."""
+        digest = sha256_hex(data)
+        previous = self.prev_outputs.get(rel)
+        if previous and previous.get("sha256") == digest and self._on_disk(rel, previous):
+            self.unchanged += 1
+            entry = previous
+        else:
+            path = self.root / rel
+            atomic_write(path, data)
+            entry = {"bytes": len(data), "sha256": digest, **compress_siblings(path, data, quality)}
+            self.written += 1
+        self.outputs[rel] = entry
+        return entry
+
+    def keep(self, rels: Iterable[str], **fields) -> bool:
+        """Carry previous outputs over without producing them again (all or none).
+
+        Only when every entry records these ``fields`` (e.g. a digest of what
+        it was built from) and its files are still on disk.
+        """
+        rels = list(rels)
+        previous = [self.prev_outputs.get(rel) for rel in rels]
+        if not all(entry and all(entry.get(k) == v for k, v in fields.items())
+                   and self._on_disk(rel, entry) for rel, entry in zip(rels, previous)):
+            return False
+        for rel, entry in zip(rels, previous):
+            self.outputs[rel] = entry
+        self.unchanged += len(rels)
+        return True
+
+    def write_asset(self, rel_dir: str, name: str, data: bytes, hashed: bool = True,
+                    quality: int = BROTLI_QUALITY) -> tuple[str, dict]:
+        """Write under a content-hashed name (optional); return (relative path, entry)."""
+        out_name = hashed_name(name, data) if hashed else name
+        rel = f"{rel_dir}/{out_name}" if rel_dir else out_name
+        return rel, self.write(rel, data, quality)
+
+    def remove_stale(self) -> None:
+        """Delete outputs of the previous build that this build did not produce."""
+        for rel in self.prev_outputs.keys() - self.outputs.keys():
+            path = self.root / rel
+            for target in (path, path.with_name(path.name + ".gz"), path.with_name(path.name + ".br")):
+                with contextlib.suppress(FileNotFoundError):
+                    target.unlink()
+            self.removed += 1
+
+    def save(self) -> None:
+        data = self._load()
+        data["version"] = STATE_VERSION
+        data.setdefault("steps", {})[self.step] = {"inputs": self.inputs, "outputs": self.outputs}
+        write_if_changed(self.path, json.dumps(data, indent=2, sort_keys=True).encode("utf-8"))
+
+    def summary(self) -> str:
+        return f"{self.written} written, {self.unchanged} unchanged, {self.removed} stale removed"
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Atomically write data unless the file already holds exactly these bytes."""
+    if path.exists() and path.read_bytes() == data:
+        return False
+    atomic_write(path, data)
+    return True
+
+
+def write_manifest(dist_dir: Path, owner: str, entries: dict[str, dict]) -> Path:
+    """Replace one step's entries (logical name -> {file, bytes, gzip, br, sha256}) in the manifest."""
+    path = dist_dir / MANIFEST_NAME
+    manifest: dict[str, dict] = {}
+    if path.exists():
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    manifest = {k: v for k, v in manifest.items() if v.get("owner") != owner}
+    manifest.update({k: {**v, "owner": owner} for k, v in entries.items()})
+    write_if_changed(path, json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"))
+    return path
+
+
+def summarize(entries: dict[str, dict]) -> str:
+    """One-line raw / gzip / brotli totals for a set of manifest entries."""
+    raw = sum(e.get("bytes", 0) for e in entries.values())
+    gz = sum(e.get("gzip", e.get("bytes", 0)) for e in entries.values())
+    line = f"{len(entries)} files, {raw / 1024:.1f} KiB raw, {gz / 1024:.1f} KiB gzip"
+    if get_brotli() is not None:
+        br = sum(e.get("br", e.get("bytes", 0)) for e in entries.values())
+        line += f", {br / 1024:.1f} KiB brotli"
+    return line
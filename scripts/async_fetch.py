@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Overlapped fetch mode for fetch_papers (--async).
+
+The sequential fetch_papers.main fetches every API page, then merges, then
+fetches method figures, then saves. Here the same steps run as asyncio
+stages joined by bounded queues, so a slow stage holds back the ones that
+feed it:
+
+  pages       iter_arxiv_pages on a thread; it blocks while
+              ASYNC_PAGE_QUEUE parsed pages wait to be merged
+  merge       merge_papers per page, on the event loop; papers it adds
+              that need a figure go on a queue of ASYNC_FIGURE_QUEUE
+              (merging waits while the queue is full)
+  figures     FIGURE_WORKERS tasks running enrich_method_figure on threads,
+              at most MAX_FIGURE_FETCH papers per run
+  checkpoint  saves the corpus merged so far every CHECKPOINT_INTERVAL
+              seconds, then the final save (papers, author index,
+              watermark), all on one writer thread
+
+Paper dicts are only changed on the event loop: figure workers fill a copy
+whose figure fields are copied back, and checkpoints save a snapshot.
+Pages arrive newest first and merge_papers keeps equal timestamps in
+arrival order, so merging page by page gives the sequential result (except
+that a paper trimmed by MAX_PAPERS after one page and returned again by a
+later page is merged as new). The harvest watermark is only saved at the
+end, so an interrupted run pages back over what it had not finished.
+
+HTTP stays on requests: blocking calls run on threads and share the rate
+limiter, session pool and cache with the sequential mode.
+
+What this overlaps is waiting: figures are fetched during the REQUEST_DELAY
+between API pages. When responses come back fast there is nothing to hide,
+and on one core the thread hand-offs make this mode slightly slower than
+the sequential one.
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+FIGURE_FIELDS = ("method_fig_url", "method_fig_source", "method_fig_caption")
+
+
+class AsyncFetch:
+    """One --async run over the fetch_papers module ``fetch``.
+
+    The module is passed in rather than imported, so running fetch_papers.py
+    as a script shares its settings and HTTP singletons with this run.
+    """
+
+    def __init__(self, fetch, existing: list[dict], watermark, full: bool):
+        self.fetch = fetch
+        self.papers = existing
+        self.watermark = watermark
+        self.full = full
+        self.author_index = fetch.load_author_index(fetch.AUTHOR_INDEX_JSON)
+        self.queued: set[str] = set()  # IDs handed to the figure workers
+        self.found = self.failed = self.done = 0
+        self.dirty = False             # merged or enriched since the last checkpoint
+        self.stopping = threading.Event()  # tells the pager thread to stop after a failure
+        self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint")
+
+    def run(self) -> dict:
+        """Fetch, merge, enrich and save; return the saved corpus as fetch_papers.main does."""
+        # sqlite connections belong to their thread: the writer reopens the store
+        self.fetch.close_paper_store()
+        try:
+            return asyncio.run(self.pipeline())
+        finally:
+            self.writer.shutdown(wait=True)
+
+    async def pipeline(self) -> dict:
+        loop = asyncio.get_running_loop()
+        pages: asyncio.Queue = asyncio.Queue(self.fetch.ASYNC_PAGE_QUEUE)
+        figures: asyncio.Queue = asyncio.Queue(self.fetch.ASYNC_FIGURE_QUEUE)
+        workers = self.fetch.FIGURE_WORKERS if self.fetch.figures_enabled() else 0
+        if workers:
+            print(f"  Fetching method figures as papers are merged ({workers} workers)...")
+
+        stages = [
+            asyncio.create_task(self.read_pages(pages, loop)),
+            asyncio.create_task(self.merge_pages(pages, figures if workers else None, workers)),
+            *(asyncio.create_task(self.enrich(figures)) for _ in range(workers)),
+        ]
+        finished = asyncio.Event()
+        checkpoints = asyncio.create_task(self.checkpoint(finished))
+        try:
+            await asyncio.gather(*stages)
+        except BaseException:
+            self.stopping.set()
+            while not pages.empty():  # unblock a pager waiting for room
+                pages.get_nowait()
+            for task in (*stages, checkpoints):
+                task.cancel()
+            raise
+        finished.set()
+        await checkpoints
+
+        if workers:
+            report = self.fetch.get_report()
+            report.count("figures.candidates", len(self.queued))
+            report.count("figures.found", self.found)
+            report.count("figures.failed", self.failed)
+            print(f"  Method figures: {self.found} found, {self.failed} failed, "
+                  f"{len(self.queued) - self.found - self.failed} without figure.")
+        print("Saving...")
+        with self.fetch.get_report().stage("save"):
+            return await loop.run_in_executor(self.writer, self.save_final)
+
+    async def read_pages(self, pages: asyncio.Queue, loop: asyncio.AbstractEventLoop) -> None:
+        """Run the API pager on a thread, handing each page to the merge stage."""
+        def pump() -> None:
+            reader = self.fetch.iter_arxiv_pages(self.watermark, full=self.full)
+            try:
+                for page in reader:
+                    if self.stopping.is_set():
+                        break
+                    # Blocks this thread while the page queue is full
+                    asyncio.run_coroutine_threadsafe(pages.put(page), loop).result()
+            except CancelledError:  # the run was cancelled while waiting for room
+                pass
+            finally:
+                reader.close()
+
+        try:
+            await asyncio.to_thread(pump)
+        finally:
+            await pages.put(None)
+
+    async def merge_pages(self, pages: asyncio.Queue, figures: asyncio.Queue | None, workers: int) -> None:
+        fetch = self.fetch
+        report = fetch.get_report()
+        fetched = 0
+        swept = False  # the first merge scans the whole stored corpus, later pages skip it
+        cap = fetch.MAX_FIGURE_FETCH
+        while (page := await pages.get()) is not None:
+            fetched += len(page)
+            print(f"Merging {len(page)} papers...")
+            with report.stage("merge"):
+                result = fetch.merge_papers(self.papers, page, self.author_index, swept=swept)
+            self.papers = result.papers
+            self.dirty = swept = True
+            if figures is None or fetch.FIGURE_BACKFILL:
+                continue
+            for paper in page:  # newest first, like the sequential candidates
+                if paper["id"] in result.added and fetch.needs_figure_refresh(paper):
+                    if cap and len(self.queued) >= cap:
+                        break
+                    self.queued.add(paper["id"])
+                    await figures.put(paper)
+        print(f"Fetched {fetched} papers from arXiv.")
+        if not swept:
+            # No new papers: still re-tag after a rules change, as the sequential mode does
+            with report.stage("merge"):
+                self.papers = fetch.merge_papers(self.papers, [], self.author_index).papers
+            self.dirty = True
+        if figures is not None:
+            if fetch.FIGURE_BACKFILL:
+                # Backfill candidates are only known once the corpus is complete
+                for paper in self.papers:
+                    if cap and len(self.queued) >= cap:
+                        break
+                    if fetch.needs_figure_refresh(paper):
+                        self.queued.add(paper["id"])
+                        await figures.put(paper)
+            for _ in range(workers):
+                await figures.put(None)
+
+    async def enrich(self, figures: asyncio.Queue) -> None:
+        """Figure worker: fetch on a thread into a copy, copy the figure fields back."""
+        fetch = self.fetch
+        while (paper := await figures.get()) is not None:
+            work, stats = dict(paper), {}
+            pid = paper.get("id", "")
+            try:
+                found = await asyncio.to_thread(fetch.enrich_method_figure, work, stats)
+            except Exception as exc:  # isolate failures to the paper that raised
+                self.failed += 1
+                self.done += 1
+                print(f"  [{self.done}] {pid}: failed ({type(exc).__name__}: {exc})")
+                continue
+            for key in FIGURE_FIELDS:
+                if key in work:
+                    paper[key] = work[key]
+                else:
+                    paper.pop(key, None)
+            self.dirty = True
+            self.done += 1
+            self.found += found
+            detail = fetch.record_figure_stats(stats)
+            print(f"  [{self.done}] {pid}: {'found method figure' if found else 'no method figure'}{detail}")
+
+    async def checkpoint(self, finished: asyncio.Event) -> None:
+        """Save the corpus so far every CHECKPOINT_INTERVAL seconds until the stages finish."""
+        loop = asyncio.get_running_loop()
+        interval = self.fetch.CHECKPOINT_INTERVAL
+        report = self.fetch.get_report()
+        while not finished.is_set():
+            try:
+                await asyncio.wait_for(finished.wait(), interval)
+            except asyncio.TimeoutError:
+                pass
+            if finished.is_set() or not self.dirty:
+                continue
+            self.dirty = False
+            snapshot = [dict(paper) for paper in self.papers]
+            started = time.perf_counter()
+            print(f"  Checkpoint: saving {len(snapshot)} papers in the background...")
+            await loop.run_in_executor(self.writer, self.fetch.save_papers, snapshot)
+            report.count("checkpoints")
+            report.add_time("checkpoint.save", time.perf_counter() - started)
+
+    def save_final(self) -> dict:
+        """Final save, on the writer thread; closes the paper store there."""
+        fetch = self.fetch
+        fetch.save_papers(self.papers)
+        # Per-page merges skip this check; it runs once here
+        if self.author_index.ensure(self.papers):
+            print(f"  Rebuilt the author index ({len(self.papers)} papers).")
+        self.author_index.save(fetch.AUTHOR_INDEX_JSON)
+        self.watermark.save()
+        corpus = fetch.get_paper_store().corpus(self.papers)
+        fetch.close_paper_store()
+        return corpus
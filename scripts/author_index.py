@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Author and affiliation index, kept up to date by merge_papers and shipped
+to the site for author / affiliation facets.
+
+Names are grouped under a folded key: diacritics and case are dropped,
+letters without a decomposition (ø, ß, ł, ...) are transliterated and
+punctuation becomes a space, so "José Müller", "Jose Muller" and
+"J. Müller" fold to "jose muller", "jose muller" and "j muller". Each key
+keeps the spellings seen (with paper counts); the most common one is shown.
+
+data/author_index.json (AuthorIndex.save) holds postings of paper IDs, so
+a merge only touches the papers it adds, updates or evicts. The site
+artifact (site_index, version 1) is per kind:
+
+  keys      sorted folded keys
+  names     display spelling per key
+  postings  one string per key: ascending card-index ordinals,
+            delta-encoded as base64 VLQ (the search index's encoding)
+"""
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Iterable
+
+from file_io import atomic_write
+from search_index import encode_vlq, normalize
+
+AUTHOR_INDEX_VERSION = 1      # site artifact format
+AUTHOR_STATE_VERSION = 1      # data/author_index.json format
+KINDS = ("authors", "affiliations")
+# Letters NFKD leaves alone; mirrored by NAME_FOLDS in app.js
+NAME_FOLDS = str.maketrans({
+    "ø": "o", "đ": "d", "ð": "d", "ł": "l", "ı": "i", "ß": "ss", "æ": "ae", "œ": "oe", "þ": "th",
+})
+NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
+def fold_name(name: str) -> str:
+    """Grouping key of an author or affiliation name ("" when nothing is left)."""
+    return NON_ALNUM_RE.sub(" ", normalize(name).translate(NAME_FOLDS)).strip()
+
+
+def paper_names(paper: dict, kind: str) -> list[tuple[str, str]]:
+    """(key, spelling) pairs of one paper, one per key."""
+    pairs: dict[str, str] = {}
+    for name in paper.get(kind) or ():
+        key = fold_name(name) if isinstance(name, str) else ""
+        if key and key not in pairs:
+            pairs[key] = name
+    return list(pairs.items())
+
+
+class NameIndex:
+    """Postings (paper IDs) and spelling counts per folded name."""
+
+    def __init__(self):
+        self.postings: dict[str, set[str]] = {}
+        self.spellings: dict[str, dict[str, int]] = {}
+
+    def add(self, pid: str, pairs: list[tuple[str, str]]) -> None:
+        for key, name in pairs:
+            self.postings.setdefault(key, set()).add(pid)
+            counts = self.spellings.setdefault(key, {})
+            counts[name] = counts.get(name, 0) + 1
+
+    def remove(self, pid: str, pairs: list[tuple[str, str]]) -> None:
+        for key, name in pairs:
+            docs = self.postings.get(key)
+            if docs is None:
+                continue
+            docs.discard(pid)
+            counts = self.spellings[key]
+            if counts.get(name, 0) > 1:
+                counts[name] -= 1
+            else:
+                counts.pop(name, None)
+            if not docs:
+                del self.postings[key], self.spellings[key]
+
+    def display(self, key: str) -> str:
+        """Most common spelling; ties go to the one keeping diacritics, then the first in order."""
+        counts = self.spellings[key]
+        return min(counts, key=lambda name: (-counts[name], name.isascii(), name))
+
+    def __len__(self) -> int:
+        return len(self.postings)
+
+
+class AuthorIndex:
+    """Author and affiliation NameIndexes over one corpus, keyed by paper ID."""
+
+    def __init__(self):
+        self.papers: set[str] = set()
+        self.kinds = {kind: NameIndex() for kind in KINDS}
+        self.stale = False  # set when an update could not be applied exactly
+
+    def add_paper(self, paper: dict) -> None:
+        pid = paper["id"]
+        if pid in self.papers:
+            self.stale = True
+            return
+        self.papers.add(pid)
+        for kind, index in self.kinds.items():
+            index.add(pid, paper_names(paper, kind))
+
+    def remove_paper(self, paper: dict) -> None:
+        """Unindex a paper; ``paper`` must carry the names it was indexed with."""
+        pid = paper["id"]
+        if pid not in self.papers:
+            return
+        self.papers.discard(pid)
+        for kind, index in self.kinds.items():
+            index.remove(pid, paper_names(paper, kind))
+
+    def rebuild(self, papers: Iterable[dict]) -> None:
+        self.__init__()
+        for paper in papers:
+            self.add_paper(paper)
+
+    def ensure(self, papers: list[dict]) -> bool:
+        """Rebuild unless the index covers exactly these papers; True when it rebuilt."""
+        if not self.stale and len(self.papers) == len(papers) and all(p["id"] in self.papers for p in papers):
+            return False
+        self.rebuild(papers)
+        return True
+
+    # -- data/author_index.json -----------------------------------------------
+
+    def to_json(self) -> dict:
+        return {
+            "version": AUTHOR_STATE_VERSION,
+            "papers": sorted(self.papers),
+            **{kind: {key: {"names": index.spellings[key], "papers": sorted(docs)}
+                      for key, docs in sorted(index.postings.items())}
+               for kind, index in self.kinds.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> AuthorIndex:
+        index = cls()
+        if data.get("version") != AUTHOR_STATE_VERSION:
+            return index
+        index.papers = set(data.get("papers", []))
+        for kind, names in index.kinds.items():
+            for key, entry in data.get(kind, {}).items():
+                names.postings[key] = set(entry["papers"])
+                names.spellings[key] = dict(entry["names"])
+        return index
+
+    def save(self, path: Path) -> None:
+        atomic_write(path, json.dumps(self.to_json(), ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+    # -- site artifact --------------------------------------------------------
+
+    def site_index(self, papers: list[dict]) -> dict:
+        """Artifact for papers in card-index order (call ensure(papers) first)."""
+        ordinals = {p["id"]: i for i, p in enumerate(papers)}
+        out: dict = {"version": AUTHOR_INDEX_VERSION, "doc_count": len(papers)}
+        for kind, index in self.kinds.items():
+            keys = sorted(index.postings)
+            out[kind] = {
+                "keys": keys,
+                "names": [index.display(key) for key in keys],
+                "postings": [encode_vlq(sorted(ordinals[pid] for pid in index.postings[key])) for key in keys],
+            }
+        return out
+
+
+def load_author_index(path: Path) -> AuthorIndex:
+    """The saved index, or an empty one (rebuilt by ensure) when missing or unreadable."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return AuthorIndex()
+    return AuthorIndex.from_json(data)
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for the fetch -> build pipeline.
+
+Times each stage on synthetic corpora (1k / 10k / 100k papers by default):
+
+  parse     stream a synthetic arXiv Atom page through iter_arxiv_entries
+  filter    is_relevant on every entry
+  tag       TagClassifier.classify_many
+  merge     incremental merge: 10% new papers plus 5% updated records
+  model     PaperCorpus.from_dicts on the merged corpus, with the memory
+            retained by the dicts vs the records (tracemalloc) and the
+            papers.json vs compact JSON sizes; the round trip must be exact
+  figures   extract_method_figure on synthetic arXiv HTML pages, served by
+            http_get in fixture replay mode (streaming parser, early stop);
+            figures_full scans whole pages and figures_soup uses the
+            BeautifulSoup parser, which must pick the same figures
+  save      first save of the merged corpus to the paper store
+  build     build_site.build into an empty dist/ (then build_noop: rerun)
+  build_compact  the same build with the corpus held as a PaperCorpus,
+            which rebuilds each paper's dict on every pass; also the
+            traced peak memory of a build (brotli off) with dicts vs records
+  rss       generate_rss.generate_rss: global and per-tag feeds in RSS, Atom
+            and JSON Feed (items = entries across all feeds)
+
+With --fixtures DIR, a recorded run (HTTP_FIXTURES=record) is also replayed
+end to end through fetch_papers.main, sequentially (fetch_replay) and with
+--async (fetch_replay_async); both must save the same papers. Replay answers
+instantly, so --replay-latency adds a per-response delay standing in for
+the network, and --replay-paced applies the live per-host rate limits
+(REQUEST_DELAY between API pages), the waits the async mode overlaps.
+
+Results go to a JSON file (--output) that --compare can diff against a run
+from another commit.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import copy
+import io
+import json
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+import assets
+import build_site
+import fetch_papers
+import generate_rss
+import paper_model
+from arxiv_atom import iter_arxiv_entries
+from http_cache import build_response
+from http_fixtures import HttpFixtures
+from paper_model import PaperCorpus, compact_corpus
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = ROOT / ".cache" / "benchmarks"
+BENCHMARK_VERSION = 1
+DEFAULT_SIZES = (1000, 10000, 100000)
+FIGURE_PAGES = 20                 # HTML pages parsed per size (their download is network-bound)
+NEW_FRACTION = 0.10               # share of the corpus that is new in the merge stage
+UPDATED_FRACTION = 0.05           # share of stored papers that come back with a new version
+SEED = 2024
+
+WORDS = (
+    "neural scene representation rendering real-time novel view synthesis sparse dense "
+    "efficient robust large-scale outdoor indoor geometry appearance lighting reflection "
+    "compression anisotropic primitives optimization densification pruning training "
+    "quality benchmark dataset camera pose depth surface mesh texture semantic feature "
+    "editing generation diffusion video frames multi-view consistency fidelity memory"
+).split()
+TOPICS = (
+    "dynamic scenes", "deformable objects", "SLAM", "visual odometry", "human avatars",
+    "animatable heads", "autonomous driving", "urban scenes with lidar", "medical imaging",
+    "surgical endoscopy", "text-to-3D generation", "compression", "anti-aliasing",
+    "relighting", "language fields", "robot manipulation", "satellite imagery",
+)
+FIRST_NAMES = ("Wei", "Anna", "José", "Yuki", "Lukas", "Priya", "Chen", "Marta", "Omar", "Zoë")
+LAST_NAMES = ("Zhang", "Müller", "García", "Tanaka", "Kowalski", "Nguyen", "Rossi", "Li", "Smith", "Øvergaard")
+AFFILIATIONS = ("ETH Zürich", "Tsinghua University", "MIT", "Max Planck Institute", "University of Tokyo")
+CATEGORIES = ("cs.CV", "cs.GR", "cs.RO", "cs.LG", "eess.IV")
+
+
+def synth_papers(n: int, seed: int = SEED) -> list[dict]:
+    """n arXiv entries (as parse_entry returns them), newest first, ~85% relevant."""
+    rng = random.Random(seed)
+    newest = datetime(2026, 9, 30, 18, 0, tzinfo=timezone.utc)
+    span = (newest - datetime(2023, 1, 2, tzinfo=timezone.utc)).total_seconds()
+    papers = []
+    for i in range(n):
+        published = newest - timedelta(seconds=span * i / max(n, 1))
+        method = "3D Gaussian Splatting" if rng.random() < 0.85 else "neural radiance fields"
+        topic = rng.choice(TOPICS)
+        words = " ".join(rng.choices(WORDS, k=rng.randint(110, 190)))
+        title = f"{rng.choice(WORDS).capitalize()} {method} for {topic}"
+        authors = [f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}" for _ in range(rng.randint(2, 9))]
+        pid = f"{published:%y%m}.{10000 + i % 90000:05d}"
+        papers.append({
+            "id": pid,
+            "title": title,
+            "authors": authors,
+            "affiliations": sorted(set(rng.choices(AFFILIATIONS, k=2))),
+            "abstract": f"We present a method based on {method} for {topic}. {words}.",
+            "published": published.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "updated": (published + timedelta(days=rng.randint(0, 30))).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "categories": sorted(set(rng.choices(CATEGORIES, k=2))),
+            "pdf_url": f"https://arxiv.org/pdf/{pid}v1",
+        })
+    return papers
+
+
+def atom_feed(papers: list[dict]) -> bytes:
+    """Serialize entries the way the arXiv API does (Atom + arxiv: extensions)."""
+    out = ['<?xml version="1.0" encoding="UTF-8"?>\n<feed xmlns="http://www.w3.org/2005/Atom" '
+           'xmlns:arxiv="http://arxiv.org/schemas/atom"><title>ArXiv Query</title>']
+    for p in papers:
+        out.append(f"<entry><id>http://arxiv.org/abs/{p['id']}v1</id>"
+                   f"<updated>{p['updated']}</updated><published>{p['published']}</published>"
+                   f"<title>{escape(p['title'])}</title><summary>{escape(p['abstract'])}</summary>")
+        for name in p["authors"]:
+            out.append(f"<author><name>{escape(name)}</name></author>")
+        out.append(f'<link href="http://arxiv.org/abs/{p["id"]}v1" rel="alternate" type="text/html"/>'
+                   f'<link title="pdf" href="{p["pdf_url"]}" rel="related" type="application/pdf"/>')
+        for cat in p["categories"]:
+            out.append(f'<category term="{cat}" scheme="http://arxiv.org/schemas/atom"/>')
+        out.append("</entry>")
+    out.append("</feed>")
+    return "".join(out).encode("utf-8")
+
+
+def figure_page(pid: str, rng: random.Random) -> str:
+    """An arXiv-HTML-like paper: several figures, one pipeline figure, bulky MathML."""
+    math = "<math><mi>x</mi><mo>+</mo><msub><mi>y</mi><mn>1</mn></msub></math>" * 400
+    method_fig = rng.randint(1, 6)
+    parts = [f"<html><head><title>{pid}</title></head><body><img src='/static/arxiv-logo.svg'/>"]
+    for k in range(1, 8):
+        caption = "Overview of our pipeline architecture." if k == method_fig else f"Qualitative results on scene {k}."
+        parts.append(f'<figure class="ltx_figure" id="S{k}.F{k}"><img src="x{k}.png" alt="Refer to caption" '
+                     f'class="ltx_graphics" width="598" height="300"/><figcaption class="ltx_caption">'
+                     f'<span class="ltx_tag">Figure {k}: </span>{caption}</figcaption></figure>')
+        parts.append(f"<section><p>{' '.join(rng.choices(WORDS, k=300))}</p><p>{math}</p></section>")
+    parts.append("</body></html>")
+    return "".join(parts)
+
+
+def measure_model(papers: list[dict]) -> dict:
+    """Memory and serialized size of the corpus as dicts vs as a PaperCorpus."""
+    text = json.dumps(papers, ensure_ascii=False)
+    tracemalloc.start()
+    dicts = json.loads(text)
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    tracemalloc.start()
+    corpus = PaperCorpus.from_dicts(json.loads(text))
+    model_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    if corpus.to_dicts() != dicts:
+        print("  warning: PaperCorpus round trip changed the papers")
+    compact = json.dumps(corpus.to_compact(), ensure_ascii=False, separators=(",", ":"))
+    return {
+        "dict_bytes": dict_bytes,
+        "model_bytes": model_bytes,
+        "json_bytes": len(json.dumps(papers, ensure_ascii=False, separators=(",", ":")).encode("utf-8")),
+        "compact_json_bytes": len(compact.encode("utf-8")),
+    }
+
+
+def timed(fn, setup=None, repeat: int = 1) -> tuple[float, object]:
+    """Best wall time over `repeat` runs of fn(setup()); returns (seconds, last result)."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        result = fn(arg) if setup else fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def measure_build_memory(clean_dist) -> dict:
+    """Traced peak of build_site.build on a loaded corpus, as dicts vs as a PaperCorpus.
+
+    Brotli is off: it takes the time, not the memory.
+    """
+    peaks = {}
+    for name, threshold in (("dict", float("inf")), ("compact", 0)):
+        clean_dist()
+        with patched(paper_model, COMPACT_MIN_PAPERS=threshold), patched(assets, _BROTLI=False):
+            tracemalloc.start()
+            data = compact_corpus(build_site.load_papers())
+            tracemalloc.reset_peak()
+            build_site.build(data)
+            peaks[f"{name}_peak_bytes"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            del data
+    return peaks
+
+
+def point_pipeline_at(data_dir: Path, dist_dir: Path) -> None:
+    """Redirect every module's data and dist paths into the scratch directory."""
+    fetch_papers.DATA_DIR = data_dir
+    fetch_papers.HARVEST_STATE_JSON = data_dir / "harvest_state.json"
+    fetch_papers.AUTHOR_INDEX_JSON = data_dir / "author_index.json"
+    fetch_papers._PAPER_STORE = None
+    build_site.DATA_DIR = generate_rss.DATA_DIR = data_dir
+    build_site.DIST_DIR = generate_rss.DIST_DIR = dist_dir
+    generate_rss.RSS_FILE = dist_dir / "feed.xml"
+
+
+@contextlib.contextmanager
+def patched(module, **values):
+    """Temporarily override module-level settings."""
+    saved = {name: getattr(module, name) for name in values}
+    for name, value in values.items():
+        setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(module, name, value)
+
+
+def use_fixtures(fixture_dir: Path | None) -> None:
+    fetch_papers.HTTP_FIXTURES = "replay" if fixture_dir else ""
+    fetch_papers.HTTP_FIXTURE_DIR = fixture_dir or fetch_papers.HTTP_FIXTURE_DIR
+    fetch_papers._HTTP_FIXTURES = None
+
+
+def bench_size(n: int, workdir: Path, repeat: int) -> dict[str, dict]:
+    stages: dict[str, dict] = {}
+
+    def record(name: str, seconds: float, items: int) -> None:
+        stages[name] = {"seconds": round(seconds, 6), "items": items,
+                        "per_sec": round(items / seconds, 1) if seconds else None}
+
+    entries = synth_papers(n)
+    feed = atom_feed(entries)
+    seconds, parsed = timed(lambda: list(iter_arxiv_entries(io.BytesIO(feed))), repeat=repeat)
+    record("parse", seconds, len(parsed))
+
+    seconds, relevant = timed(
+        lambda: [e for e in parsed if fetch_papers.is_relevant(e["title"], e["abstract"])], repeat=repeat)
+    record("filter", seconds, len(parsed))
+
+    classifier = fetch_papers.get_classifier()
+    seconds, _ = timed(lambda: classifier.classify_many(relevant), repeat=repeat)
+    record("tag", seconds, len(relevant))
+
+    for paper in relevant:
+        paper["abs_url"] = f"https://arxiv.org/abs/{paper['id']}"
+        paper["tags"] = []
+    cut = int(len(relevant) * NEW_FRACTION)
+    stored = fetch_papers.merge_papers([], copy.deepcopy(relevant[cut:])).papers
+    updates = copy.deepcopy(stored[::int(1 / UPDATED_FRACTION)])
+    for paper in updates:
+        paper["title"] += " (v2)"
+        paper["updated"] = "2026-10-01T00:00:00Z"
+
+    def merge_setup():
+        return copy.deepcopy(stored), copy.deepcopy(relevant[:cut]) + copy.deepcopy(updates)
+
+    seconds, result = timed(lambda args: fetch_papers.merge_papers(*args), setup=merge_setup, repeat=repeat)
+    merged = result.papers
+    record("merge", seconds, cut + len(updates))
+    seconds, _ = timed(lambda: PaperCorpus.from_dicts(merged), repeat=repeat)
+    record("model", seconds, len(merged))
+    stages["model"].update(measure_model(merged))
+
+    fixture_dir = workdir / "fixtures"
+    fixtures = HttpFixtures(fixture_dir, "record")
+    rng = random.Random(SEED)
+    html_urls = [f"https://arxiv.org/html/{p['id']}v1" for p in merged[:FIGURE_PAGES]]
+    for url in html_urls:
+        body = figure_page(url.rsplit("/", 1)[-1], rng).encode("utf-8")
+        fixtures.record(url, None, build_response(url, 200, body, {"Content-Type": "text/html; charset=utf-8"}, "utf-8"))
+    use_fixtures(fixture_dir)
+    seconds, found = timed(
+        lambda: sum(1 for url in html_urls if fetch_papers.extract_method_figure(url)[0]), repeat=repeat)
+    record("figures", seconds, len(html_urls))
+    if found != len(html_urls):
+        print(f"  warning: method figure found on {found}/{len(html_urls)} pages")
+    # Full-page stream scan vs the BeautifulSoup reference: same picks, compared timings
+    picks = {}
+    for parser, stop_score, stage in (("stream", None, "figures_full"), ("soup", None, "figures_soup")):
+        if parser == "soup" and fetch_papers.get_beautifulsoup() is None:
+            continue
+        with patched(fetch_papers, FIGURE_PARSER=parser, FIGURE_EARLY_STOP_SCORE=stop_score):
+            seconds, picks[stage] = timed(
+                lambda: [fetch_papers.extract_method_figure(url) for url in html_urls], repeat=repeat)
+        record(stage, seconds, len(html_urls))
+    if len(picks) == 2 and picks["figures_full"] != picks["figures_soup"]:
+        print("  warning: stream and soup figure parsers disagree")
+    use_fixtures(None)
+
+    def fresh_dirs(_=None):
+        data_dir, dist_dir = workdir / "data", workdir / "dist"
+        shutil.rmtree(data_dir, ignore_errors=True)
+        shutil.rmtree(dist_dir, ignore_errors=True)
+        point_pipeline_at(data_dir, dist_dir)
+
+    def save(_):
+        fetch_papers.save_papers(merged)
+        fetch_papers.get_paper_store().close()
+
+    seconds, _ = timed(save, setup=fresh_dirs, repeat=repeat)
+    record("save", seconds, len(merged))
+
+    def clean_dist(_=None):
+        shutil.rmtree(workdir / "dist", ignore_errors=True)
+
+    seconds, _ = timed(lambda _: build_site.build(), setup=clean_dist, repeat=repeat)
+    record("build", seconds, len(merged))
+    seconds, _ = timed(build_site.build, repeat=repeat)
+    record("build_noop", seconds, len(merged))
+    seconds, _ = timed(generate_rss.generate_rss, repeat=1)
+    record("rss", seconds, sum(len(feed.papers) for feed in generate_rss.collect_feeds(merged)))
+
+    with patched(paper_model, COMPACT_MIN_PAPERS=0):
+        seconds, _ = timed(lambda _: build_site.build(), setup=clean_dist, repeat=repeat)
+    record("build_compact", seconds, len(merged))
+    stages["build_compact"].update(measure_build_memory(clean_dist))
+    return stages
+
+
+def bench_replay(fixture_dir: Path, workdir: Path, latency: float = 0.0,
+                 flags: tuple[str, ...] = (), paced: bool = False) -> tuple[dict, list[dict]]:
+    """Replay a recorded fetch_papers run end to end (full re-sync, figures included).
+
+    Returns the timing and the papers the run saved.
+    """
+    shutil.rmtree(workdir / "data", ignore_errors=True)
+    point_pipeline_at(workdir / "data", workdir / "dist")
+    use_fixtures(fixture_dir)
+    try:
+        with patched(fetch_papers, HTTP_FIXTURE_LATENCY=latency, HTTP_FIXTURE_PACED=paced, _RATE_LIMITER=None):
+            start = time.perf_counter()
+            fetch_papers.main(["--full", *flags])
+            seconds = time.perf_counter() - start
+    finally:
+        use_fixtures(None)
+    store = fetch_papers.get_paper_store()
+    papers = store.load()["papers"]
+    fetch_papers.close_paper_store()
+    return {"seconds": round(seconds, 6), "items": len(papers), "latency": latency, "paced": paced}, papers
+
+
+def quiet(verbose: bool):
+    """Swallow the pipeline's progress output unless --verbose."""
+    return contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+
+
+def git_revision() -> dict:
+    def git(*args: str) -> str:
+        try:
+            return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return ""
+    return {"commit": git("rev-parse", "--short", "HEAD"), "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+
+def print_table(results: dict, baseline: dict | None) -> None:
+    base = {(r["papers"], name): s["seconds"] for r in (baseline or {}).get("runs", []) for name, s in r["stages"].items()}
+    for run in results["runs"]:
+        print(f"\n{run['papers']} papers")
+        for name, stage in run["stages"].items():
+            line = f"  {name:<12} {stage['seconds'] * 1000:10.1f} ms"
+            if stage.get("per_sec"):
+                line += f"  {stage['per_sec']:>12,.0f}/s"
+            old = base.get((run["papers"], name))
+            if old:
+                line += f"  ({stage['seconds'] / old:5.2f}x vs baseline)"
+            print(line)
+            if "model_bytes" in stage:
+                print(f"  {'':<12} memory {stage['dict_bytes'] / 2**20:.1f} MiB as dicts, "
+                      f"{stage['model_bytes'] / 2**20:.1f} MiB as records; JSON "
+                      f"{stage['json_bytes'] / 2**20:.1f} MiB, compact {stage['compact_json_bytes'] / 2**20:.1f} MiB")
+            if "compact_peak_bytes" in stage:
+                print(f"  {'':<12} build peak {stage['dict_peak_bytes'] / 2**20:.1f} MiB with dicts, "
+                      f"{stage['compact_peak_bytes'] / 2**20:.1f} MiB with records")
+    if "fetch_replay" in results:
+        print()
+        for name in ("fetch_replay", "fetch_replay_async"):
+            r = results[name]
+            print(f"{name:<19} {r['seconds'] * 1000:10.1f} ms  ({r['items']} papers, "
+                  f"{r['latency'] * 1000:.0f} ms per replayed response"
+                  f"{', rate limited' if r.get('paced') else ''})")
+        speedup = results["fetch_replay"]["seconds"] / results["fetch_replay_async"]["seconds"]
+        print(f"{'':<19} async mode: {speedup:.2f}x the sequential speed")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the pipeline stages on synthetic corpora.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="corpus sizes")
+    parser.add_argument("--repeat", type=int, default=1, help="runs per stage; the best time is kept")
+    parser.add_argument("--fixtures", type=Path, help="also replay a recorded fetch run from this directory")
+    parser.add_argument("--replay-latency", type=float, default=0.0,
+                        help="seconds added to each replayed response (with --fixtures)")
+    parser.add_argument("--replay-paced", action="store_true",
+                        help="apply the live per-host rate limits to replayed requests (with --fixtures)")
+    parser.add_argument("--output", type=Path, help="results JSON (default: .cache/benchmarks/<commit>.json)")
+    parser.add_argument("--compare", type=Path, help="baseline results JSON to compare against")
+    parser.add_argument("--verbose", action="store_true", help="show the pipeline's own progress output")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+    revision = git_revision()
+    results = {
+        "version": BENCHMARK_VERSION,
+        **revision,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "paper_store": fetch_papers.PAPER_STORE,
+        "runs": [],
+    }
+    # Lift the corpus cap so every size is measured in full
+    fetch_papers.MAX_PAPERS = 0
+    fetch_papers.FETCH_METHOD_FIGURES = True
+
+    with tempfile.TemporaryDirectory(prefix="gs-bench-") as tmp:
+        workdir = Path(tmp)
+        for n in args.sizes:
+            print(f"Benchmarking {n} papers...", file=sys.stderr)
+            with quiet(args.verbose):
+                stages = bench_size(n, workdir, args.repeat)
+            results["runs"].append({"papers": n, "stages": stages})
+        if args.fixtures:
+            print(f"Replaying recorded run from {args.fixtures}...", file=sys.stderr)
+            with quiet(args.verbose):
+                results["fetch_replay"], papers = bench_replay(
+                    args.fixtures, workdir, args.replay_latency, paced=args.replay_paced)
+                results["fetch_replay_async"], async_papers = bench_replay(
+                    args.fixtures, workdir, args.replay_latency, ("--async",), args.replay_paced)
+            if async_papers != papers:
+                print("  warning: sequential and async replays saved different papers", file=sys.stderr)
+
+    output = args.output or RESULTS_DIR / f"{revision['commit'] or 'unknown'}{'-dirty' if revision['dirty'] else ''}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    baseline = json.loads(args.compare.read_text(encoding="utf-8")) if args.compare else None
+    print_table(results, baseline)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
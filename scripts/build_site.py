@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Build static site from papers.json + HTML template.
+Build static site from the paper store (papers.json by default) + HTML template.
 Outputs to dist/ directory.
 """
 
@@ -8,12 +8,25 @@ import json
 import shutil
 from pathlib import Path
 
+from assets import BROTLI_BULK_QUALITY, BuildState, source_version, summarize, write_manifest
+from author_index import AUTHOR_INDEX_VERSION, load_author_index
+from instrumentation import get_report, run_report
+from paper_model import compact_corpus
+from paper_store import open_store
+from search_index import SEARCH_INDEX_VERSION, build_search_index
+
 ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = ROOT / "data"
 SRC_DIR = ROOT / "src"
 DIST_DIR = ROOT / "dist"
-PAPERS_JSON = DATA_DIR / "papers.json"
 TEMPLATE_FILE = SRC_DIR / "templates" / "index.html"
+SCRIPTS_DIR = ROOT / "scripts"
+BUILD_SOURCES = ("build_site.py", "assets.py", "search_index.py", "author_index.py", "paper_model.py")  # hashed into the build state
+
+# Card index: only what createPaperCard / filters need; the rest lives in shards
+CARD_ABSTRACT_CHARS = 320         # preview length (cards clamp to 3 lines)
+CARD_MAX_AUTHORS = 5              # cards show "A, B, C, D, E et al."
+INTERNAL_FIELDS = ("fingerprint", "tag_rules_version")  # pipeline bookkeeping, not shipped
 
 
 def read_text_with_fallback(path: Path) -> str:
@@ -28,60 +41,197 @@ def read_text_with_fallback(path: Path) -> str:
 
 
 def load_papers() -> dict:
-    """Load papers data from JSON file with encoding fallback."""
-    for enc in ("utf-8", "utf-8-sig", "cp1252"):
-        try:
-            with open(PAPERS_JSON, "r", encoding=enc) as f:
-                return json.load(f)
-        except UnicodeDecodeError:
-            continue
-    with open(PAPERS_JSON, "r", encoding="utf-8", errors="replace") as f:
-        return json.load(f)
-
-
-def build():
+    """Load papers data from the configured paper store."""
+    store = open_store(data_dir=DATA_DIR)
+    try:
+        return store.load()
+    finally:
+        store.close()
+
+
+def papers_revision() -> str:
+    """Token that changes whenever the stored corpus changes."""
+    store = open_store(data_dir=DATA_DIR)
+    try:
+        return store.revision()
+    finally:
+        store.close()
+
+
+def shard_key(paper: dict) -> str:
+    """Detail shard for a paper: its publication month (YYYY-MM)."""
+    published = paper.get("published") or ""
+    return published[:7] if len(published) >= 7 else "undated"
+
+
+def make_card(paper: dict) -> dict:
+    """Compact card record for the inline index."""
+    authors = paper.get("authors", [])
+    abstract = paper.get("abstract", "")
+    if len(abstract) > CARD_ABSTRACT_CHARS:
+        abstract = abstract[:CARD_ABSTRACT_CHARS].rsplit(" ", 1)[0] + "..."
+    card = {
+        "id": paper.get("id", ""),
+        "title": paper.get("title", ""),
+        "authors": authors[:CARD_MAX_AUTHORS],
+        "published": paper.get("published", ""),
+        "abstract": abstract,
+        "tags": paper.get("tags", []),
+        "pdf_url": paper.get("pdf_url", ""),
+        "shard": shard_key(paper),
+    }
+    if len(authors) > CARD_MAX_AUTHORS:
+        card["et_al"] = True
+    if paper.get("method_fig_url"):
+        card["method_fig_url"] = paper["method_fig_url"]
+    return card
+
+
+def make_detail(paper: dict) -> dict:
+    """Full record served from a detail shard (opened in the modal)."""
+    return {k: v for k, v in paper.items() if k not in INTERNAL_FIELDS}
+
+
+def split_shards(papers: list[dict]) -> dict[str, dict[str, dict]]:
+    """Group detail records by shard key, preserving paper order."""
+    shards: dict[str, dict[str, dict]] = {}
+    for paper in papers:
+        shards.setdefault(shard_key(paper), {})[paper.get("id", "")] = make_detail(paper)
+    return shards
+
+
+def format_size(num_bytes: int) -> str:
+    if num_bytes < 1024:
+        return f"{num_bytes} B"
+    if num_bytes < 1024 * 1024:
+        return f"{num_bytes / 1024:.1f} KiB"
+    return f"{num_bytes / (1024 * 1024):.1f} MiB"
+
+
+def build(data: dict | None = None):
+    """Build dist/; ``data`` is the corpus when the caller already loaded it."""
     print("=" * 60)
     print("Building static site")
     print("=" * 60)
 
-    # Clean and create dist directory
-    if DIST_DIR.exists():
+    report = get_report()
+    state = BuildState(DIST_DIR, "site")
+    if not state.has_previous and DIST_DIR.exists():
+        # No build state to tell our outputs apart from leftovers: start clean
         shutil.rmtree(DIST_DIR)
-    DIST_DIR.mkdir(parents=True)
+    DIST_DIR.mkdir(parents=True, exist_ok=True)
+
+    with report.stage("inputs"):
+        static_files: list[Path] = []
+        for sub in ("css", "js"):
+            src = SRC_DIR / sub
+            if src.exists():
+                static_files.extend(sorted(p for p in src.rglob("*") if p.is_file()))
+
+        state.add_input("papers", papers_revision().encode("utf-8"))
+        state.add_input("template", TEMPLATE_FILE.read_bytes())
+        for path in static_files:
+            state.add_input(path.relative_to(SRC_DIR).as_posix(), path.read_bytes())
+        state.inputs["build_version"] = source_version(*(SCRIPTS_DIR / name for name in BUILD_SOURCES))
+    if state.is_fresh():
+        report.count("build.skipped_fresh")
+        print("  Inputs unchanged since the last build; dist/ is up to date.")
+        return
+
+    manifest: dict[str, dict] = {}
+
+    # Static assets get content-hashed names so they can be cached forever
+    asset_urls: dict[str, str] = {}
+    with report.stage("assets"):
+        for path in static_files:
+            rel = path.relative_to(SRC_DIR)
+            logical = rel.as_posix()
+            asset_urls[logical], entry = state.write_asset(rel.parent.as_posix(), path.name, path.read_bytes())
+            manifest[logical] = {"file": asset_urls[logical], **entry}
+    print(f"  Hashed {len(static_files)} static assets (css/, js/)")
 
     # Load data
-    data = load_papers()
-    papers_json_str = json.dumps(data, ensure_ascii=False)
+    with report.stage("load"):
+        if data is None:
+            data = load_papers()
+        data = compact_corpus(data)
+        papers = data.get("papers", [])
     print(f"  Loaded {data['total_count']} papers")
 
-    # Read HTML template
-    template = read_text_with_fallback(TEMPLATE_FILE)
-
-    # Inject papers data into template
-    html = template.replace("/* __PAPERS_DATA_PLACEHOLDER__ */", f"const PAPERS_DATA = {papers_json_str};")
-
-    # Write index.html
-    (DIST_DIR / "index.html").write_text(html, encoding="utf-8")
-    print("  Generated dist/index.html")
-
-    # Copy static assets
-    css_src = SRC_DIR / "css"
-    js_src = SRC_DIR / "js"
-
-    if css_src.exists():
-        shutil.copytree(css_src, DIST_DIR / "css")
-        print("  Copied css/")
-
-    if js_src.exists():
-        shutil.copytree(js_src, DIST_DIR / "js")
-        print("  Copied js/")
-
-    # Also copy papers.json to dist for potential lazy-loading
-    shutil.copy2(PAPERS_JSON, DIST_DIR / "papers.json")
-    print("  Copied papers.json")
+    # Write per-month detail shards, fetched on demand by the modal
+    shard_urls: dict[str, str] = {}
+    shard_bytes = 0
+    with report.stage("shards"):
+        for key, details in split_shards(papers).items():
+            payload = json.dumps(details, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            shard_urls[key], entry = state.write_asset("data", f"papers-{key}.json", payload,
+                                                           quality=BROTLI_BULK_QUALITY)
+            manifest[f"data/papers-{key}.json"] = {"file": shard_urls[key], **entry}
+            shard_bytes += len(payload)
+    print(f"  Wrote {len(shard_urls)} detail shards to dist/data/ ({format_size(shard_bytes)} total)")
+
+    # Inverted search index over the same ordering as the card index
+    with report.stage("search_index"):
+        search_index = build_search_index(papers)
+        search_payload = json.dumps(search_index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        search_index_url, entry = state.write_asset("data", "search-index.json", search_payload)
+        manifest["data/search-index.json"] = {"file": search_index_url, **entry}
+    print(f"  Search index v{SEARCH_INDEX_VERSION}: {len(search_index['terms'])} terms "
+          f"({format_size(len(search_payload))})")
+
+    # Author / affiliation postings for facets, maintained by fetch_papers
+    with report.stage("author_index"):
+        author_index = load_author_index(DATA_DIR / "author_index.json")
+        rebuilt = author_index.ensure(papers)
+        people = author_index.site_index(papers)
+        people_payload = json.dumps(people, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        author_index_url, entry = state.write_asset("data", "author-index.json", people_payload)
+        manifest["data/author-index.json"] = {"file": author_index_url, **entry}
+    print(f"  Author index v{AUTHOR_INDEX_VERSION}: {len(people['authors']['keys'])} authors, "
+          f"{len(people['affiliations']['keys'])} affiliations ({format_size(len(people_payload))})"
+          f"{'; rebuilt from the papers' if rebuilt else ''}")
+
+    with report.stage("index_html"):
+        # Compact card index, inlined so the first paint needs no extra request
+        index = {
+            "last_updated": data.get("last_updated", ""),
+            "total_count": data.get("total_count", len(papers)),
+            "shards": shard_urls,
+            "search_index": search_index_url,
+            "author_index": author_index_url,
+            "papers": [make_card(p) for p in papers],
+        }
+        # "</" is escaped so a title can never close the inline <script> early
+        index_json_str = json.dumps(index, ensure_ascii=False, separators=(",", ":")).replace("</", "<\\/")
+        print(f"  Card index: {len(index['papers'])} cards ({format_size(len(index_json_str.encode('utf-8')))})")
+
+        # Read HTML template
+        template = read_text_with_fallback(TEMPLATE_FILE)
+
+        # Inject card index into template and point it at the hashed assets
+        html = template.replace("/* __PAPERS_DATA_PLACEHOLDER__ */", f"const PAPERS_DATA = {index_json_str};")
+        for logical, hashed in asset_urls.items():
+            html = html.replace(f'"{logical}"', f'"{hashed}"')
+
+        # Write index.html (stable name; it is the entry point)
+        _, entry = state.write_asset("", "index.html", html.encode("utf-8"), hashed=False)
+        manifest["index.html"] = {"file": "index.html", **entry}
+    print(f"  Generated dist/index.html ({format_size(entry['bytes'])})")
+
+    write_manifest(DIST_DIR, "site", manifest)
+    print(f"  Asset manifest: {summarize(manifest)}")
+
+    state.remove_stale()
+    state.save()
+    report.count("outputs.written", state.written)
+    report.count("outputs.unchanged", state.unchanged)
+    report.count("outputs.removed", state.removed)
+    report.count("outputs.bytes", sum(e.get("bytes", 0) for e in manifest.values()))
+    print(f"  Outputs: {state.summary()}")
 
     print("\nBuild complete! Output in dist/")
 
 
 if __name__ == "__main__":
-    build()
+    with run_report("build_site"):
+        build()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Feed engine for generate_rss.
+
+One pass over the newest-first papers fills a bounded global bucket and one
+bucket per tag at the same time. Each bucket is written as RSS 2.0, Atom 1.0
+and JSON Feed 1.1. The XML is streamed through xml.sax's XMLGenerator, so no
+element tree is built. ``items_digest`` identifies a feed's item set, so
+generate_rss can skip feeds whose items did not change.
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import re
+from datetime import datetime
+from email.utils import format_datetime
+from typing import Iterable
+from xml.sax.saxutils import XMLGenerator
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+JSON_FEED_VERSION = "https://jsonfeed.org/version/1.1"
+SUMMARY_CHARS = 500       # abstracts are truncated to this length
+FEED_AUTHORS = 5          # authors listed per item
+SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+class Feed:
+    """One bounded feed: the global one (tag None) or one tag's."""
+
+    __slots__ = ("key", "tag", "title", "description", "cap", "papers", "files")
+
+    def __init__(self, key: str, title: str, description: str, cap: int, tag: str | None = None):
+        self.key = key
+        self.tag = tag
+        self.title = title
+        self.description = description
+        self.cap = cap
+        self.papers: list[dict] = []
+        self.files: dict[str, str] = {}  # format ("rss", "atom", "json") -> path under dist/
+
+
+def tag_slug(tag: str) -> str:
+    """File-name form of a tag ("Autonomous Driving" -> "autonomous-driving")."""
+    return SLUG_RE.sub("-", tag.lower()).strip("-") or "tag"
+
+
+def fill_feeds(papers: Iterable[dict], everything: Feed, make_tag_feed) -> dict[str, Feed]:
+    """Fill the global feed and per-tag feeds in one pass over newest-first papers.
+
+    ``make_tag_feed(tag)`` creates the feed of a tag the first time it is
+    seen. Returns the tag feeds by tag.
+    """
+    by_tag: dict[str, Feed] = {}
+    cap = everything.cap
+    for paper in papers:
+        if len(everything.papers) < cap:
+            everything.papers.append(paper)
+        for tag in paper.get("tags") or ():
+            feed = by_tag.get(tag)
+            if feed is None:
+                feed = by_tag[tag] = make_tag_feed(tag)
+            if len(feed.papers) < feed.cap:
+                feed.papers.append(paper)
+    return by_tag
+
+
+def items_digest(feed: Feed, salt: str = "") -> str:
+    """Hash of everything the feed's items render from (plus the feed title and ``salt``)."""
+    h = hashlib.sha256(f"{salt}\0{feed.title}\0{feed.description}".encode("utf-8"))
+    for paper in feed.papers:
+        h.update(json.dumps([
+            paper.get("id", ""), paper.get("title", ""), paper.get("abs_url", ""),
+            paper.get("abstract", ""), paper.get("published", ""), paper.get("updated", ""),
+            paper.get("tags", []), paper.get("authors", [])[:FEED_AUTHORS + 1],
+        ], ensure_ascii=False).encode("utf-8"))
+    return h.hexdigest()
+
+
+def iso_to_rfc822(iso_str: str) -> str:
+    """Convert ISO 8601 datetime string to RFC 822 format for RSS."""
+    try:
+        dt = datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
+        return format_datetime(dt)
+    except (ValueError, AttributeError):
+        return ""
+
+
+def summary(paper: dict) -> str:
+    abstract = paper.get("abstract", "")
+    if len(abstract) > SUMMARY_CHARS:
+        abstract = abstract[:SUMMARY_CHARS - 3] + "..."
+    return abstract
+
+
+def feed_updated(feed: Feed, fallback: str) -> str:
+    """Newest item timestamp (ISO 8601), so unchanged items give unchanged bytes."""
+    stamps = [p.get("updated") or p.get("published", "") for p in feed.papers]
+    return max(stamps, default="") or fallback
+
+
+class XmlStream:
+    """Element-level helper over XMLGenerator, writing UTF-8 into a buffer."""
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+        self._gen = XMLGenerator(self.buffer, encoding="utf-8", short_empty_elements=True)
+        self._gen.startDocument()
+
+    def start(self, tag: str, attrs: dict[str, str] | None = None) -> None:
+        self._gen.startElement(tag, attrs or {})
+
+    def end(self, tag: str) -> None:
+        self._gen.endElement(tag)
+
+    def element(self, tag: str, text: str = "", attrs: dict[str, str] | None = None) -> None:
+        self._gen.startElement(tag, attrs or {})
+        if text:
+            self._gen.characters(text)
+        self._gen.endElement(tag)
+
+    def getvalue(self) -> bytes:
+        self._gen.endDocument()
+        return self.buffer.getvalue()
+
+
+def render_rss(feed: Feed, site_url: str, last_updated: str) -> bytes:
+    out = XmlStream()
+    out.start("rss", {"version": "2.0", "xmlns:atom": ATOM_NS})
+    out.start("channel")
+    out.element("title", feed.title)
+    out.element("link", site_url)
+    out.element("description", feed.description)
+    out.element("language", "en-us")
+    if last_updated:
+        out.element("lastBuildDate", iso_to_rfc822(last_updated))
+    out.element("atom:link", attrs={
+        "href": f"{site_url}/{feed.files['rss']}", "rel": "self", "type": "application/rss+xml"})
+    for paper in feed.papers:
+        out.start("item")
+        out.element("title", paper.get("title", ""))
+        out.element("link", paper.get("abs_url", ""))
+        out.element("guid", paper.get("abs_url", ""))
+        out.element("description", summary(paper))
+        pub_date = paper.get("published", "")
+        if pub_date:
+            out.element("pubDate", iso_to_rfc822(pub_date))
+        for tag in paper.get("tags", []):
+            out.element("category", tag)
+        authors = paper.get("authors", [])
+        if authors:
+            out.element("author", ", ".join(authors[:FEED_AUTHORS]))
+            if len(authors) > FEED_AUTHORS:
+                out.element("author", ", ".join(authors[:FEED_AUTHORS]) + " et al.")
+        out.end("item")
+    out.end("channel")
+    out.end("rss")
+    return out.getvalue()
+
+
+def render_atom(feed: Feed, site_url: str, last_updated: str) -> bytes:
+    self_url = f"{site_url}/{feed.files['atom']}"
+    out = XmlStream()
+    out.start("feed", {"xmlns": ATOM_NS})
+    out.element("title", feed.title)
+    out.element("subtitle", feed.description)
+    out.element("id", self_url)
+    out.element("updated", feed_updated(feed, last_updated))
+    out.element("link", attrs={"href": site_url, "rel": "alternate", "type": "text/html"})
+    out.element("link", attrs={"href": self_url, "rel": "self", "type": "application/atom+xml"})
+    for paper in feed.papers:
+        published = paper.get("published", "")
+        out.start("entry")
+        out.element("title", paper.get("title", ""))
+        out.element("id", paper.get("abs_url", ""))
+        out.element("link", attrs={"href": paper.get("abs_url", ""), "rel": "alternate"})
+        out.element("updated", paper.get("updated") or published)
+        if published:
+            out.element("published", published)
+        for name in paper.get("authors", [])[:FEED_AUTHORS]:
+            out.start("author")
+            out.element("name", name)
+            out.end("author")
+        for tag in paper.get("tags", []):
+            out.element("category", attrs={"term": tag})
+        out.element("summary", summary(paper))
+        out.end("entry")
+    out.end("feed")
+    return out.getvalue()
+
+
+def render_json(feed: Feed, site_url: str, last_updated: str) -> bytes:
+    items = []
+    for paper in feed.papers:
+        item = {
+            "id": paper.get("abs_url") or paper.get("id", ""),
+            "url": paper.get("abs_url", ""),
+            "title": paper.get("title", ""),
+            "content_text": summary(paper),
+        }
+        if paper.get("published"):
+            item["date_published"] = paper["published"]
+        if paper.get("updated"):
+            item["date_modified"] = paper["updated"]
+        if paper.get("tags"):
+            item["tags"] = paper["tags"]
+        if paper.get("authors"):
+            item["authors"] = [{"name": name} for name in paper["authors"][:FEED_AUTHORS]]
+        items.append(item)
+    document = {
+        "version": JSON_FEED_VERSION,
+        "title": feed.title,
+        "home_page_url": site_url,
+        "feed_url": f"{site_url}/{feed.files['json']}",
+        "description": feed.description,
+        "language": "en-US",
+        "items": items,
+    }
+    return json.dumps(document, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+RENDERERS = {"rss": render_rss, "atom": render_atom, "json": render_json}
@@ -5,22 +5,36 @@ Supports incremental updates - only new papers are appended.
 """
 from __future__ import annotations
 
+import argparse
+import codecs
+import hashlib
+import io
 import json
+import operator
 import os
 import re
+import sys
+import threading
 import time
-from datetime import datetime, timezone
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Iterator
+from xml.etree.ElementTree import ParseError
 from urllib.parse import urljoin, urlsplit, urlunsplit
 
-import feedparser
 import requests
-import urllib3
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-try:
-    from bs4 import BeautifulSoup
-except ImportError:  # Optional dependency for method figure extraction
-    BeautifulSoup = None
+
+from arxiv_atom import PARSER_VERSION, iter_arxiv_entries
+from arxiv_shards import DedupIndex, Shard, date_shards
+from author_index import AuthorIndex, load_author_index
+from http_cache import HttpCache
+from http_fixtures import FixtureMissingError, HttpFixtures
+from html_scan import FigureScanner, LinkScanner, iter_chunks
+from instrumentation import get_report, run_report
+from http_client import HostRateLimiter, SessionPool, parse_retry_after, url_host
+from paper_store import PAPER_STORE, PaperStore, open_store
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -37,19 +51,40 @@ SEARCH_QUERY = (
     'OR ti:"gaussian surfel" OR abs:"gaussian surfel" '
     'OR ti:"splatting" AND abs:"gaussian"'
 )
-MAX_RESULTS_PER_PAGE = 100
-MAX_TOTAL_RESULTS = 5000          # safety cap
+MAX_RESULTS_PER_PAGE = 100       # incremental runs usually need one page
+FULL_SYNC_RESULTS_PER_PAGE = 500  # --full re-syncs: fewer, larger pages (arXiv allows up to 2000)
+MAX_TOTAL_RESULTS = 5000          # safety cap (per shard with --sharded)
+HARVEST_SHARD_MONTHS = 3          # --sharded: submittedDate window per sub-query
+HARVEST_SHARD_WORKERS = 2         # --sharded: shards paging concurrently (requests still share the limiter)
+HARVEST_SHARD_RETRIES = 2         # --sharded: re-runs of a failed shard before giving up on it
 IS_GITHUB_ACTIONS = os.environ.get("GITHUB_ACTIONS") == "true"
-REQUEST_DELAY = 6  # seconds between API calls (arXiv rate limit safety)
+REQUEST_DELAY = 6  # seconds between API calls (arXiv rate limit safety), enforced by the rate limiter
+API_PREFETCH_PAGES = 1            # --full re-syncs: API pages requested ahead while one is parsed
+ASYNC_PAGE_QUEUE = 2              # --async: parsed API pages waiting to be merged
+ASYNC_FIGURE_QUEUE = 32           # --async: new papers waiting for a figure worker
+CHECKPOINT_INTERVAL = 30.0        # --async: seconds between background saves of the corpus so far
 REQUEST_TIMEOUT = (10, 90 if IS_GITHUB_ACTIONS else 60)  # connect, read
 MAX_RETRIES = 8 if IS_GITHUB_ACTIONS else 5
 RETRY_BACKOFF = 2.0
 RETRY_STATUS = {429, 500, 502, 503, 504}
 MAX_429_RETRIES = 8
-RATE_LIMIT_BACKOFF = 30  # base seconds for 429 backoff
+RATE_LIMIT_BACKOFF = 30  # base seconds for 429 backoff without Retry-After
+HTTP_POOL_MAXSIZE = 4             # keep-alive connections per host and route
+HTTP_CACHE_ENABLED = os.environ.get("HTTP_CACHE", "1") != "0"
+HTTP_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "http"
+HTTP_CACHE_TTL = 24 * 3600                  # serve abs/HTML pages without a request for a day
+HTTP_CACHE_NEGATIVE_TTL = 3 * 24 * 3600     # re-check 404s / "no HTML version" after three days
+HTTP_CACHE_MAX_BYTES = 256 * 1024 * 1024    # LRU-evict bodies beyond this
+HTTP_FIXTURES = os.environ.get("HTTP_FIXTURES", "")  # "record" or "replay" (offline runs, benchmarks)
+HTTP_FIXTURE_DIR = Path(os.environ.get(
+    "HTTP_FIXTURE_DIR", Path(__file__).resolve().parent.parent / ".cache" / "fixtures"))
+HTTP_FIXTURE_LATENCY = float(os.environ.get("HTTP_FIXTURE_LATENCY", "0"))  # replay: seconds per response
+HTTP_FIXTURE_PACED = os.environ.get("HTTP_FIXTURE_PACED") == "1"  # replay: wait for HOST_RATE_LIMITS like live runs
 USER_AGENT = "Awesome-Gaussian-Splatting/1.0 (+https://github.com/Devin100086/Awesome-Gaussian-Splatting)"
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
-PAPERS_JSON = DATA_DIR / "papers.json"
+HARVEST_STATE_JSON = DATA_DIR / "harvest_state.json"
+AUTHOR_INDEX_JSON = DATA_DIR / "author_index.json"  # author / affiliation postings (author_index.py)
+WATERMARK_OVERLAP_DAYS = 3        # re-check this many days below the watermark (late announcements)
 MIN_PUBLISHED_YEAR = 2023         # Only include papers after 2023
 REASSIGN_ALL_TAGS = True          # True = overwrite existing tags on every fetch
 MAX_PAPERS = 3000                 # Cap total papers; drop oldest beyond this
@@ -59,10 +94,17 @@ MAX_PAPERS = 3000                 # Cap total papers; drop oldest beyond this
 # ---------------------------------------------------------------------------
 FETCH_METHOD_FIGURES = True
 FIGURE_BACKFILL = False           # True to fill missing figures for all papers
-FIGURE_REQUEST_DELAY = 1          # seconds between figure requests
-MAX_FIGURE_FETCH =50             # safety cap per run
+FIGURE_WORKERS = 4                # concurrent papers in flight
+FIGURE_REQUESTS_PER_SEC = 2.0     # token-bucket rate for arxiv.org (abs + HTML pages)
+FIGURE_REQUEST_BURST = 4          # token-bucket burst size for arxiv.org
+MAX_FIGURE_FETCH = 150            # safety cap per run
 FORCE_REFRESH_FIGURES = False     # True to re-fetch figures even if URL exists
 CLEAR_BAD_FIGURES = True          # True to remove suspect figure URLs when refresh fails
+FIGURE_PARSER = "stream"          # "stream" (html.parser events, no DOM) or "soup" (BeautifulSoup)
+FIGURE_EARLY_STOP_SCORE = 4.0     # stream parser: stop at the first <figure> scoring this high
+                                  # ("Figure 1" + one keyword); None scans the whole page
+FIGURE_STREAM_MAX_BYTES = 4 * 1024 * 1024  # stream parser: hang up after this much HTML (0 = no cap)
+FIGURE_STREAM_CHUNK = 16 * 1024   # bytes per read while streaming an HTML page
 METHOD_FIGURE_KEYWORDS = [
     "method", "architecture", "pipeline", "framework", "overview",
     "system", "approach", "model", "network",
@@ -170,58 +212,202 @@ ARXIV_DUPLICATE_HTML_SEGMENT_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Per-host token buckets applied to every request made through http_get
+# (rate per second, burst); a "*" entry would cap all hosts together
+HOST_RATE_LIMITS: dict[str, tuple[float, int]] = {
+    url_host(ARXIV_API_URL): (1.0 / REQUEST_DELAY, 1),
+    "arxiv.org": (FIGURE_REQUESTS_PER_SEC, FIGURE_REQUEST_BURST),
+}
 
-def http_get(url: str, params: dict | None = None) -> requests.Response:
-    """HTTP GET with proxy fallback and retries for rate limits/timeouts."""
-    backoff = RETRY_BACKOFF
-    last_exc: Exception | None = None
 
-    for attempt in range(1, MAX_RETRIES + 1):
+_SESSION_POOL: SessionPool | None = None
+_RATE_LIMITER: HostRateLimiter | None = None
+_HTTP_CACHE: HttpCache | None = None
+_HTTP_FIXTURES: HttpFixtures | None = None
+_BEAUTIFULSOUP = None  # bs4.BeautifulSoup once imported, False when bs4 is missing
+
+
+def get_beautifulsoup():
+    """Return bs4.BeautifulSoup, imported on first use; None when bs4 is not installed.
+
+    Only the "soup" figure parser needs it, so other runs never import bs4.
+    """
+    global _BEAUTIFULSOUP
+    if _BEAUTIFULSOUP is None:
+        try:
+            from bs4 import BeautifulSoup
+        except ImportError:  # Optional dependency
+            BeautifulSoup = False
+        _BEAUTIFULSOUP = BeautifulSoup
+    return _BEAUTIFULSOUP or None
+
+
+def get_session_pool() -> SessionPool:
+    """Return the shared keep-alive session pool, creating it on first use."""
+    global _SESSION_POOL
+    if _SESSION_POOL is None:
+        _SESSION_POOL = SessionPool(USER_AGENT, pool_maxsize=HTTP_POOL_MAXSIZE)
+    return _SESSION_POOL
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Return the shared per-host rate limiter, creating it on first use."""
+    global _RATE_LIMITER
+    if _RATE_LIMITER is None:
+        _RATE_LIMITER = HostRateLimiter(HOST_RATE_LIMITS)
+    return _RATE_LIMITER
+
+
+def get_http_cache() -> HttpCache | None:
+    """Return the shared on-disk response cache, or None when HTTP_CACHE=0."""
+    global _HTTP_CACHE
+    if _HTTP_CACHE is None and HTTP_CACHE_ENABLED:
+        _HTTP_CACHE = HttpCache(HTTP_CACHE_DIR, HTTP_CACHE_TTL, HTTP_CACHE_NEGATIVE_TTL, HTTP_CACHE_MAX_BYTES)
+    return _HTTP_CACHE
+
+
+def get_http_fixtures() -> HttpFixtures | None:
+    """Return the record/replay fixture store when HTTP_FIXTURES is set."""
+    global _HTTP_FIXTURES
+    if _HTTP_FIXTURES is None and HTTP_FIXTURES:
+        _HTTP_FIXTURES = HttpFixtures(HTTP_FIXTURE_DIR, HTTP_FIXTURES, HTTP_FIXTURE_LATENCY)
+    return _HTTP_FIXTURES
+
+
+def is_replaying() -> bool:
+    fixtures = get_http_fixtures()
+    return fixtures is not None and fixtures.replaying
+
+
+def close_http_fixtures() -> None:
+    global _HTTP_FIXTURES
+    if _HTTP_FIXTURES is not None:
+        print(f"  HTTP fixtures: {_HTTP_FIXTURES.summary()}")
+        get_report().count(f"http_fixtures.{_HTTP_FIXTURES.mode}ed",
+                           _HTTP_FIXTURES.replayed + _HTTP_FIXTURES.recorded)
+        _HTTP_FIXTURES = None
+
+
+def close_http_cache() -> None:
+    """Report cache statistics and enforce the size budget (call once at the end of a run)."""
+    global _HTTP_CACHE
+    if _HTTP_CACHE is None:
+        return
+    pruned = _HTTP_CACHE.prune()
+    report = get_report()
+    for name, value in _HTTP_CACHE.stats.items():
+        report.count(f"http_cache.{name}", value)
+    report.count("http_cache.evicted", pruned["evicted"])
+    print(f"  HTTP cache: {_HTTP_CACHE.summary()}; "
+          f"{pruned['evicted']} evicted, {pruned['removed']} expired, "
+          f"{pruned['bytes'] / (1024 * 1024):.1f} MiB on disk")
+    _HTTP_CACHE = None
+
+
+def close_session_pool() -> None:
+    """Close pooled connections (call once at the end of a run)."""
+    global _SESSION_POOL
+    if _SESSION_POOL is not None:
+        _SESSION_POOL.close()
+        _SESSION_POOL = None
+
+
+def http_get(url: str, params: dict | None = None, stream: bool = False,
+             cached: bool = False, partial: bool = False) -> requests.Response:
+    """HTTP GET with proxy fallback and retries for rate limits/timeouts.
+
+    With ``stream=True`` the body is left unread; read it from ``resp.raw``
+    or ``resp.iter_content`` and close the response when done.
+    With ``cached=True`` fresh cache entries are served without a request,
+    stale ones are revalidated with a conditional GET, and 200/404 responses
+    are stored for the next run. Streamed 200 bodies are not stored here: the
+    reader stores what it read (see stream_method_figure), and with
+    ``partial=True`` accepts a cached prefix from an earlier early stop.
+    HTTP_FIXTURES=record saves every response returned here;
+    HTTP_FIXTURES=replay serves them back without any network access
+    (paced by the rate limiter with HTTP_FIXTURE_PACED).
+    """
+    fixtures = get_http_fixtures()
+    if fixtures is not None and fixtures.replaying:
+        if HTTP_FIXTURE_PACED:
+            get_report().add_time("rate_limit.sleep", get_rate_limiter().acquire(url))
+        return fixtures.replay(url, params)
+    resp = fetch_live(url, params, stream, cached, partial)
+    if fixtures is not None:
+        resp = fixtures.record(url, params, resp)
+    return resp
+
+
+def fetch_live(url: str, params: dict | None, stream: bool, cached: bool,
+               partial: bool = False) -> requests.Response:
+    """The network half of http_get: rate limit, cache, route fallback and retries."""
+    backoff = RETRY_BACKOFF
+    pool = get_session_pool()
+    limiter = get_rate_limiter()
+    report = get_report()
+
+    cache = get_http_cache() if cached else None
+    meta = None
+    headers: dict[str, str] = {}
+    if cache is not None:
+        key = cache.cache_key(url, params)
+        meta = cache.lookup(key, partial_ok=partial)
+        if meta is not None and cache.is_fresh(meta):
+            return cache.hit(meta)
+        headers = cache.conditional_headers(meta)
+
+    failures = rate_limited = 0
+    while True:
+        report.add_time("rate_limit.sleep", limiter.acquire(url))
         try:
-            resp = requests.get(
-                url,
-                params=params,
-                timeout=REQUEST_TIMEOUT,
-                headers={"User-Agent": USER_AGENT},
-                proxies={"http": None, "https": None},
-            )
+            # Tries the route that last worked for this host first, then the other
+            resp = pool.get(url, params=params, headers=headers or None,
+                            timeout=REQUEST_TIMEOUT, stream=stream)
         except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exc:
-            try:
-                resp = requests.get(
-                    url,
-                    params=params,
-                    timeout=REQUEST_TIMEOUT,
-                    headers={"User-Agent": USER_AGENT},
-                )
-            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exc2:
-                last_exc = exc2
-                if attempt == MAX_RETRIES:
-                    raise
-                wait = min(backoff, 120)
-                print(f"  Request failed ({type(exc2).__name__}). Retrying in {wait:.1f}s...")
-                time.sleep(wait)
-                backoff *= 2
-                continue
+            failures += 1
+            report.count(f"http.errors.{type(exc).__name__}")
+            if failures >= MAX_RETRIES:
+                raise
+            wait = min(backoff, 120)
+            print(f"  Request failed ({type(exc).__name__}). Retrying in {wait:.1f}s...")
+            report.count("http.retries")
+            report.add_time("http.backoff_sleep", wait)
+            time.sleep(wait)
+            backoff *= 2
+            continue
 
+        # Streamed bodies are counted by the caller once read
+        report.record_http(resp.status_code, resp.elapsed.total_seconds(),
+                           None if stream else len(resp.content))
         if resp.status_code in RETRY_STATUS:
-            if attempt == MAX_RETRIES:
-                return resp
-            retry_after = resp.headers.get("Retry-After", "").strip()
-            if retry_after.isdigit():
-                wait = float(retry_after)
+            if resp.status_code == 429:
+                rate_limited += 1
+                exhausted = rate_limited > MAX_429_RETRIES
+                fallback = min(RATE_LIMIT_BACKOFF * rate_limited, 300)
             else:
-                wait = min(backoff, 120)
-            print(f"  HTTP {resp.status_code}. Retrying in {wait:.1f}s...")
-            time.sleep(wait)
-            backoff *= 2
+                failures += 1
+                exhausted = failures >= MAX_RETRIES
+                fallback = min(backoff, 120)
+                backoff *= 2
+            if exhausted:
+                return resp
+            retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+            wait = fallback if retry_after is None else retry_after
+            print(f"  HTTP {resp.status_code}. Holding requests to {url_host(url)} for {wait:.1f}s...")
+            resp.close()
+            report.count("http.retries")
+            # Every caller of this host waits the hold out in limiter.acquire
+            limiter.defer(url, wait)
             continue
 
+        if cache is not None:
+            if resp.status_code == 304 and meta is not None:
+                return cache.revalidated(meta, resp)
+            cache.count("misses")
+            if not stream or resp.status_code != 200:
+                cache.store(key, resp)
         return resp
 
-    if last_exc:
-        raise last_exc
-    return resp
-
 
 def get_published_year(published: str | None) -> int | None:
     """Extract year from arXiv published string."""
@@ -240,7 +426,11 @@ def is_after_min_year(published: str | None) -> bool:
 
 def find_arxiv_html_url(abs_url: str) -> str | None:
     """Find arXiv HTML URL from the abstract page."""
-    resp = http_get(abs_url)
+    cache = get_http_cache()
+    no_html_key = f"no-html:{abs_url}"
+    if cache is not None and cache.is_negative(no_html_key):
+        return None
+    resp = http_get(abs_url, cached=True)
     if resp.status_code != 200:
         return None
     html_url = extract_html_link_from_abs_page(resp.text, abs_url)
@@ -250,9 +440,11 @@ def find_arxiv_html_url(abs_url: str) -> str | None:
     # Fallback: try direct HTML URL (may redirect to latest version)
     arxiv_id = abs_url.rstrip("/").split("/")[-1]
     candidate = f"https://arxiv.org/html/{arxiv_id}"
-    resp2 = http_get(candidate)
+    resp2 = http_get(candidate, cached=True)
     if resp2.status_code == 200 and "text/html" in resp2.headers.get("Content-Type", ""):
         return candidate
+    if cache is not None and resp2.status_code in (200, 404, 410):
+        cache.store_negative(no_html_key, abs_url, "no-html")
     return None
 
 
@@ -272,18 +464,12 @@ def score_figure_caption(text: str, index: int) -> float:
 
 def extract_html_link_from_abs_page(html: str, abs_url: str) -> str | None:
     """Extract arXiv HTML link from the abstract page HTML."""
-    if BeautifulSoup is not None:
-        soup = BeautifulSoup(html, "html.parser")
-        for a in soup.find_all("a", href=True):
-            href = a.get("href", "")
-            href_l = href.lower()
-            label = " ".join(a.stripped_strings).lower()
-            if "/html/" in href_l:
-                return urljoin(abs_url, href)
-            if "format=html" in href_l:
-                return urljoin(abs_url, href)
-            if "html" in label and "html" in href_l:
-                return urljoin(abs_url, href)
+    # First <a href> containing /html/ or format=html, or an "html" href
+    # labelled HTML; the scan stops at the first hit.
+    scanner = LinkScanner(abs_url)
+    scanner.scan(iter_chunks(html))
+    if scanner.found:
+        return scanner.found
 
     for pattern in (HTML_LINK_RE, HTML_FORMAT_RE):
         match = pattern.search(html)
@@ -391,15 +577,90 @@ def pick_figure_media(fig) -> tuple[str | None, object | None]:
     return None, None
 
 
-def extract_method_figure(html_url: str) -> tuple[str | None, str | None]:
-    """Extract a likely method figure image URL + caption from arXiv HTML."""
-    if BeautifulSoup is None:
+def extract_method_figure(html_url: str, stats: dict | None = None) -> tuple[str | None, str | None]:
+    """Extract a likely method figure image URL + caption from arXiv HTML.
+
+    ``stats``, when given, receives html_bytes (body bytes read),
+    first_figure (seconds until a usable figure was seen, or None) and stop
+    ("figure", "budget" or "" when the whole page was read).
+    """
+    stats = {} if stats is None else stats
+    stats.update(html_bytes=0, first_figure=None, stop="")
+    if FIGURE_PARSER != "soup":
+        return stream_method_figure(html_url, stats)
+    if get_beautifulsoup() is None:
         return None, None
-    resp = http_get(html_url)
+    started = time.perf_counter()
+    resp = http_get(html_url, cached=True)
     if resp.status_code != 200:
         return None, None
+    stats["html_bytes"] = len(resp.content)
+    fig_url, caption = pick_method_figure_soup(resp.text, html_url)
+    if fig_url:
+        stats["first_figure"] = time.perf_counter() - started
+    return fig_url, caption
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+
+def stream_method_figure(html_url: str, stats: dict, partial: bool = True) -> tuple[str | None, str | None]:
+    """Scan an arXiv HTML page while it downloads and hang up once the answer is known.
+
+    Reading stops at the first <figure> scoring FIGURE_EARLY_STOP_SCORE, or
+    after FIGURE_STREAM_MAX_BYTES (best figure so far). The bytes read are
+    cached; a prefix cached by an earlier early stop repeats that stop
+    without a request, and is re-fetched in full if it runs out first.
+    """
+    started = time.perf_counter()
+    resp = http_get(html_url, stream=True, cached=True, partial=partial)
+    from_cache = getattr(resp, "from_cache", False)
+    try:
+        if resp.status_code != 200:
+            return None, None
+        scanner = FigureScanner(score_figure_caption, is_valid_figure_src, pick_image_src,
+                                stop_score=FIGURE_EARLY_STOP_SCORE)
+        decoder = codecs.getincrementaldecoder(resp.encoding or "utf-8")(errors="replace")
+        body: list[bytes] = []
+
+        def chunks():
+            for raw in resp.iter_content(FIGURE_STREAM_CHUNK):
+                body.append(raw)
+                stats["html_bytes"] += len(raw)
+                yield decoder.decode(raw)
+                if stats["first_figure"] is None and scanner.has_result():
+                    stats["first_figure"] = time.perf_counter() - started
+                if FIGURE_STREAM_MAX_BYTES and stats["html_bytes"] >= FIGURE_STREAM_MAX_BYTES:
+                    stats["stop"] = "budget"
+                    return
+            yield decoder.decode(b"", final=True)
+
+        scanner.scan(chunks())
+        if scanner.stopped_early:
+            stats["stop"] = "figure"
+        if stats["first_figure"] is None and scanner.has_result():
+            stats["first_figure"] = time.perf_counter() - started
+    finally:
+        resp.close()
+        if not from_cache and hasattr(resp.raw, "tell"):
+            get_report().count("http.bytes", resp.raw.tell())
+
+    if from_cache:
+        if getattr(resp, "partial", False) and not stats["stop"]:
+            # The cached prefix ran out before any stop (settings changed): read the page again
+            stats.update(html_bytes=0, first_figure=None)
+            return stream_method_figure(html_url, stats, partial=False)
+    else:
+        cache = get_http_cache()
+        if cache is not None and not is_replaying():
+            cache.store(cache.cache_key(html_url), resp, b"".join(body), partial=bool(stats["stop"]))
+
+    src, caption = scanner.result()
+    if not src:
+        return None, None
+    return absolutize_media_url(html_url, src), caption
+
+
+def pick_method_figure_soup(html: str, html_url: str) -> tuple[str | None, str | None]:
+    """Best figure from a full BeautifulSoup tree (reference implementation)."""
+    soup = get_beautifulsoup()(html, "html.parser")
     best_url = None
     best_caption = None
     best_score = -1e9
@@ -429,31 +690,75 @@ def extract_method_figure(html_url: str) -> tuple[str | None, str | None]:
     return None, None
 
 
+class TagClassifier:
+    """Tag rules and the relevance filter, compiled once.
+
+    Each tag's patterns are joined into a single alternation, so classifying a
+    paper is one scan per tag (plus one for relevance) with no trip through
+    the ``re`` module cache. Text is lowercased and every rule is lowercase,
+    so ASCII text is scanned without IGNORECASE (much faster in sre);
+    non-ASCII text keeps the flag to preserve Unicode case-folding matches.
+    """
+
+    def __init__(self, tag_rules: dict[str, list[str]], relevance_patterns: list[str]):
+        self.tags = list(tag_rules)
+        self._rules_ascii = self._compile(tag_rules, relevance_patterns, 0)
+        self._rules_unicode = self._compile(tag_rules, relevance_patterns, re.IGNORECASE)
+
+    @staticmethod
+    def _compile(tag_rules: dict[str, list[str]], relevance_patterns: list[str],
+                 flags: int) -> tuple[re.Pattern, list[tuple[str, re.Pattern]]]:
+        def join(patterns: list[str]) -> re.Pattern:
+            return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+        return join(relevance_patterns), [(tag, join(pats)) for tag, pats in tag_rules.items()]
+
+    def classify_text(self, text: str) -> tuple[list[str], bool]:
+        """Return (sorted tags, is_relevant) for lowercased title + abstract."""
+        relevance, rules = self._rules_ascii if text.isascii() else self._rules_unicode
+        tags = sorted(tag for tag, rx in rules if rx.search(text))
+        return tags, relevance.search(text) is not None
+
+    def is_relevant_text(self, text: str) -> bool:
+        relevance, _ = self._rules_ascii if text.isascii() else self._rules_unicode
+        return relevance.search(text) is not None
+
+    def classify(self, title: str, abstract: str) -> tuple[list[str], bool]:
+        return self.classify_text(f"{title} {abstract}".lower())
+
+    def classify_many(self, papers: list[dict]) -> list[tuple[list[str], bool]]:
+        """Classify a batch of paper dicts, in order."""
+        classify_text = self.classify_text
+        return [
+            classify_text(f"{p.get('title', '')} {p.get('abstract', '')}".lower())
+            for p in papers
+        ]
+
+
+_CLASSIFIER: TagClassifier | None = None
+
+
+def get_classifier() -> TagClassifier:
+    """Return the shared classifier built from TAG_RULES and RELEVANCE_PATTERNS."""
+    global _CLASSIFIER
+    if _CLASSIFIER is None:
+        _CLASSIFIER = TagClassifier(TAG_RULES, RELEVANCE_PATTERNS)
+    return _CLASSIFIER
+
+
 def is_relevant(title: str, abstract: str) -> bool:
     """Check if a paper is actually about Gaussian Splatting.
     arXiv API returns loose matches; this filters out irrelevant results.
     """
-    text = f"{title} {abstract}".lower()
-    for pat in RELEVANCE_PATTERNS:
-        if re.search(pat, text, re.IGNORECASE):
-            return True
-    return False
+    return get_classifier().is_relevant_text(f"{title} {abstract}".lower())
 
 
 def assign_tags(title: str, abstract: str) -> list[str]:
     """Assign tags based on keyword matching in title + abstract."""
-    text = f"{title} {abstract}".lower()
-    tags = []
-    for tag, patterns in TAG_RULES.items():
-        for pat in patterns:
-            if re.search(pat, text, re.IGNORECASE):
-                tags.append(tag)
-                break
-    return sorted(tags)
+    return get_classifier().classify(title, abstract)[0]
 
 
-def enrich_method_figure(paper: dict) -> bool:
-    """Fetch and attach a likely method figure URL to a paper."""
+def enrich_method_figure(paper: dict, stats: dict | None = None) -> bool:
+    """Fetch and attach a likely method figure URL to a paper (stats: see extract_method_figure)."""
     if not FETCH_METHOD_FIGURES:
         return False
     if not paper.get("abs_url"):
@@ -466,7 +771,7 @@ def enrich_method_figure(paper: dict) -> bool:
     if not html_url:
         return False
 
-    fig_url, caption = extract_method_figure(html_url)
+    fig_url, caption = extract_method_figure(html_url, stats)
     if not fig_url:
         if existing_url and is_suspect_figure_url(existing_url) and CLEAR_BAD_FIGURES:
             paper.pop("method_fig_url", None)
@@ -481,12 +786,41 @@ def enrich_method_figure(paper: dict) -> bool:
     return True
 
 
-def enrich_method_figures(papers: list[dict], target_ids: set[str]) -> None:
-    """Enrich a subset of papers with method figures."""
+def describe_figure_stats(stats: dict) -> str:
+    """' (120 KiB read, first figure after 0.41s, stopped at figure)' for progress lines."""
+    if not stats.get("html_bytes"):
+        return ""
+    parts = [f"{stats['html_bytes'] / 1024:.0f} KiB read"]
+    if stats.get("first_figure") is not None:
+        parts.append(f"first figure after {stats['first_figure']:.2f}s")
+    if stats.get("stop"):
+        parts.append(f"stopped at {stats['stop']}")
+    return f" ({', '.join(parts)})"
+
+
+def figures_enabled() -> bool:
+    """True when method figures should be fetched this run."""
     if not FETCH_METHOD_FIGURES:
-        return
-    if BeautifulSoup is None:
+        return False
+    if FIGURE_PARSER == "soup" and get_beautifulsoup() is None:
         print("  bs4 not installed; skipping method figure extraction.")
+        return False
+    return True
+
+
+def record_figure_stats(stats: dict) -> str:
+    """Add one paper's figure stats to the run report; return its progress-line detail."""
+    report = get_report()
+    report.count("figures.html_bytes", stats.get("html_bytes", 0))
+    report.add_time("figures.time_to_first_figure", stats.get("first_figure") or 0.0)
+    if stats.get("stop"):
+        report.count(f"figures.stopped_by_{stats['stop']}")
+    return describe_figure_stats(stats)
+
+
+def enrich_method_figures(papers: list[dict], target_ids: set[str]) -> None:
+    """Enrich a subset of papers with method figures."""
+    if not figures_enabled():
         return
 
     candidates = [p for p in papers if p.get("id") in target_ids and needs_figure_refresh(p)]
@@ -499,234 +833,698 @@ def enrich_method_figures(papers: list[dict], target_ids: set[str]) -> None:
     if not candidates:
         return
 
-    print(f"Fetching method figures for {len(candidates)} papers...")
-    for idx, paper in enumerate(candidates, 1):
-        pid = paper.get("id", "")
-        print(f"  [{idx}/{len(candidates)}] {pid}")
-        try:
-            found = enrich_method_figure(paper)
+    workers = max(1, min(FIGURE_WORKERS, len(candidates)))
+    print(f"Fetching method figures for {len(candidates)} papers ({workers} workers)...")
+    found_count = 0
+    failed_count = 0
+    report = get_report()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        for paper in candidates:
+            stats: dict = {}
+            futures[executor.submit(enrich_method_figure, paper, stats)] = (paper, stats)
+        for idx, future in enumerate(as_completed(futures), 1):
+            paper, stats = futures[future]
+            pid = paper.get("id", "")
+            try:
+                found = future.result()
+            except Exception as exc:  # isolate failures to the paper that raised
+                failed_count += 1
+                print(f"  [{idx}/{len(candidates)}] {pid}: failed ({type(exc).__name__}: {exc})")
+                continue
+            detail = record_figure_stats(stats)
             if found:
-                print("    Found method figure.")
+                found_count += 1
+                print(f"  [{idx}/{len(candidates)}] {pid}: found method figure{detail}")
             else:
-                print("    No method figure found.")
-        except requests.RequestException as exc:
-            print(f"    Failed to fetch method figure: {exc}")
+                print(f"  [{idx}/{len(candidates)}] {pid}: no method figure{detail}")
 
-        if idx < len(candidates):
-            time.sleep(FIGURE_REQUEST_DELAY)
+    report.count("figures.candidates", len(candidates))
+    report.count("figures.found", found_count)
+    report.count("figures.failed", failed_count)
+    print(f"  Method figures: {found_count} found, {failed_count} failed, "
+          f"{len(candidates) - found_count - failed_count} without figure.")
 
 
-def fetch_arxiv_papers() -> list[dict]:
-    """Fetch papers from arXiv API with pagination."""
-    all_papers: list[dict] = []
-    start = 0
-    rate_limit_hits = 0
-
-    while start < MAX_TOTAL_RESULTS:
-        params = {
-            "search_query": SEARCH_QUERY,
-            "start": start,
-            "max_results": MAX_RESULTS_PER_PAGE,
-            "sortBy": "submittedDate",
-            "sortOrder": "descending",
+class HarvestWatermark:
+    """Newest published/updated timestamps and recently seen IDs from past harvests.
+
+    A paper is "known" when its ID was already seen, or when it was published
+    more than WATERMARK_OVERLAP_DAYS before the newest published timestamp.
+    The overlap window catches papers that arXiv announces late.
+    """
+
+    def __init__(self, newest_published: str = "", newest_updated: str = "",
+                 seen: dict[str, str] | None = None):
+        self.newest_published = newest_published
+        self.newest_updated = newest_updated
+        self.seen: dict[str, str] = dict(seen or {})  # ID -> published
+        self._lock = threading.Lock()  # harvest shards observe concurrently
+
+    @classmethod
+    def load(cls, path: Path | None = None) -> "HarvestWatermark":
+        path = path or HARVEST_STATE_JSON
+        if not path.exists():
+            return cls()
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        # Older state files list bare IDs ("seen_ids"); without a date they are
+        # pruned by the next save
+        seen = data.get("seen") or dict.fromkeys(data.get("seen_ids", []), "")
+        return cls(data.get("newest_published", ""), data.get("newest_updated", ""), seen)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.newest_published
+
+    def overlap_cutoff(self) -> str:
+        """Published timestamps below this are considered already harvested."""
+        if not self.newest_published:
+            return ""
+        try:
+            newest = datetime.fromisoformat(self.newest_published.replace("Z", "+00:00"))
+        except ValueError:
+            return ""
+        cutoff = newest - timedelta(days=WATERMARK_OVERLAP_DAYS)
+        return cutoff.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def is_known(self, pid: str, published: str, cutoff: str) -> bool:
+        if pid in self.seen:
+            return True
+        return bool(cutoff) and bool(published) and published < cutoff
+
+    def observe(self, pid: str, published: str, updated: str) -> None:
+        """Record an entry returned by the API (relevant or not)."""
+        with self._lock:
+            self.seen[pid] = published or ""
+            if published and published > self.newest_published:
+                self.newest_published = published
+            if updated and updated > self.newest_updated:
+                self.newest_updated = updated
+
+    def save(self, path: Path | None = None) -> None:
+        """Persist the watermark, keeping only dated IDs inside the overlap window."""
+        path = path or HARVEST_STATE_JSON
+        cutoff = self.overlap_cutoff()
+        seen = {pid: pub for pid, pub in sorted(self.seen.items()) if pub and pub >= cutoff}
+        data = {
+            "newest_published": self.newest_published,
+            "newest_updated": self.newest_updated,
+            "seen": seen,
         }
-        print(f"  Fetching results {start}–{start + MAX_RESULTS_PER_PAGE} ...")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        print(f"  Saved harvest watermark ({self.newest_published}, {len(seen)} recent IDs)")
+
 
-        resp = http_get(ARXIV_API_URL, params=params)
-        if resp.status_code == 429:
-            rate_limit_hits += 1
-            if rate_limit_hits > MAX_429_RETRIES:
+def log_line(text: str) -> None:
+    """Print a line in one write, so lines from harvest threads do not interleave."""
+    print(f"{text}\n", end="")
+
+
+def open_api_page(start: int, page_size: int, buffered: bool = False,
+                  query: str = SEARCH_QUERY) -> tuple[requests.Response, object]:
+    """Request one API results page; return the response and a file-like body.
+
+    The body streams from the socket, or is read in full first with
+    ``buffered`` (prefetched pages are downloaded on the prefetch thread).
+    Non-200 responses come back closed, with no body.
+    """
+    params = {
+        "search_query": query,
+        "start": start,
+        "max_results": page_size,
+        "sortBy": "submittedDate",
+        "sortOrder": "descending",
+    }
+    resp = http_get(ARXIV_API_URL, params=params, stream=True)
+    if resp.status_code != 200:
+        resp.close()
+        return resp, None
+    resp.raw.decode_content = True
+    if not buffered:
+        return resp, resp.raw
+    try:
+        return resp, io.BytesIO(b"".join(resp.iter_content(64 * 1024)))
+    except BaseException:
+        resp.close()
+        raise
+
+
+def fetch_arxiv_papers(watermark: HarvestWatermark | None = None, full: bool = False,
+                       query: str = SEARCH_QUERY, label: str = "",
+                       prefetch: int | None = None) -> list[dict]:
+    """Fetch papers from arXiv API with pagination (see iter_arxiv_pages)."""
+    return [paper for page in iter_arxiv_pages(watermark, full, query, label, prefetch) for paper in page]
+
+
+def iter_arxiv_pages(watermark: HarvestWatermark | None = None, full: bool = False,
+                     query: str = SEARCH_QUERY, label: str = "",
+                     prefetch: int | None = None) -> Iterator[list[dict]]:
+    """Yield the relevant papers of each API results page as it is read.
+
+    With a non-empty watermark (and ``full`` unset) paging stops after the
+    first page whose entries are all already known. Full re-syncs keep
+    ``prefetch`` (default API_PREFETCH_PAGES) pages downloading on a
+    background thread while the current one is parsed; the API rate limit
+    and any Retry-After holds are applied by the shared rate limiter in
+    http_get, so at most the prefetched pages are requested beyond the last
+    page needed. ``label`` prefixes progress lines (harvest shards).
+    Closing the generator early drops the pages still prefetching.
+    """
+    start = 0
+    parse_failures = 0
+    page_size = FULL_SYNC_RESULTS_PER_PAGE if full else MAX_RESULTS_PER_PAGE
+    report = get_report()
+    cutoff = ""
+    if watermark is not None and not full and not watermark.is_empty:
+        cutoff = watermark.overlap_cutoff()
+        print(f"  Incremental harvest: stopping at papers known before {cutoff}.")
+
+    if prefetch is None:
+        prefetch = API_PREFETCH_PAGES if full else 0
+    log = f"  [{label}] " if label else "  "
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="api-prefetch") if prefetch else None
+    pending: dict[int, Future] = {}
+
+    def next_page(offset: int) -> tuple[requests.Response, object]:
+        if executor is None:
+            return open_api_page(offset, page_size, query=query)
+        for ahead in range(prefetch + 1):
+            page_start = offset + ahead * page_size
+            if page_start < MAX_TOTAL_RESULTS and page_start not in pending:
+                pending[page_start] = executor.submit(open_api_page, page_start, page_size, True, query)
+        return pending.pop(offset).result()
+
+    try:
+        while start < MAX_TOTAL_RESULTS:
+            log_line(f"{log}Fetching results {start}–{start + page_size} ...")
+            page_papers: list[dict] = []
+            entry_count = 0
+            last_published = ""
+            skipped = 0
+            skipped_old = 0
+            known = 0
+            observed: list[tuple[str, str, str]] = []  # applied once the page parsed completely
+            resp = None
+            try:
+                # 429 / 5xx retries and Retry-After holds happen inside http_get
+                resp, body = next_page(start)
                 resp.raise_for_status()
-            retry_after = resp.headers.get("Retry-After", "").strip()
-            if retry_after.isdigit():
-                wait = float(retry_after)
-            else:
-                wait = min(RATE_LIMIT_BACKOFF * rate_limit_hits, 300)
-            print(f"  HTTP 429 rate limit. Waiting {wait:.0f}s before retry...")
-            time.sleep(wait)
-            continue
-        rate_limit_hits = 0
-        resp.raise_for_status()
-        feed = feedparser.parse(resp.text)
-
-        if not feed.entries:
-            print("  No more entries, stopping.")
-            break
-
-        skipped = 0
-        skipped_old = 0
-        for entry in feed.entries:
-            arxiv_id = entry.id.split("/abs/")[-1]
-            # Remove version suffix for dedup (e.g., "2401.12345v2" → "2401.12345")
-            arxiv_id_base = re.sub(r"v\d+$", "", arxiv_id)
-
-            title = re.sub(r"\s+", " ", entry.title).strip()
-            abstract = re.sub(r"\s+", " ", entry.summary).strip()
-
-            # Year filter: only keep papers after 2023
-            if not is_after_min_year(entry.published):
-                skipped_old += 1
+                # Entries are parsed and filtered as the body streams in
+                for entry in iter_arxiv_entries(body):
+                    entry_count += 1
+                    pid = entry["id"]
+                    last_published = entry["published"]
+
+                    if watermark is not None:
+                        if cutoff and watermark.is_known(pid, entry["published"], cutoff):
+                            known += 1
+                        observed.append((pid, entry["published"], entry["updated"]))
+
+                    # Year filter: only keep papers after 2023
+                    if not is_after_min_year(entry["published"]):
+                        skipped_old += 1
+                        continue
+
+                    # Relevance filter: skip papers that don't actually mention GS
+                    if not is_relevant(entry["title"], entry["abstract"]):
+                        skipped += 1
+                        continue
+
+                    entry["abs_url"] = f"https://arxiv.org/abs/{pid}"
+                    entry["tags"] = []  # will be filled later
+                    page_papers.append(entry)
+            except (requests.exceptions.HTTPError, FixtureMissingError):
+                raise  # a missing recording cannot appear on a retry
+            except (ParseError, requests.exceptions.RequestException) as exc:
+                parse_failures += 1
+                if parse_failures > MAX_RETRIES:
+                    raise
+                log_line(f"{log}Failed to read page ({type(exc).__name__}: {exc}). Retrying...")
+                report.count("arxiv.page_failures")
+                report.add_time("http.backoff_sleep", min(RETRY_BACKOFF * parse_failures, 120))
+                time.sleep(min(RETRY_BACKOFF * parse_failures, 120))
                 continue
+            finally:
+                if resp is not None:
+                    report.count("http.bytes", resp.raw.tell())
+                    resp.close()
+            parse_failures = 0
+            # Only now: entries observed on a failed attempt would count as known on the retry
+            for pid, published, updated in observed:
+                watermark.observe(pid, published, updated)
+            report.count("arxiv.pages")
+            report.count("arxiv.entries", entry_count)
+            report.count("papers.irrelevant", skipped)
+            report.count("papers.too_old", skipped_old)
+            if page_papers:
+                yield page_papers
+
+            if not entry_count:
+                log_line(f"{log}No more entries, stopping.")
+                break
 
-            # Relevance filter: skip papers that don't actually mention GS
-            if not is_relevant(title, abstract):
-                skipped += 1
+            if skipped:
+                log_line(f"{log}Filtered out {skipped} irrelevant papers in this batch.")
+            if skipped_old:
+                log_line(f"{log}Skipped {skipped_old} papers older than {MIN_PUBLISHED_YEAR}.")
+
+            if cutoff and known == entry_count:
+                log_line(f"{log}Whole page is older than the harvest watermark, stopping.")
+                break
+
+            last_year = get_published_year(last_published)
+            if last_year is not None and last_year < MIN_PUBLISHED_YEAR:
+                log_line(f"{log}Reached papers older than cutoff year, stopping.")
+                break
+
+            # If we got fewer entries than requested, we've reached the end
+            if entry_count < page_size:
+                log_line(f"{log}Got {entry_count} entries (< {page_size}), done.")
+                break
+
+            start += page_size
+        else:
+            log_line(f"{log}Stopped at the MAX_TOTAL_RESULTS cap ({MAX_TOTAL_RESULTS}); use --sharded to go further.")
+    finally:
+        if executor is not None:
+            # Drop pages prefetched past the end (the one in flight is waited for)
+            executor.shutdown(wait=True, cancel_futures=True)
+            for future in pending.values():
+                if not future.cancelled() and future.exception() is None:
+                    future.result()[0].close()
+
+
+def harvest_shards(shards: list[Shard], watermark: HarvestWatermark | None = None) -> list[dict]:
+    """Run each shard as its own full paginated harvest and merge them by arXiv ID.
+
+    Shards run HARVEST_SHARD_WORKERS at a time; a shard that fails is re-run
+    from its first page up to HARVEST_SHARD_RETRIES times without touching
+    the others. Papers of shards that still fail are missing from the
+    result (existing papers are kept by merge_papers), and the failed shards
+    are listed so the backfill can be repeated.
+    """
+    index = DedupIndex()
+    report = get_report()
+    failed: list[Shard] = []
+
+    def run(shard: Shard) -> list[dict]:
+        for attempt in range(HARVEST_SHARD_RETRIES + 1):
+            try:
+                # Shards already overlap each other's downloads; no prefetch within one
+                return fetch_arxiv_papers(watermark, full=True, query=shard.query, label=shard.name, prefetch=0)
+            except Exception as exc:
+                if attempt == HARVEST_SHARD_RETRIES or isinstance(exc, FixtureMissingError):
+                    raise
+                log_line(f"  [{shard.name}] Shard failed ({type(exc).__name__}: {exc}). Retrying the shard...")
+                report.count("harvest.shard_retries")
+
+    workers = max(1, min(HARVEST_SHARD_WORKERS, len(shards)))
+    print(f"  Harvesting {len(shards)} shards ({workers} at a time)...")
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="harvest") as executor:
+        futures = {executor.submit(run, shard): shard for shard in shards}
+        for future in as_completed(futures):
+            shard = futures[future]
+            try:
+                papers = future.result()
+            except Exception as exc:  # isolate failures to the shard that raised
+                failed.append(shard)
+                print(f"  [{shard.name}] Giving up on shard ({type(exc).__name__}: {exc}).")
                 continue
+            added = sum(index.add(paper) for paper in papers)
+            print(f"  [{shard.name}] {len(papers)} papers, {added} new across shards.")
+
+    report.count("harvest.shards", len(shards))
+    report.count("harvest.shards_failed", len(failed))
+    report.count("harvest.duplicates", index.duplicates)
+    if failed and len(failed) == len(shards):
+        raise RuntimeError("Every harvest shard failed")
+    if failed:
+        names = ", ".join(sorted(shard.name for shard in failed))
+        print(f"  WARNING: {len(failed)} shard(s) failed and were skipped: {names}. Re-run with --sharded.")
+    print(f"  {len(index)} unique papers ({index.duplicates} duplicates across shards).")
+    return index.papers()
+
+
+def harvest_sharded(watermark: HarvestWatermark | None = None) -> list[dict]:
+    """Backfill everything since MIN_PUBLISHED_YEAR in HARVEST_SHARD_MONTHS windows."""
+    since = datetime(MIN_PUBLISHED_YEAR, 1, 1, tzinfo=timezone.utc)
+    shards = date_shards(SEARCH_QUERY, since, datetime.now(timezone.utc), HARVEST_SHARD_MONTHS)
+    return harvest_shards(shards, watermark)
 
-            pdf_url = ""
-            for link in entry.get("links", []):
-                if link.get("type") == "application/pdf":
-                    pdf_url = link.href
-                    break
-
-            categories = [t.term for t in entry.get("tags", [])]
-            authors = [a.name for a in entry.get("authors", [])]
-            affiliations: list[str] = []
-            for author in entry.get("authors", []):
-                if isinstance(author, dict):
-                    aff = author.get("arxiv_affiliation") or author.get("affiliation")
-                else:
-                    aff = getattr(author, "arxiv_affiliation", None) or getattr(author, "affiliation", None)
-                if aff:
-                    cleaned = re.sub(r"\s+", " ", str(aff)).strip()
-                    if cleaned:
-                        affiliations.append(cleaned)
-            # De-duplicate while preserving order
-            affiliations = list(dict.fromkeys(affiliations))
-
-            paper = {
-                "id": arxiv_id_base,
-                "title": title,
-                "authors": authors,
-                "affiliations": affiliations,
-                "abstract": abstract,
-                "published": entry.published,
-                "updated": entry.updated,
-                "categories": categories,
-                "pdf_url": pdf_url,
-                "abs_url": f"https://arxiv.org/abs/{arxiv_id_base}",
-                "tags": [],  # will be filled later
-            }
-            all_papers.append(paper)
-
-        if skipped:
-            print(f"  Filtered out {skipped} irrelevant papers in this batch.")
-        if skipped_old:
-            print(f"  Skipped {skipped_old} papers older than {MIN_PUBLISHED_YEAR}.")
-
-        last_year = get_published_year(feed.entries[-1].published)
-        if last_year is not None and last_year < MIN_PUBLISHED_YEAR:
-            print("  Reached papers older than cutoff year, stopping.")
-            break
-
-        # If we got fewer entries than requested, we've reached the end
-        if len(feed.entries) < MAX_RESULTS_PER_PAGE:
-            print(f"  Got {len(feed.entries)} entries (< {MAX_RESULTS_PER_PAGE}), done.")
-            break
-
-        start += MAX_RESULTS_PER_PAGE
-        print(f"  Waiting {REQUEST_DELAY}s before next request...")
-        time.sleep(REQUEST_DELAY)
-
-    return all_papers
+
+_PAPER_STORE: PaperStore | None = None
+
+
+def get_paper_store() -> PaperStore:
+    """Return the configured paper store (PAPER_STORE=json|sqlite|log) under DATA_DIR."""
+    global _PAPER_STORE
+    if _PAPER_STORE is None:
+        _PAPER_STORE = open_store(PAPER_STORE, DATA_DIR)
+    return _PAPER_STORE
+
+
+def close_paper_store() -> None:
+    """Close the paper store; the next get_paper_store() opens it again (on the calling thread)."""
+    global _PAPER_STORE
+    if _PAPER_STORE is not None:
+        _PAPER_STORE.close()
+        _PAPER_STORE = None
 
 
 def load_existing_papers() -> dict:
-    """Load existing papers.json data."""
-    if PAPERS_JSON.exists():
-        with open(PAPERS_JSON, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        fixed_count = 0
-        for paper in data.get("papers", []):
-            fixed = normalize_method_fig_url(paper.get("method_fig_url"))
-            if fixed and fixed != paper.get("method_fig_url"):
-                paper["method_fig_url"] = fixed
-                fixed_count += 1
-        if fixed_count:
-            print(f"  Normalized {fixed_count} malformed method figure URLs.")
-        return data
-    return {"last_updated": "", "total_count": 0, "papers": []}
-
-
-def merge_papers(existing: list[dict], new_papers: list[dict]) -> tuple[list[dict], list[str]]:
-    """Merge new papers into existing list, deduplicating by ID."""
+    """Load existing papers from the paper store."""
+    data = get_paper_store().load()
+    fixed_count = 0
+    for paper in data.get("papers", []):
+        fixed = normalize_method_fig_url(paper.get("method_fig_url"))
+        if fixed and fixed != paper.get("method_fig_url"):
+            paper["method_fig_url"] = fixed
+            fixed_count += 1
+    if fixed_count:
+        print(f"  Normalized {fixed_count} malformed method figure URLs.")
+    return data
+
+
+def paper_fingerprint(paper: dict) -> str:
+    """Hash of the classifier inputs, arXiv's `updated` timestamp and the parser version.
+
+    The parser version makes records saved before a parser change (e.g. the
+    affiliations field) differ once, so they are refreshed from the API.
+    """
+    payload = "\x1f".join((paper.get("title", ""), paper.get("abstract", ""), paper.get("updated", ""),
+                           str(PARSER_VERSION)))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def tag_rules_version() -> str:
+    """Short hash of TAG_RULES; changes whenever a tag rule is edited."""
+    payload = json.dumps(TAG_RULES, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+
+class MergeResult:
+    """The merged corpus plus ID deltas against the previous one.
+
+    ``added`` and ``updated`` (content changed or tags changed) only hold IDs
+    that made it into ``papers``; ``evicted_by_year`` / ``evicted_by_cap``
+    hold IDs, old or new, that were dropped by MIN_PUBLISHED_YEAR or
+    MAX_PAPERS.
+    """
+
+    __slots__ = ("papers", "added", "updated", "evicted_by_year", "evicted_by_cap")
+
+    def __init__(self, papers: list[dict], added: set[str], updated: set[str],
+                 evicted_by_year: set[str], evicted_by_cap: set[str]):
+        self.papers = papers
+        self.added = added
+        self.updated = updated
+        self.evicted_by_year = evicted_by_year
+        self.evicted_by_cap = evicted_by_cap
+
+    @property
+    def changed(self) -> set[str]:
+        """IDs whose records downstream outputs need to (re)render."""
+        return self.added | self.updated
+
+    @property
+    def evicted(self) -> set[str]:
+        return self.evicted_by_year | self.evicted_by_cap
+
+
+def published_key(paper: dict) -> str:
+    return paper.get("published", "")
+
+
+def sorted_desc(papers: list[dict], keys: list[str] | None = None) -> tuple[list[dict], list[str]]:
+    """The papers newest first (stable; already-sorted input is kept) and their keys."""
+    if keys is None:
+        keys = [p.get("published", "") for p in papers]
+    if not all(map(operator.ge, keys, keys[1:])):
+        papers = sorted(papers, key=published_key, reverse=True)
+        keys = [p.get("published", "") for p in papers]
+    return papers, keys
+
+
+def merge_sorted_runs(existing: list[dict], new: list[dict], cap: int,
+                      existing_keys: list[str] | None = None,
+                      new_keys: list[str] | None = None) -> tuple[list[dict], list[dict]]:
+    """Merge two runs sorted by published (newest first) into (kept, evicted) around ``cap``.
+
+    Equal timestamps put existing papers first and keep each run's order, so
+    the result matches a stable sort of ``existing + new``. Each new paper is
+    bisected into the existing run and the existing papers between insertion
+    points are copied as slices, so the large run is never re-sorted. Callers
+    that already read the published keys pass them in.
+    """
+    existing, existing_keys = sorted_desc(existing, existing_keys)
+    new, new_keys = sorted_desc(new, new_keys)
+    ascending = existing_keys[::-1]
+    total = len(existing)
+    merged: list[dict] = []
+    taken = 0
+    for paper, key in zip(new, new_keys):
+        # Existing papers published at or after this one come first
+        pos = total - bisect_left(ascending, key)
+        merged += existing[taken:pos]
+        merged.append(paper)
+        taken = pos
+    merged += existing[taken:]
+    if not cap:
+        return merged, []
+    return merged[:cap], merged[cap:]
+
+
+def merge_papers(existing: list[dict], new_papers: list[dict],
+                 author_index: AuthorIndex | None = None, swept: bool = False) -> MergeResult:
+    """Merge new papers into existing list, deduplicating by ID.
+
+    Stored papers carry a `fingerprint` of their classifier inputs and the
+    `tag_rules_version` they were tagged with; unchanged records are skipped.
+    The existing corpus (newest first) and the new papers are merged as two
+    sorted runs and cut at MAX_PAPERS, without re-sorting the whole corpus.
+
+    ``author_index`` is updated along the way for the papers that are added,
+    updated or evicted, and rebuilt if it does not match the existing corpus.
+
+    ``swept`` says ``existing`` is the result of an earlier merge in this run
+    (batch-by-batch merging, as --async does per page): every stored paper
+    then has the current tag rules, passed the year filter and is covered
+    by ``author_index``, so the scans over the whole corpus are skipped and
+    the caller checks the author index once at the end.
+    """
     existing_map = {p["id"]: p for p in existing}
+    existing_count = len(existing_map)
     added_ids: list[str] = []
+    updated_ids: set[str] = set()
+    rules_version = tag_rules_version()
+    to_tag: list[dict] = []
+    skipped = updated = retagged = 0
 
     for paper in new_papers:
         pid = paper["id"]
-        if pid not in existing_map:
-            paper["tags"] = assign_tags(paper["title"], paper["abstract"])
+        paper["fingerprint"] = paper_fingerprint(paper)
+        stored = existing_map.get(pid)
+        if stored is None:
             existing_map[pid] = paper
             added_ids.append(pid)
-        else:
-            existing_map[pid].update(paper)
-            if REASSIGN_ALL_TAGS:
-                existing_map[pid]["tags"] = assign_tags(paper["title"], paper["abstract"])
+            to_tag.append(paper)
+            if author_index is not None:
+                author_index.add_paper(paper)
+        elif stored.get("fingerprint") == paper["fingerprint"]:
+            if stored.get("tag_rules_version") == rules_version:
+                skipped += 1
             else:
-                # Preserve manually-edited tags unless empty
-                old_tags = existing_map[pid].get("tags", [])
-                existing_map[pid]["tags"] = old_tags if old_tags else assign_tags(
-                    paper["title"], paper["abstract"]
-                )
-
+                retagged += 1
+                to_tag.append(stored)
+        else:
+            old_tags = stored.get("tags", [])
+            paper.pop("tags", None)
+            if author_index is not None:
+                author_index.remove_paper(stored)
+            stored.update(paper)
+            stored["tags"] = old_tags
+            if author_index is not None:
+                author_index.add_paper(stored)
+            updated += 1
+            updated_ids.add(pid)
+            to_tag.append(stored)
+
+    # Incremental harvests only return recent papers; re-tag the rest of the
+    # corpus too once TAG_RULES change.
+    if not swept:
+        queued = {p["id"] for p in to_tag}
+        for stored in existing_map.values():
+            if stored["id"] not in queued and stored.get("tag_rules_version") != rules_version:
+                retagged += 1
+                to_tag.append(stored)
+
+    added = set(added_ids)
+    for paper, (tags, _) in zip(to_tag, get_classifier().classify_many(to_tag)):
+        old_tags = paper.get("tags")
+        if paper["id"] in added or REASSIGN_ALL_TAGS:
+            paper["tags"] = tags
+        else:
+            # Preserve manually-edited tags unless empty
+            paper["tags"] = paper.get("tags") or tags
+        paper["tag_rules_version"] = rules_version
+        if paper["id"] not in added and paper["tags"] != old_tags:
+            updated_ids.add(paper["id"])
+
+    print(f"  Existing papers: {skipped} unchanged (skipped), {updated} updated, "
+          f"{retagged} re-tagged after a rules change.")
     print(f"  Added {len(added_ids)} new papers, {len(existing_map)} total.")
 
-    filtered = [p for p in existing_map.values() if is_after_min_year(p.get("published"))]
-    removed = len(existing_map) - len(filtered)
-    if removed:
-        print(f"  Removed {removed} papers older than {MIN_PUBLISHED_YEAR}.")
+    # Insertion order: the existing corpus, then new papers in API order.
+    # One pass applies the year filter and collects each run's sort keys;
+    # the "YYYY-" prefix check is is_after_min_year without a regex per paper.
+    runs: tuple[list[dict], list[dict]] = ([], [])
+    run_keys: tuple[list[str], list[str]] = ([], [])
+    evicted_by_year: set[str] = set()
+    min_year = f"{MIN_PUBLISHED_YEAR:04d}"
+    if swept:
+        # Stored papers passed the filter in an earlier merge; check the new run only
+        runs[0].extend(existing)
+        run_keys[0].extend(p.get("published") or "" for p in existing)
+        candidates = enumerate((existing_map[pid] for pid in added_ids), existing_count)
+    else:
+        candidates = enumerate(existing_map.values())
+    for idx, paper in candidates:
+        published = paper.get("published") or ""
+        year = published[:4]
+        if published[4:5] == "-" and year.isdigit() and year >= min_year:
+            runs[idx >= existing_count].append(paper)
+            run_keys[idx >= existing_count].append(published)
+        else:
+            evicted_by_year.add(paper["id"])
+            if author_index is not None:
+                author_index.remove_paper(paper)
+    if evicted_by_year:
+        print(f"  Removed {len(evicted_by_year)} papers older than {MIN_PUBLISHED_YEAR}.")
+
+    merged, overflow = merge_sorted_runs(runs[0], runs[1], MAX_PAPERS, run_keys[0], run_keys[1])
+    evicted_by_cap = {p["id"] for p in overflow}
+    if author_index is not None:
+        for paper in overflow:
+            author_index.remove_paper(paper)
+        if not swept and author_index.ensure(merged):
+            print(f"  Rebuilt the author index ({len(merged)} papers).")
+    if evicted_by_cap:
+        print(f"  Trimmed {len(evicted_by_cap)} oldest papers to keep {MAX_PAPERS}.")
+
+    evicted = evicted_by_year | evicted_by_cap
+    result = MergeResult(merged, added - evicted, updated_ids - evicted, evicted_by_year, evicted_by_cap)
+    report = get_report()
+    report.count("papers.added", len(added_ids))
+    report.count("papers.updated", updated)
+    report.count("papers.unchanged", skipped)
+    report.count("papers.retagged", retagged)
+    report.count("papers.dropped_by_year", len(evicted_by_year))
+    report.count("papers.dropped_by_cap", len(evicted_by_cap))
+    return result
+
+
+def save_papers(papers: list[dict]) -> bool:
+    """Save papers list to the paper store; returns False if nothing changed.
+
+    An unchanged corpus leaves the store (and its last_updated stamp)
+    untouched, so the site and feed builds can skip their work entirely.
+    """
+    store = get_paper_store()
+    if not store.save(papers):
+        print(f"  No changes; left the {store.name} paper store untouched.")
+        return False
+    stats = getattr(store, "last_stats", None)
+    detail = f" ({', '.join(f'{v} {k}' for k, v in stats.items())})" if stats else ""
+    print(f"  Saved {len(papers)} papers to the {store.name} paper store{detail}")
+    if getattr(store, "compacted", False):
+        print("  Compacted the change log into the snapshot.")
+    return True
+
 
-    # Sort by published date descending
-    merged = sorted(
-        filtered,
-        key=lambda p: p.get("published", ""),
-        reverse=True,
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Fetch Gaussian Splatting papers from arXiv.")
+    parser.add_argument(
+        "--full", action="store_true",
+        help="ignore the harvest watermark and page back to MIN_PUBLISHED_YEAR (re-sync)",
     )
-    if MAX_PAPERS and len(merged) > MAX_PAPERS:
-        removed_oldest = len(merged) - MAX_PAPERS
-        merged = merged[:MAX_PAPERS]
-        print(f"  Trimmed {removed_oldest} oldest papers to keep {MAX_PAPERS}.")
-    return merged, added_ids
-
-
-def save_papers(papers: list[dict]) -> None:
-    """Save papers list to JSON file."""
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    data = {
-        "last_updated": datetime.now(timezone.utc).isoformat(),
-        "total_count": len(papers),
-        "papers": papers,
-    }
-    with open(PAPERS_JSON, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    print(f"  Saved {len(papers)} papers to {PAPERS_JSON}")
+    parser.add_argument(
+        "--sharded", action="store_true",
+        help="re-sync as concurrent submittedDate-window sub-queries (backfills past MAX_TOTAL_RESULTS)",
+    )
+    parser.add_argument(
+        "--async", dest="use_async", action="store_true",
+        help="overlap paging, merging, figure fetching and saving (see async_fetch.py)",
+    )
+    args = parser.parse_args(argv)
+    if args.use_async and args.sharded:
+        parser.error("--async cannot be combined with --sharded")
+    return args
 
 
-def main():
+def main(argv: list[str] | None = None) -> dict:
+    """Fetch, merge and save; return the saved corpus as PaperStore.load() would."""
+    args = parse_args(argv)
     print("=" * 60)
     print("Fetching Gaussian Splatting papers from arXiv")
     print("=" * 60)
 
-    existing_data = load_existing_papers()
-    existing_papers = existing_data.get("papers", [])
-    print(f"Existing papers: {len(existing_papers)}")
-
-    print("\nFetching from arXiv API...")
-    new_papers = fetch_arxiv_papers()
+    report = get_report()
+    with report.stage("load"):
+        existing_data = load_existing_papers()
+        existing_papers = existing_data.get("papers", [])
+        print(f"Existing papers: {len(existing_papers)}")
+        watermark = HarvestWatermark.load()
+
+    full = args.full or args.sharded or not existing_papers
+    mode = "sharded re-sync" if args.sharded else "full re-sync" if full else "incremental"
+    if args.use_async:
+        from async_fetch import AsyncFetch
+
+        print(f"\nFetching from arXiv API ({mode}, async)...")
+        with report.stage("async"):
+            corpus = AsyncFetch(sys.modules[__name__], existing_papers, watermark, full).run()
+        close_http_cache()
+        close_http_fixtures()
+        close_session_pool()
+        print("\nDone!")
+        return corpus
+
+    print(f"\nFetching from arXiv API ({mode})...")
+    with report.stage("fetch"):
+        if args.sharded:
+            new_papers = harvest_sharded(watermark)
+        else:
+            new_papers = fetch_arxiv_papers(watermark, full=full)
     print(f"Fetched {len(new_papers)} papers from arXiv.\n")
 
     print("Merging papers...")
-    merged, added_ids = merge_papers(existing_papers, new_papers)
+    with report.stage("merge"):
+        author_index = load_author_index(AUTHOR_INDEX_JSON)
+        result = merge_papers(existing_papers, new_papers, author_index)
+        merged = result.papers
 
     if FETCH_METHOD_FIGURES:
-        enrich_method_figures(merged, set(added_ids))
+        with report.stage("figures"):
+            enrich_method_figures(merged, result.added)
 
     print("Saving...")
-    save_papers(merged)
+    with report.stage("save"):
+        save_papers(merged)
+        author_index.save(AUTHOR_INDEX_JSON)
+        watermark.save()
+        corpus = get_paper_store().corpus(merged)
+    close_paper_store()
+    close_http_cache()
+    close_http_fixtures()
+    close_session_pool()
 
     print("\nDone!")
+    return corpus
 
 
 if __name__ == "__main__":
-    main()
+    with run_report("fetch_papers"):
+        main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+File helpers shared by the pipeline's writers (site build, paper store,
+author index, HTTP cache).
+"""
+from __future__ import annotations
+
+import contextlib
+import os
+import tempfile
+from pathlib import Path
+
+
+def _read_umask() -> int:
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+# Mode open() gives a new file. mkstemp creates its temp file 0600 and
+# os.replace keeps that mode, so atomic writers chmod to this before the
+# rename. The umask can only be read by setting it, so that happens once,
+# at import, before any writer thread exists.
+FILE_MODE = 0o666 & ~_read_umask()
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write to a temp file in the same directory, then rename over the target."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, FILE_MODE)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
@@ -1,101 +1,124 @@
 #!/usr/bin/env python3
 """
-Generate RSS 2.0 feed from papers.json.
+Generate the site's feeds from the paper store (papers.json by default).
+
+The global feed and one feed per tag are filled in a single pass over the
+papers and written as RSS 2.0, Atom and JSON Feed (see feeds.py). A feed whose
+items did not change since the last run is not rendered again.
 """
 
-import json
-from datetime import datetime
-from email.utils import format_datetime
 from pathlib import Path
-from xml.etree.ElementTree import Element, SubElement, tostring
+
+from assets import BROTLI_BULK_QUALITY, BROTLI_QUALITY, BuildState, source_version, write_manifest
+from feeds import RENDERERS, Feed, fill_feeds, items_digest, tag_slug
+from instrumentation import get_report, run_report
+from paper_model import compact_corpus
+from paper_store import open_store
 
 ROOT = Path(__file__).resolve().parent.parent
 DATA_DIR = ROOT / "data"
 DIST_DIR = ROOT / "dist"
-PAPERS_JSON = DATA_DIR / "papers.json"
 RSS_FILE = DIST_DIR / "feed.xml"
+ATOM_NAME = "atom.xml"        # global feeds sit next to feed.xml
+JSON_FEED_NAME = "feed.json"
+TAG_FEED_DIR = "feeds"        # per-tag feeds: feeds/<slug>.xml, .atom.xml, .json
+SCRIPTS_DIR = ROOT / "scripts"
 
 SITE_URL = "https://yourusername.github.io/Awesome-Gaussian-Splatting"
 FEED_TITLE = "Awesome Gaussian Splatting Latest Papers"
 FEED_DESCRIPTION = "Daily updated feed of the latest Gaussian Splatting papers from arXiv."
-MAX_ITEMS = 50
-
-
-def iso_to_rfc822(iso_str: str) -> str:
-    """Convert ISO 8601 datetime string to RFC 822 format for RSS."""
-    try:
-        dt = datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
-        return format_datetime(dt)
-    except (ValueError, AttributeError):
-        return ""
-
-
-def generate_rss():
+MAX_ITEMS = 50  # per feed
+
+
+def collect_feeds(papers: list[dict]) -> list[Feed]:
+    """Global feed first, then one feed per tag (by name), filled in one pass."""
+    # feed.xml keeps a stable name (subscribers poll it)
+    rss_rel = RSS_FILE.relative_to(DIST_DIR).as_posix()
+    everything = Feed("all", FEED_TITLE, FEED_DESCRIPTION, MAX_ITEMS)
+    everything.files = {"rss": rss_rel, "atom": ATOM_NAME, "json": JSON_FEED_NAME}
+    slugs: set[str] = set()
+
+    def make_tag_feed(tag: str) -> Feed:
+        slug = stem = tag_slug(tag)
+        while slug in slugs:  # two tags with the same slug
+            slug = f"{stem}-{len(slugs)}"
+        slugs.add(slug)
+        feed = Feed(slug, f"{FEED_TITLE}: {tag}",
+                    f"Latest Gaussian Splatting papers on arXiv tagged {tag}.", MAX_ITEMS, tag=tag)
+        base = f"{TAG_FEED_DIR}/{slug}"
+        feed.files = {"rss": f"{base}.xml", "atom": f"{base}.atom.xml", "json": f"{base}.json"}
+        return feed
+
+    by_tag = fill_feeds(papers, everything, make_tag_feed)
+    return [everything] + [by_tag[tag] for tag in sorted(by_tag)]
+
+
+def generate_rss(data: dict | None = None):
+    """Write the feeds; ``data`` is the corpus when the caller already loaded it."""
     print("=" * 60)
-    print("Generating RSS feed")
+    print("Generating feeds")
     print("=" * 60)
 
-    with open(PAPERS_JSON, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    papers = data.get("papers", [])[:MAX_ITEMS]
-    print(f"  Including {len(papers)} papers in RSS feed")
-
-    # Build RSS XML
-    rss = Element("rss", version="2.0")
-    rss.set("xmlns:atom", "http://www.w3.org/2005/Atom")
-    channel = SubElement(rss, "channel")
-
-    SubElement(channel, "title").text = FEED_TITLE
-    SubElement(channel, "link").text = SITE_URL
-    SubElement(channel, "description").text = FEED_DESCRIPTION
-    SubElement(channel, "language").text = "en-us"
+    report = get_report()
+    store = open_store(data_dir=DATA_DIR)
+    state = BuildState(DIST_DIR, "rss")
+    state.add_input("papers", store.revision().encode("utf-8"))
+    state.inputs["rss_version"] = source_version(
+        SCRIPTS_DIR / "generate_rss.py", SCRIPTS_DIR / "feeds.py", SCRIPTS_DIR / "assets.py",
+        SCRIPTS_DIR / "paper_model.py")
+    if state.is_fresh():
+        store.close()
+        report.count("build.skipped_fresh")
+        print("  Paper store unchanged since the last run; feeds are up to date.")
+        return
+
+    with report.stage("load"):
+        if data is None:
+            data = store.load()
+        papers = compact_corpus(data).get("papers", [])
+    store.close()
+
+    with report.stage("collect"):
+        feeds = collect_feeds(papers)
+    print(f"  {len(feeds)} feeds (global + {len(feeds) - 1} tags), up to {MAX_ITEMS} items each")
 
     last_updated = data.get("last_updated", "")
-    if last_updated:
-        SubElement(channel, "lastBuildDate").text = iso_to_rfc822(last_updated)
-
-    # Self-referencing atom link
-    atom_link = SubElement(channel, "atom:link")
-    atom_link.set("href", f"{SITE_URL}/feed.xml")
-    atom_link.set("rel", "self")
-    atom_link.set("type", "application/rss+xml")
-
-    for paper in papers:
-        item = SubElement(channel, "item")
-        SubElement(item, "title").text = paper.get("title", "")
-        SubElement(item, "link").text = paper.get("abs_url", "")
-        SubElement(item, "guid").text = paper.get("abs_url", "")
-
-        # Truncate abstract to 500 chars for description
-        abstract = paper.get("abstract", "")
-        if len(abstract) > 500:
-            abstract = abstract[:497] + "..."
-        SubElement(item, "description").text = abstract
-
-        pub_date = paper.get("published", "")
-        if pub_date:
-            SubElement(item, "pubDate").text = iso_to_rfc822(pub_date)
-
-        # Add categories/tags
-        for tag in paper.get("tags", []):
-            SubElement(item, "category").text = tag
-
-        # Authors
-        authors = paper.get("authors", [])
-        if authors:
-            SubElement(item, "author").text = ", ".join(authors[:5])
-            if len(authors) > 5:
-                SubElement(item, "author").text = ", ".join(authors[:5]) + " et al."
-
-    # Write XML
-    DIST_DIR.mkdir(parents=True, exist_ok=True)
-    xml_declaration = '<?xml version="1.0" encoding="UTF-8"?>\n'
-    xml_body = tostring(rss, encoding="unicode")
-    RSS_FILE.write_text(xml_declaration + xml_body, encoding="utf-8")
-    print(f"  Generated {RSS_FILE}")
-    print("\nRSS generation complete!")
+    manifest: dict[str, dict] = {}
+    rendered = skipped = 0
+    for feed in feeds:
+        digest = items_digest(feed, state.inputs["rss_version"])
+        label = feed.tag or "all papers"
+        if state.keep(feed.files.values(), items=digest):
+            skipped += 1
+            print(f"  {label}: {len(feed.papers)} items unchanged, skipped")
+        else:
+            with report.stage("render"):
+                outputs = {fmt: render(feed, SITE_URL, last_updated) for fmt, render in RENDERERS.items()}
+            # Max brotli only for the global feed; per-tag feeds are many and small
+            quality = BROTLI_BULK_QUALITY if feed.tag else BROTLI_QUALITY
+            with report.stage("write"):
+                for fmt, data_bytes in outputs.items():
+                    state.write(feed.files[fmt], data_bytes, quality)["items"] = digest
+            rendered += 1
+            report.count("feed.items", len(feed.papers))
+            print(f"  {label}: {len(feed.papers)} items -> {', '.join(feed.files.values())}")
+        for rel in feed.files.values():
+            entry = {k: v for k, v in state.outputs[rel].items() if k != "items"}
+            manifest[rel] = {"file": rel, **entry}
+
+    with report.stage("write"):
+        write_manifest(DIST_DIR, "rss", manifest)
+        state.remove_stale()
+        state.save()
+    report.count("feeds.rendered", rendered)
+    report.count("feeds.skipped", skipped)
+    report.count("outputs.written", state.written)
+    report.count("outputs.unchanged", state.unchanged)
+    report.count("outputs.bytes", sum(entry["bytes"] for entry in manifest.values()))
+    print(f"  {rendered} feeds rendered, {skipped} skipped ({state.summary()})")
+    print("\nFeed generation complete!")
 
 
 if __name__ == "__main__":
-    generate_rss()
+    with run_report("generate_rss"):
+        generate_rss()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Streaming HTML scanners for arXiv pages (html.parser events, no DOM).
+
+FigureScanner mirrors the BeautifulSoup path in fetch_papers: candidates are
+<figure> elements in document order, or, on pages without any <figure>,
+elements whose class contains "figure". Each candidate contributes its first
+<img> with a valid source (else its first <object data>), the text of its
+first <figcaption> (else of its first element with a "caption" class) and
+the image's alt text. Scoring, source picking and validation are injected,
+so the heuristics stay in one place. Unclosed tags are closed the way
+BeautifulSoup's html.parser builder closes them: an end tag closes
+everything opened since the matching start tag, and a stray end tag is
+ignored.
+
+LinkScanner finds the "HTML (experimental)" link on an abstract page and
+stops at the first match.
+"""
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+from typing import Callable, Iterable
+from urllib.parse import urljoin
+
+# Same void elements as BeautifulSoup's HTML tree builders
+VOID_ELEMENTS = frozenset((
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen", "link", "menuitem",
+    "meta", "param", "source", "track", "wbr", "basefont", "bgsound", "command", "frame",
+    "image", "isindex", "nextid", "spacer",
+))
+FIGURE_CLASS_RE = re.compile("figure", re.IGNORECASE)
+CAPTION_CLASS_RE = re.compile("caption", re.IGNORECASE)
+FEED_CHUNK = 64 * 1024
+
+
+class StopScan(Exception):
+    """Raised from a handler once the scanner has its answer."""
+
+
+class _Candidate:
+    __slots__ = ("index", "depth", "is_figure", "img_src", "alt", "object_seen", "object_src",
+                 "figcaption", "figcaption_depth", "class_caption", "class_caption_depth")
+
+    def __init__(self, index: int, depth: int, is_figure: bool):
+        self.index = index
+        self.depth = depth
+        self.is_figure = is_figure
+        self.img_src: str | None = None   # first <img> with a valid source
+        self.alt = ""
+        self.object_seen = False
+        self.object_src: str | None = None  # data of the first <object>, if valid
+        self.figcaption: list[str] | None = None
+        self.figcaption_depth = 0       # >0 while the caption element is open
+        self.class_caption: list[str] | None = None
+        self.class_caption_depth = 0
+
+
+class _ScannerBase(HTMLParser):
+    """Open-element stack with BeautifulSoup-like closing and merged text nodes."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack: list[str] = []
+        self._text: list[str] = []
+
+    # Text arrives in pieces when a node spans feed() chunks; merge it so each
+    # text node is stripped once, like one NavigableString.
+    def handle_data(self, data: str) -> None:
+        self._text.append(data)
+
+    def _flush_text(self) -> None:
+        if self._text:
+            text = "".join(self._text)
+            self._text.clear()
+            self.on_text(text)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._flush_text()
+        attr_map = {name: value or "" for name, value in attrs}
+        if tag in VOID_ELEMENTS:
+            self.on_start(tag, attr_map, len(self.stack) + 1, void=True)
+            return
+        self.stack.append(tag)
+        self.on_start(tag, attr_map, len(self.stack), void=False)
+
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._flush_text()
+        attr_map = {name: value or "" for name, value in attrs}
+        self.on_start(tag, attr_map, len(self.stack) + 1, void=True)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush_text()
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i] == tag:
+                del self.stack[i:]
+                self.on_close(i)
+                return
+
+    def handle_comment(self, data: str) -> None:
+        self._flush_text()
+
+    def scan(self, chunks: Iterable[str]) -> None:
+        """Feed chunks until the input ends or a handler raises StopScan."""
+        try:
+            for chunk in chunks:
+                self.feed(chunk)
+            self.close()
+            self._flush_text()
+            self.on_close(0)
+        except StopScan:
+            pass
+
+    def on_start(self, tag: str, attrs: dict[str, str], depth: int, void: bool) -> None:
+        pass
+
+    def on_text(self, text: str) -> None:
+        pass
+
+    def on_close(self, depth: int) -> None:
+        """Every element deeper than ``depth`` has just been closed."""
+
+
+def iter_chunks(text: str, size: int = FEED_CHUNK) -> Iterable[str]:
+    for start in range(0, len(text), size):
+        yield text[start:start + size]
+
+
+class FigureScanner(_ScannerBase):
+    """Pick the best-scoring figure of an arXiv HTML paper in one streaming pass.
+
+    With ``stop_score`` set, scanning stops as soon as a closed <figure>
+    reaches that score; otherwise the whole page is scanned and the result
+    matches the BeautifulSoup path.
+    """
+
+    def __init__(self, score: Callable[[str, int], float], valid_src: Callable[[str], bool],
+                 pick_src: Callable[[dict], str | None], stop_score: float | None = None):
+        super().__init__()
+        self.score = score
+        self.valid_src = valid_src
+        self.pick_src = pick_src
+        self.stop_score = stop_score
+        self.open: list[_Candidate] = []
+        self.figure_count = 0
+        self.class_count = 0
+        # (score, -index, src, caption) per mode; figures win whenever any exist
+        self.best_figure: tuple | None = None
+        self.best_class: tuple | None = None
+        self.stopped_early = False
+
+    def on_start(self, tag: str, attrs: dict[str, str], depth: int, void: bool) -> None:
+        for cand in self.open:
+            if tag == "img":
+                if cand.img_src is None:
+                    src = self.pick_src(attrs)
+                    if src and self.valid_src(src):
+                        cand.img_src, cand.alt = src, attrs.get("alt", "")
+            elif tag == "object" and not cand.object_seen:
+                # Only the first <object> counts, and only without a valid <img>
+                cand.object_seen = True
+                data = attrs.get("data")
+                if data and self.valid_src(data):
+                    cand.object_src = data
+            # A void caption element still counts as "the" caption (empty text)
+            if tag == "figcaption" and cand.figcaption is None:
+                cand.figcaption, cand.figcaption_depth = [], 0 if void else depth
+            if cand.class_caption is None and CAPTION_CLASS_RE.search(attrs.get("class", "")):
+                cand.class_caption, cand.class_caption_depth = [], 0 if void else depth
+
+        if tag == "figure":
+            self._open(_Candidate(self.figure_count, depth, True), void)
+            self.figure_count += 1
+        elif not self.figure_count and FIGURE_CLASS_RE.search(attrs.get("class", "")):
+            # Only used when the page has no <figure> at all
+            self._open(_Candidate(self.class_count, depth, False), void)
+            self.class_count += 1
+
+    def _open(self, cand: _Candidate, void: bool) -> None:
+        if void:
+            self._finish(cand)
+        else:
+            self.open.append(cand)
+
+    def on_text(self, text: str) -> None:
+        text = text.strip()
+        if not text:
+            return
+        for cand in self.open:
+            if cand.figcaption_depth:
+                cand.figcaption.append(text)
+            if cand.class_caption_depth:
+                cand.class_caption.append(text)
+
+    def on_close(self, depth: int) -> None:
+        for cand in self.open:
+            if cand.figcaption_depth > depth:
+                cand.figcaption_depth = 0
+            if cand.class_caption_depth > depth:
+                cand.class_caption_depth = 0
+        # Open candidates are nested, so their depths increase along the list
+        while self.open and self.open[-1].depth > depth:
+            self._finish(self.open.pop())
+
+    def _finish(self, cand: _Candidate) -> None:
+        src, alt = (cand.img_src, cand.alt) if cand.img_src else (cand.object_src, "")
+        if not src:
+            return
+        parts = cand.figcaption if cand.figcaption is not None else cand.class_caption
+        caption = " ".join(parts) if parts else ""
+        if not caption and not alt:
+            return
+        key = (self.score(f"{caption} {alt}", cand.index), -cand.index, src, caption)
+        if cand.is_figure:
+            if self.best_figure is None or key[:2] > self.best_figure[:2]:
+                self.best_figure = key
+            if self.stop_score is not None and self.best_figure[0] >= self.stop_score:
+                self.stopped_early = True
+                raise StopScan
+        elif self.best_class is None or key[:2] > self.best_class[:2]:
+            self.best_class = key
+
+    def has_result(self) -> bool:
+        """True once some figure qualifies (a later one may still score higher)."""
+        return (self.best_figure if self.figure_count else self.best_class) is not None
+
+    def result(self) -> tuple[str | None, str | None]:
+        """(image src as written in the page, caption) of the best figure, or (None, None)."""
+        best = self.best_figure if self.figure_count else self.best_class
+        if best is None:
+            return None, None
+        return best[2], best[3].strip() or None
+
+
+class LinkScanner(_ScannerBase):
+    """First <a href> on an abstract page that points at the HTML rendering."""
+
+    def __init__(self, base_url: str):
+        super().__init__()
+        self.base_url = base_url
+        self.found: str | None = None
+        self._anchor: tuple[str, int, list[str]] | None = None  # (href, depth, label parts)
+
+    def on_start(self, tag: str, attrs: dict[str, str], depth: int, void: bool) -> None:
+        if tag != "a" or "href" not in attrs:
+            return
+        href = attrs["href"]
+        href_l = href.lower()
+        if "/html/" in href_l or "format=html" in href_l:
+            self._found(href)
+        # Otherwise the label decides, once the anchor closes
+        if "html" in href_l and self._anchor is None and not void:
+            self._anchor = (href, depth, [])
+
+    def on_text(self, text: str) -> None:
+        if self._anchor is not None and text.strip():
+            self._anchor[2].append(text.strip())
+
+    def on_close(self, depth: int) -> None:
+        if self._anchor is not None and self._anchor[1] > depth:
+            href, _, label = self._anchor
+            self._anchor = None
+            if "html" in " ".join(label).lower():
+                self._found(href)
+
+    def _found(self, href: str) -> None:
+        self.found = urljoin(self.base_url, href)
+        raise StopScan
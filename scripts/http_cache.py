@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+On-disk HTTP response cache for arXiv pages.
+
+Layout under the cache root:
+  objects/ab/<sha256>   response bodies, content-addressed (shared by URLs
+                        that return identical bytes)
+  meta/cd/<sha1>.json   one record per cache key: url, status, validators
+                        (ETag / Last-Modified), body hash, fetch and last-use
+                        times, or a negative marker ("404", "no-html", ...)
+
+Fresh entries (younger than the TTL) are served without a request; stale
+ones are revalidated with If-None-Match / If-Modified-Since, so an unchanged
+page costs a 304. A body read only up to an early stop is stored as a
+partial entry (the prefix that was read); only streaming readers that can
+work from a prefix ask for those. prune() drops expired negative entries and evicts the
+least recently used entries once the bodies exceed the size budget.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from file_io import atomic_write
+
+NEGATIVE_STATUS = {404, 410}
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def build_response(url: str, status: int, body: bytes = b"", headers: dict | None = None,
+                   encoding: str | None = None) -> requests.Response:
+    """A requests.Response rebuilt from cached parts (body already read)."""
+    resp = requests.Response()
+    resp.url = url
+    resp.status_code = status
+    resp.headers = CaseInsensitiveDict(headers or {})
+    resp.encoding = encoding
+    resp._content = body
+    resp._content_consumed = True
+    resp.from_cache = False
+    resp.partial = False  # True for a cached prefix of the page (see HttpCache.store)
+    return resp
+
+
+class HttpCache:
+    """Content-addressed response cache with per-key metadata; thread-safe."""
+
+    def __init__(self, root: Path, ttl: float, negative_ttl: float, max_bytes: int):
+        self.root = root
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "negative_hits": 0, "stored": 0}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def cache_key(url: str, params: dict | None = None) -> str:
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()), doseq=True)}"
+
+    def _meta_path(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.root / "meta" / digest[:2] / f"{digest}.json"
+
+    def _object_path(self, sha: str) -> Path:
+        return self.root / "objects" / sha[:2] / sha
+
+    def count(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    def lookup(self, key: str, partial_ok: bool = False) -> dict | None:
+        """Return the metadata record for a key, or None (also when its body is gone).
+
+        Partial entries count as missing unless ``partial_ok``.
+        """
+        try:
+            meta = json.loads(self._meta_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if meta.get("key") != key or (meta.get("partial") and not partial_ok):
+            return None
+        if meta.get("sha256") and not self._object_path(meta["sha256"]).exists():
+            return None
+        return meta
+
+    def _save_meta(self, meta: dict) -> None:
+        atomic_write(self._meta_path(meta["key"]), json.dumps(meta, sort_keys=True).encode("utf-8"))
+
+    def is_fresh(self, meta: dict) -> bool:
+        ttl = self.negative_ttl if meta.get("negative") else self.ttl
+        return time.time() - meta.get("fetched_at", 0) < ttl
+
+    def conditional_headers(self, meta: dict | None) -> dict[str, str]:
+        """If-None-Match / If-Modified-Since for revalidating a stale entry."""
+        if not meta or meta.get("negative"):
+            return {}
+        headers = {}
+        stored = meta.get("headers", {})
+        if stored.get("ETag"):
+            headers["If-None-Match"] = stored["ETag"]
+        if stored.get("Last-Modified"):
+            headers["If-Modified-Since"] = stored["Last-Modified"]
+        return headers
+
+    def response(self, meta: dict) -> requests.Response:
+        """Rebuild the cached response and mark the entry as recently used."""
+        meta["used_at"] = time.time()
+        self._save_meta(meta)
+        if meta.get("negative"):
+            resp = build_response(meta["url"], meta.get("status", 404))
+        else:
+            body = self._object_path(meta["sha256"]).read_bytes()
+            resp = build_response(meta["url"], meta["status"], body, meta.get("headers"), meta.get("encoding"))
+        resp.from_cache = True
+        resp.partial = bool(meta.get("partial"))
+        return resp
+
+    def hit(self, meta: dict) -> requests.Response:
+        self.count("negative_hits" if meta.get("negative") else "hits")
+        return self.response(meta)
+
+    def revalidated(self, meta: dict, resp: requests.Response) -> requests.Response:
+        """Handle a 304: refresh the entry's validators and fetch time, serve the stored body."""
+        self.count("revalidated")
+        resp.close()
+        for name in KEPT_HEADERS[1:]:
+            if resp.headers.get(name):
+                meta.setdefault("headers", {})[name] = resp.headers[name]
+        meta["fetched_at"] = time.time()
+        return self.response(meta)
+
+    def store(self, key: str, resp: requests.Response, body: bytes | None = None,
+              partial: bool = False) -> None:
+        """Cache a 200 body, or a 404/410 as a negative entry; other statuses are ignored.
+
+        Streaming readers pass the bytes they read as ``body``; ``partial`` marks
+        it as a prefix of the page.
+        """
+        now = time.time()
+        if resp.status_code in NEGATIVE_STATUS:
+            self.store_negative(key, resp.url or key, str(resp.status_code), status=resp.status_code)
+            return
+        if resp.status_code != 200:
+            return
+        if body is None:
+            body = resp.content
+        sha = hashlib.sha256(body).hexdigest()
+        obj = self._object_path(sha)
+        if not obj.exists():
+            atomic_write(obj, body)
+        meta = {
+            "key": key,
+            "url": resp.url or key,
+            "status": 200,
+            "sha256": sha,
+            "bytes": len(body),
+            "encoding": resp.encoding,
+            "headers": {k: resp.headers[k] for k in KEPT_HEADERS if resp.headers.get(k)},
+            "fetched_at": now,
+            "used_at": now,
+        }
+        if partial:
+            meta["partial"] = True
+        self._save_meta(meta)
+        self.count("stored")
+
+    def store_negative(self, key: str, url: str, reason: str, status: int = 404) -> None:
+        """Remember that a key has nothing useful (404, no HTML version, ...) for negative_ttl."""
+        now = time.time()
+        self._save_meta({"key": key, "url": url, "status": status, "negative": reason,
+                         "fetched_at": now, "used_at": now})
+
+    def is_negative(self, key: str) -> bool:
+        """True (and counted as a hit) when a fresh negative entry exists for the key."""
+        meta = self.lookup(key)
+        if meta and meta.get("negative") and self.is_fresh(meta):
+            self.count("negative_hits")
+            return True
+        return False
+
+    def prune(self) -> dict[str, int]:
+        """Drop expired negatives and orphaned bodies; evict LRU entries over max_bytes."""
+        metas: list[tuple[Path, dict]] = []
+        removed = evicted = 0
+        for path in (self.root / "meta").glob("*/*.json"):
+            try:
+                meta = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                path.unlink(missing_ok=True)
+                removed += 1
+                continue
+            if meta.get("negative") and not self.is_fresh(meta):
+                path.unlink(missing_ok=True)
+                removed += 1
+                continue
+            metas.append((path, meta))
+
+        objects = {p.name: p for p in (self.root / "objects").glob("*/*") if not p.name.startswith(".")}
+        refs: dict[str, int] = {}
+        for _, meta in metas:
+            if meta.get("sha256"):
+                refs[meta["sha256"]] = refs.get(meta["sha256"], 0) + 1
+        for sha in objects.keys() - refs.keys():
+            objects.pop(sha).unlink(missing_ok=True)
+            removed += 1
+
+        total = sum(p.stat().st_size for p in objects.values())
+        metas.sort(key=lambda item: item[1].get("used_at", 0))
+        for path, meta in metas:
+            if total <= self.max_bytes:
+                break
+            sha = meta.get("sha256")
+            if not sha:
+                continue  # negative entries hold no body
+            path.unlink(missing_ok=True)
+            evicted += 1
+            refs[sha] -= 1
+            if refs[sha] == 0 and sha in objects:
+                total -= objects[sha].stat().st_size
+                objects.pop(sha).unlink(missing_ok=True)
+        return {"removed": removed, "evicted": evicted, "bytes": total}
+
+    def summary(self) -> str:
+        s = self.stats
+        return (f"{s['hits']} fresh hits, {s['revalidated']} revalidated (304), "
+                f"{s['negative_hits']} negative hits, {s['misses']} misses, {s['stored']} stored")
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP session layer for arXiv requests.
+Keeps pooled keep-alive sessions per route (direct / proxy) and host, and
+the process-wide rate limiter every request waits on.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+ROUTE_DIRECT = "direct"   # ignore proxy settings from the environment
+ROUTE_PROXY = "proxy"     # use proxy settings from the environment
+ROUTES = (ROUTE_DIRECT, ROUTE_PROXY)
+
+CONNECTION_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+
+def url_host(url: str) -> str:
+    """Return the lowercase host[:port] of a URL."""
+    return urlsplit(url).netloc.lower()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date), or None."""
+    value = (value or "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, up to ``burst`` stored."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block until a token is available; return the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+class HostRateLimiter:
+    """Process-wide limiter: one token bucket per configured host, plus holds.
+
+    A ``"*"`` entry in ``limits`` is a budget shared by every request on top
+    of the per-host buckets; hosts without an entry are otherwise unlimited.
+    ``defer`` puts a host on hold (Retry-After, backoff): every thread
+    waiting on that host sleeps until the hold ends, so one 429 slows down
+    all callers instead of only the one that received it.
+    """
+
+    def __init__(self, limits: dict[str, tuple[float, int]]):
+        self._buckets = {
+            host.lower(): TokenBucket(rate, burst) for host, (rate, burst) in limits.items()
+        }
+        self._global = self._buckets.pop("*", None)
+        self._holds: dict[str, float] = {}  # host -> monotonic time the hold ends
+        self._lock = threading.Lock()
+
+    def defer(self, url: str, seconds: float) -> None:
+        """Hold every request to the URL's host for at least ``seconds``."""
+        host = url_host(url)
+        until = time.monotonic() + seconds
+        with self._lock:
+            self._holds[host] = max(self._holds.get(host, 0.0), until)
+
+    def _wait_hold(self, host: str) -> float:
+        waited = 0.0
+        while True:
+            with self._lock:
+                remaining = self._holds.get(host, 0.0) - time.monotonic()
+                if remaining <= 0:
+                    self._holds.pop(host, None)
+                    return waited
+            time.sleep(remaining)
+            waited += remaining
+
+    def acquire(self, url: str) -> float:
+        """Wait out holds and buckets for the URL's host; return the seconds spent waiting."""
+        host = url_host(url)
+        waited = self._wait_hold(host)
+        bucket = self._buckets.get(host)
+        if bucket is not None:
+            waited += bucket.acquire()
+        if self._global is not None:
+            waited += self._global.acquire()
+        return waited
+
+
+class SessionPool:
+    """Pooled keep-alive sessions, one per (route, host).
+
+    Each session mounts an adapter that blocks once ``pool_maxsize``
+    connections to its host are in use, which caps per-host concurrency.
+    The pool remembers which route last worked for each host and tries
+    that route first on the next request.
+    """
+
+    def __init__(self, user_agent: str, pool_maxsize: int = 4):
+        self.user_agent = user_agent
+        self.pool_maxsize = pool_maxsize
+        self._sessions: dict[tuple[str, str], requests.Session] = {}
+        self._preferred: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def session(self, route: str, host: str) -> requests.Session:
+        """Return the shared session for a route/host, creating it on first use."""
+        key = (route, host)
+        with self._lock:
+            sess = self._sessions.get(key)
+            if sess is None:
+                sess = requests.Session()
+                sess.headers["User-Agent"] = self.user_agent
+                # Direct sessions must not pick up HTTP(S)_PROXY from the env
+                sess.trust_env = route == ROUTE_PROXY
+                adapter = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=self.pool_maxsize,
+                    pool_block=True,
+                )
+                sess.mount("http://", adapter)
+                sess.mount("https://", adapter)
+                self._sessions[key] = sess
+            return sess
+
+    def route_order(self, host: str) -> tuple[str, ...]:
+        """Routes to try for a host, last known-good route first."""
+        preferred = self._preferred.get(host)
+        if preferred is None:
+            return ROUTES
+        return (preferred,) + tuple(r for r in ROUTES if r != preferred)
+
+    def preferred_route(self, host: str) -> str | None:
+        return self._preferred.get(host)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET through the preferred route, falling back to the other on connection errors."""
+        host = url_host(url)
+        last_exc: Exception | None = None
+        for route in self.route_order(host):
+            try:
+                resp = self.session(route, host).get(url, **kwargs)
+            except CONNECTION_ERRORS as exc:
+                last_exc = exc
+                continue
+            if self._preferred.get(host) != route:
+                with self._lock:
+                    self._preferred[host] = route
+            return resp
+        assert last_exc is not None
+        raise last_exc
+
+    def close(self) -> None:
+        """Close every pooled session and forget remembered routes."""
+        with self._lock:
+            for sess in self._sessions.values():
+                sess.close()
+            self._sessions.clear()
+            self._preferred.clear()
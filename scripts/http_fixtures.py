@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Record / replay fixtures for http_get.
+
+  record  every response http_get returns (API pages, abs pages, HTML pages)
+          is saved under the fixture directory
+  replay  http_get answers from the fixture directory and never touches the
+          network; a request that was not recorded raises FixtureMissingError
+
+Each response is two files named after a hash of the request key (URL plus
+sorted query parameters): <hash>.json with url, status, headers and encoding,
+and <hash>.body with the decoded body bytes. ``latency`` makes replay wait
+that many seconds per response, standing in for the network when replayed
+runs are timed.
+"""
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import time
+from pathlib import Path
+
+import requests
+
+from http_cache import HttpCache, build_response
+
+MODES = ("record", "replay")
+DROPPED_HEADERS = ("Content-Encoding", "Content-Length", "Transfer-Encoding")  # body is stored decoded
+
+
+class FixtureMissingError(requests.exceptions.ConnectionError):
+    """Replay mode was asked for a request that was never recorded."""
+
+
+class HttpFixtures:
+    def __init__(self, root: Path, mode: str, latency: float = 0.0):
+        if mode not in MODES:
+            raise ValueError(f"Unknown fixture mode {mode!r} (expected 'record' or 'replay')")
+        self.root = root
+        self.mode = mode
+        self.latency = latency
+        self.recorded = 0
+        self.replayed = 0
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        stem = hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]
+        return self.root / f"{stem}.json", self.root / f"{stem}.body"
+
+    def record(self, url: str, params: dict | None, resp: requests.Response) -> requests.Response:
+        """Save a live response; return an equivalent one whose body can still be read."""
+        key = HttpCache.cache_key(url, params)
+        body = resp.content  # reads a streamed body in full
+        headers = {k: v for k, v in resp.headers.items() if k not in DROPPED_HEADERS}
+        meta_path, body_path = self._paths(key)
+        self.root.mkdir(parents=True, exist_ok=True)
+        body_path.write_bytes(body)
+        meta = {"key": key, "url": resp.url or url, "status": resp.status_code,
+                "headers": headers, "encoding": resp.encoding}
+        meta_path.write_text(json.dumps(meta, indent=2, sort_keys=True), encoding="utf-8")
+        self.recorded += 1
+        return self._response(meta, body)
+
+    def replay(self, url: str, params: dict | None = None) -> requests.Response:
+        key = HttpCache.cache_key(url, params)
+        meta_path, body_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except FileNotFoundError:
+            raise FixtureMissingError(f"No recorded response for {key} in {self.root}") from None
+        if self.latency:
+            time.sleep(self.latency)
+        self.replayed += 1
+        return self._response(meta, body)
+
+    @staticmethod
+    def _response(meta: dict, body: bytes) -> requests.Response:
+        resp = build_response(meta["url"], meta["status"], body, meta.get("headers"), meta.get("encoding"))
+        resp.raw = io.BytesIO(body)  # streaming callers read resp.raw
+        return resp
+
+    def summary(self) -> str:
+        if self.replaying:
+            return f"replayed {self.replayed} responses from {self.root}"
+        return f"recorded {self.recorded} responses to {self.root}"
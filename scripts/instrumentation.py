@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Lightweight run instrumentation shared by the pipeline scripts.
+
+Each script wraps its entry point in ``run_report(name)``; code inside calls
+``get_report()`` to record:
+
+  stages    wall and CPU seconds per named stage (``with report.stage("fetch")``)
+  counters  integer counts: HTTP requests per status, bytes, retries, cache
+            hits, papers added / updated / dropped, outputs written, ...
+  timers    accumulated seconds that are not stages: HTTP latency, backoff
+            sleeps, rate-limit waits, request delays
+
+At exit the report is written to .cache/reports/<name>.json (RUN_REPORT_DIR
+overrides the directory), also when the run fails. PROFILE=1 additionally
+runs cProfile and writes <name>.pstats next to the report.
+"""
+from __future__ import annotations
+
+import contextlib
+import cProfile
+import json
+import os
+import pstats
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPORT_DIR = Path(os.environ.get(
+    "RUN_REPORT_DIR", Path(__file__).resolve().parent.parent / ".cache" / "reports"))
+PROFILE = os.environ.get("PROFILE", "") not in ("", "0")
+REPORT_VERSION = 1
+PROFILE_TOP = 25  # functions printed by cumulative time when profiling
+
+
+class RunReport:
+    """Stage timings, counters and accumulated timers for one run; thread-safe."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started = datetime.now(timezone.utc)
+        self.stages: dict[str, dict[str, float]] = {}
+        self.counters: dict[str, int] = {}
+        self.timers: dict[str, float] = {}
+        self.status = "running"
+        self.error = ""
+        self._wall0 = time.perf_counter()
+        self._cpu0 = time.process_time()
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """Time a block; repeated stages accumulate."""
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.add_stage(name, time.perf_counter() - wall0, time.process_time() - cpu0)
+
+    def add_stage(self, name: str, wall: float, cpu: float) -> None:
+        """Record a stage timed elsewhere (e.g. before the report existed)."""
+        with self._lock:
+            entry = self.stages.setdefault(name, {"wall": 0.0, "cpu": 0.0, "calls": 0})
+            entry["wall"] += wall
+            entry["cpu"] += cpu
+            entry["calls"] += 1
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def add_time(self, name: str, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        with self._lock:
+            self.timers[name] = self.timers.get(name, 0.0) + seconds
+
+    def record_http(self, status: int, elapsed: float, nbytes: int | None = None) -> None:
+        """One HTTP response: count it by status, add its latency and (if known) size."""
+        self.count("http.requests")
+        self.count(f"http.status.{status}")
+        self.add_time("http.latency", elapsed)
+        if nbytes:
+            self.count("http.bytes", nbytes)
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "version": REPORT_VERSION,
+                "name": self.name,
+                "status": self.status,
+                "error": self.error,
+                "started": self.started.isoformat(timespec="seconds"),
+                "wall": round(time.perf_counter() - self._wall0, 6),
+                "cpu": round(time.process_time() - self._cpu0, 6),
+                "stages": {k: {"wall": round(v["wall"], 6), "cpu": round(v["cpu"], 6), "calls": v["calls"]}
+                           for k, v in self.stages.items()},
+                "counters": dict(sorted(self.counters.items())),
+                "timers": {k: round(v, 6) for k, v in sorted(self.timers.items())},
+            }
+
+    def summary(self) -> str:
+        data = self.to_dict()
+        stages = ", ".join(f"{k} {v['wall']:.2f}s" for k, v in data["stages"].items())
+        waits = sum(v for k, v in data["timers"].items() if k != "http.latency")
+        return (f"{data['wall']:.2f}s wall, {data['cpu']:.2f}s CPU"
+                f"{f' ({stages})' if stages else ''}; "
+                f"{data['counters'].get('http.requests', 0)} HTTP requests, "
+                f"{data['timers'].get('http.latency', 0.0):.2f}s HTTP latency, {waits:.2f}s sleeping")
+
+
+_REPORT = RunReport("")
+
+
+def get_report() -> RunReport:
+    """The report of the current run (a throwaway one outside run_report)."""
+    return _REPORT
+
+
+@contextlib.contextmanager
+def run_report(name: str, report_dir: Path | None = None):
+    """Collect a RunReport around a script's main; write it (and a profile) on exit."""
+    global _REPORT
+    report = _REPORT = RunReport(name)
+    report_dir = report_dir or REPORT_DIR
+    profiler = cProfile.Profile() if PROFILE else None
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield report
+        report.status = "ok"
+    except BaseException as exc:
+        report.status = "failed"
+        report.error = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        report_dir.mkdir(parents=True, exist_ok=True)
+        path = report_dir / f"{name}.json"
+        path.write_text(json.dumps(report.to_dict(), indent=2), encoding="utf-8")
+        print(f"\nRun report: {report.summary()}")
+        print(f"  Written to {path}")
+        if profiler is not None:
+            stats_path = report_dir / f"{name}.pstats"
+            profiler.dump_stats(stats_path)
+            print(f"  Profile written to {stats_path}; top {PROFILE_TOP} by cumulative time:")
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(PROFILE_TOP)
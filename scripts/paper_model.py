@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Compact in-memory paper records.
+
+Papers travel through the pipeline as the dicts of the papers.json schema;
+each copy repeats author names, category and tag strings and the arXiv URL
+prefixes. A PaperCorpus holds the same corpus as Paper records instead:
+
+  Paper        __slots__ record; tags and categories are interned tuples,
+               authors and affiliations are integer IDs into the corpus's
+               NameTables, abs_url / pdf_url are derived from the arXiv ID
+               (only URLs that do not follow arXiv's pattern are stored)
+  PaperCorpus  the records plus their name tables; ``add`` / ``to_dict``
+               convert to and from the JSON schema losslessly (same keys,
+               same key order, same values), and ``to_compact`` /
+               ``from_compact`` give a smaller JSON document that shares
+               the name tables
+
+Fields with an unexpected type and keys the record does not know are kept
+as they are in ``Paper.extra``, so any dict round-trips.
+
+build_site and generate_rss only read the papers, so compact_corpus swaps
+a loaded corpus of COMPACT_MIN_PAPERS or more for a PaperCorpus; iterating
+it yields each paper as a fresh dict, dropped once the stage moves on.
+That trades allocation for memory: build_site makes five passes (shards,
+search index, author index twice, cards) and rebuilds every dict on each.
+benchmark.py measures both sides (build vs build_compact, and the
+build_memory peaks). With the default MAX_PAPERS (3000) the corpus never
+reaches the threshold; it matters once the cap is raised.
+"""
+from __future__ import annotations
+
+import re
+import sys
+from typing import Iterable, Iterator
+
+COMPACT_VERSION = 1
+COMPACT_MIN_PAPERS = 20_000  # loaded corpora this large are held as a PaperCorpus
+ABS_URL_PREFIX = "https://arxiv.org/abs/"
+PDF_URL_PREFIXES = ("http://arxiv.org/pdf/", "https://arxiv.org/pdf/")  # index = scheme code
+PDF_URL_RE = re.compile(r"(https?)://arxiv\.org/pdf/(.+)v([1-9][0-9]*)")
+
+STRING_FIELDS = ("id", "title", "abstract", "published", "updated", "fingerprint",
+                 "method_fig_url", "method_fig_source", "method_fig_caption")
+INTERNED_FIELDS = ("tag_rules_version",)
+NAME_FIELDS = ("authors", "affiliations")
+LABEL_FIELDS = ("categories", "tags")
+URL_FIELDS = ("abs_url", "pdf_url")
+ENCODED_FIELDS = frozenset(STRING_FIELDS + INTERNED_FIELDS + NAME_FIELDS + LABEL_FIELDS + URL_FIELDS)
+RAW_PREFIX = "="  # marks a field kept verbatim in a compact layout
+
+
+class NameTable:
+    """Distinct names numbered in first-seen order."""
+
+    __slots__ = ("names", "_ids")
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: list[str] = []
+        self._ids: dict[str, int] = {}
+        for name in names:
+            self.id(name)
+
+    def id(self, name: str) -> int:
+        ident = self._ids.get(name)
+        if ident is None:
+            ident = self._ids[name] = len(self.names)
+            self.names.append(name)
+        return ident
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class Paper:
+    """One paper; see PaperCorpus for converting to and from the JSON schema."""
+
+    __slots__ = ("id", "title", "authors", "affiliations", "abstract", "published", "updated",
+                 "categories", "tags", "abs_ref", "pdf_ref", "fingerprint", "tag_rules_version",
+                 "method_fig_url", "method_fig_source", "method_fig_caption", "layout", "extra")
+
+    def __init__(self):
+        self.id = ""
+        self.title = ""
+        self.authors: tuple[int, ...] = ()       # NameTable IDs
+        self.affiliations: tuple[int, ...] = ()
+        self.abstract = ""
+        self.published = ""
+        self.updated = ""
+        self.categories: tuple[str, ...] = ()
+        self.tags: tuple[str, ...] = ()
+        self.abs_ref: str | None = None   # None: derived from the ID, else the stored URL
+        self.pdf_ref: int | str = ""      # version * 2 + scheme code when derived, else the URL
+        self.fingerprint = ""
+        self.tag_rules_version = ""
+        self.method_fig_url: str | None = None
+        self.method_fig_source: str | None = None
+        self.method_fig_caption: str | None = None
+        self.layout: tuple[str, ...] = ()  # keys of the source dict, in order
+        self.extra: dict | None = None     # values kept verbatim
+
+    @property
+    def abs_url(self) -> str:
+        return ABS_URL_PREFIX + self.id if self.abs_ref is None else self.abs_ref
+
+    @property
+    def pdf_url(self) -> str:
+        if isinstance(self.pdf_ref, str):
+            return self.pdf_ref
+        version, scheme = divmod(self.pdf_ref, 2)
+        return f"{PDF_URL_PREFIXES[scheme]}{self.id}v{version}"
+
+    def __repr__(self) -> str:
+        return f"Paper({self.id})"
+
+
+def pdf_ref(arxiv_id: str, url: str) -> int | str:
+    """Compact reference for a PDF URL: an int when pdf_url can rebuild it exactly."""
+    match = PDF_URL_RE.fullmatch(url)
+    if match and match.group(2) == arxiv_id:
+        return int(match.group(3)) * 2 + (match.group(1) == "https")
+    return url
+
+
+def is_str_list(value) -> bool:
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+class PaperCorpus:
+    """Paper records sharing author / affiliation tables and interned labels."""
+
+    def __init__(self):
+        self.papers: list[Paper] = []
+        self.authors = NameTable()
+        self.affiliations = NameTable()
+        self._interned: dict[tuple, tuple] = {}
+
+    @classmethod
+    def from_dicts(cls, papers: Iterable[dict]) -> PaperCorpus:
+        corpus = cls()
+        corpus.extend(papers)
+        return corpus
+
+    def __len__(self) -> int:
+        return len(self.papers)
+
+    def __iter__(self) -> Iterator[dict]:
+        """The papers as papers.json dicts, built one at a time."""
+        return map(self.to_dict, self.papers)
+
+    def _intern(self, items: tuple) -> tuple:
+        return self._interned.setdefault(items, items)
+
+    def _labels(self, values: list[str]) -> tuple[str, ...]:
+        return self._intern(tuple(sys.intern(v) for v in values))
+
+    @staticmethod
+    def _ids(table: NameTable, names: list[str]) -> tuple[int, ...]:
+        # Author lists are nearly all distinct, so they are not interned
+        return tuple(table.id(name) for name in names)
+
+    def add(self, data: dict) -> Paper:
+        """Append a paper given as a papers.json dict; return its record."""
+        paper = Paper()
+        extra: dict = {}
+        for key, value in data.items():
+            if key in STRING_FIELDS and isinstance(value, str):
+                setattr(paper, key, value)
+            elif key in INTERNED_FIELDS and isinstance(value, str):
+                setattr(paper, key, sys.intern(value))
+            elif key in NAME_FIELDS and is_str_list(value):
+                setattr(paper, key, self._ids(self.authors if key == "authors" else self.affiliations, value))
+            elif key in LABEL_FIELDS and is_str_list(value):
+                setattr(paper, key, self._labels(value))
+            elif key not in URL_FIELDS or not isinstance(value, str):
+                extra[key] = value
+        # URLs last: deriving them needs the ID, wherever it sits in the dict
+        if isinstance(data.get("abs_url"), str):
+            url = data["abs_url"]
+            paper.abs_ref = None if url == ABS_URL_PREFIX + paper.id and "id" not in extra else url
+        if isinstance(data.get("pdf_url"), str):
+            paper.pdf_ref = data["pdf_url"] if "id" in extra else pdf_ref(paper.id, data["pdf_url"])
+        paper.layout = self._intern(tuple(data))
+        paper.extra = extra or None
+        self.papers.append(paper)
+        return paper
+
+    def extend(self, papers: Iterable[dict]) -> None:
+        for paper in papers:
+            self.add(paper)
+
+    def author_names(self, paper: Paper) -> list[str]:
+        names = self.authors.names
+        return [names[i] for i in paper.authors]
+
+    def affiliation_names(self, paper: Paper) -> list[str]:
+        names = self.affiliations.names
+        return [names[i] for i in paper.affiliations]
+
+    def to_dict(self, paper: Paper) -> dict:
+        """The papers.json dict the record was built from (equal, same key order)."""
+        extra = paper.extra or {}
+        out = {}
+        for key in paper.layout:
+            if key in extra:
+                out[key] = extra[key]
+            elif key == "authors":
+                out[key] = self.author_names(paper)
+            elif key == "affiliations":
+                out[key] = self.affiliation_names(paper)
+            elif key in LABEL_FIELDS:
+                out[key] = list(getattr(paper, key))
+            else:
+                out[key] = getattr(paper, key)  # plain fields and the URL properties
+        return out
+
+    def to_dicts(self) -> list[dict]:
+        return [self.to_dict(paper) for paper in self.papers]
+
+    # -- compact JSON document ------------------------------------------------
+
+    def to_compact(self) -> dict:
+        """JSON-ready document: name tables, key layouts and one list per paper.
+
+        A paper is [layout index, values...] in layout order. Authors and
+        affiliations are table IDs; a derived abs_url takes no value and a
+        derived pdf_url is its int reference. Layout keys prefixed with "="
+        hold the dict's value verbatim.
+        """
+        layouts: dict[tuple[str, ...], int] = {}
+        rows = []
+        for paper in self.papers:
+            extra = paper.extra or {}
+            layout = []
+            row: list = [0]
+            for key in paper.layout:
+                if (key in extra or key not in ENCODED_FIELDS
+                        or (key == "abs_url" and paper.abs_ref is not None)
+                        or (key == "pdf_url" and isinstance(paper.pdf_ref, str))):
+                    layout.append(RAW_PREFIX + key)
+                    row.append(extra[key] if key in extra else getattr(paper, key))
+                    continue
+                layout.append(key)
+                if key in NAME_FIELDS or key in LABEL_FIELDS:
+                    row.append(list(getattr(paper, key)))
+                elif key == "pdf_url":
+                    row.append(paper.pdf_ref)
+                elif key != "abs_url":
+                    row.append(getattr(paper, key))
+            row[0] = layouts.setdefault(tuple(layout), len(layouts))
+            rows.append(row)
+        return {
+            "version": COMPACT_VERSION,
+            "authors": self.authors.names,
+            "affiliations": self.affiliations.names,
+            "layouts": [list(layout) for layout in layouts],
+            "papers": rows,
+        }
+
+    @classmethod
+    def from_compact(cls, data: dict) -> PaperCorpus:
+        if data.get("version") != COMPACT_VERSION:
+            raise ValueError(f"unsupported compact corpus version: {data.get('version')!r}")
+        corpus = cls()
+        corpus.authors = NameTable(data["authors"])
+        corpus.affiliations = NameTable(data["affiliations"])
+        layouts = [tuple(layout) for layout in data["layouts"]]
+        for row in data["papers"]:
+            layout = layouts[row[0]]
+            paper = Paper()
+            extra: dict = {}
+            values = iter(row[1:])
+            keys = []
+            for key in layout:
+                if key.startswith(RAW_PREFIX):
+                    key = key[len(RAW_PREFIX):]
+                    extra[key] = next(values)
+                elif key in NAME_FIELDS:
+                    setattr(paper, key, tuple(next(values)))
+                elif key in LABEL_FIELDS:
+                    setattr(paper, key, corpus._labels(next(values)))
+                elif key in INTERNED_FIELDS:
+                    setattr(paper, key, sys.intern(next(values)))
+                elif key == "pdf_url":
+                    paper.pdf_ref = next(values)
+                elif key != "abs_url":
+                    setattr(paper, key, next(values))
+                keys.append(key)
+            # A verbatim URL is a stored one; the record must not derive it
+            if "abs_url" in extra and isinstance(extra["abs_url"], str):
+                paper.abs_ref = extra.pop("abs_url")
+            if "pdf_url" in extra and isinstance(extra["pdf_url"], str):
+                paper.pdf_ref = extra.pop("pdf_url")
+            paper.layout = corpus._intern(tuple(keys))
+            paper.extra = extra or None
+            corpus.papers.append(paper)
+        return corpus
+
+
+def compact_corpus(data: dict) -> dict:
+    """``data`` with its papers as a PaperCorpus once there are COMPACT_MIN_PAPERS.
+
+    For stages that only iterate the papers and take their len(). ``data``
+    itself is not changed; pass the result on to share the records.
+    """
+    papers = data.get("papers")
+    if isinstance(papers, list) and len(papers) >= COMPACT_MIN_PAPERS:
+        return {**data, "papers": PaperCorpus.from_dicts(papers)}
+    return data
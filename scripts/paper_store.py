@@ -0,0 +1,548 @@
+#!/usr/bin/env python3
+"""
+Storage backends for the paper corpus.
+
+  json    data/papers.json, rewritten whenever the corpus changes (default)
+  sqlite  data/papers.sqlite, one row per paper with indexes on published,
+          tags and categories; saves only touch rows that changed
+  log     data/papers.snapshot.jsonl + data/papers.log.jsonl: a one-paper-
+          per-line snapshot plus an append-only change log; saves append
+          only added, updated and deleted papers, `compact` folds the log
+          back into the snapshot
+
+Select the backend with PAPER_STORE=json|sqlite|log. The site build and RSS
+generator read through the same interface; `export-json` writes a
+papers.json snapshot from any backend.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from file_io import FILE_MODE
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+PAPER_STORE = os.environ.get("PAPER_STORE", "json")
+
+
+def empty_corpus() -> dict:
+    return {"last_updated": "", "total_count": 0, "papers": []}
+
+
+def utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def write_json_snapshot(path: Path, papers: list[dict], last_updated: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "last_updated": last_updated,
+        "total_count": len(papers),
+        "papers": papers,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+class PaperStore(ABC):
+    """Interface shared by the storage backends."""
+
+    name = ""
+    last_updated = ""  # stamp of the corpus last loaded or saved
+
+    @abstractmethod
+    def load(self) -> dict:
+        """Return {"last_updated", "total_count", "papers"} with papers newest first."""
+
+    @abstractmethod
+    def save(self, papers: list[dict]) -> bool:
+        """Persist the full paper list; return False when nothing changed."""
+
+    @abstractmethod
+    def revision(self) -> str:
+        """Opaque token that changes whenever the stored corpus changes."""
+
+    def corpus(self, papers: list[dict]) -> dict:
+        """What load() returns after save(papers), built without reading the store back."""
+        papers = sorted(papers, key=paper_sort_key, reverse=True)
+        return {"last_updated": self.last_updated, "total_count": len(papers), "papers": papers}
+
+    def export_json(self, path: Path) -> None:
+        data = self.load()
+        write_json_snapshot(path, data["papers"], data["last_updated"])
+
+    def close(self) -> None:
+        pass
+
+
+class JsonPaperStore(PaperStore):
+    """The whole corpus in one pretty-printed JSON file."""
+
+    name = "json"
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def load(self) -> dict:
+        data = self._read() if self.path.exists() else empty_corpus()
+        self.last_updated = data.get("last_updated", "")
+        return data
+
+    def _read(self) -> dict:
+        for enc in ("utf-8", "utf-8-sig", "cp1252"):
+            try:
+                with open(self.path, "r", encoding=enc) as f:
+                    return json.load(f)
+            except UnicodeDecodeError:
+                continue
+        with open(self.path, "r", encoding="utf-8", errors="replace") as f:
+            return json.load(f)
+
+    def save(self, papers: list[dict]) -> bool:
+        if self.path.exists() and self.load().get("papers") == papers:
+            return False
+        self.last_updated = utc_now_iso()
+        write_json_snapshot(self.path, papers, self.last_updated)
+        return True
+
+    def corpus(self, papers: list[dict]) -> dict:
+        # The file keeps the order it was saved in
+        return {"last_updated": self.last_updated, "total_count": len(papers), "papers": papers}
+
+    def revision(self) -> str:
+        if not self.path.exists():
+            return ""
+        return hashlib.sha256(self.path.read_bytes()).hexdigest()
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    id          TEXT PRIMARY KEY,
+    published   TEXT NOT NULL DEFAULT '',
+    updated     TEXT NOT NULL DEFAULT '',
+    record_hash TEXT NOT NULL,
+    record      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_papers_published ON papers (published);
+CREATE TABLE IF NOT EXISTS paper_tags (
+    tag      TEXT NOT NULL,
+    paper_id TEXT NOT NULL REFERENCES papers (id) ON DELETE CASCADE,
+    PRIMARY KEY (tag, paper_id)
+);
+CREATE INDEX IF NOT EXISTS idx_paper_tags_paper ON paper_tags (paper_id);
+CREATE TABLE IF NOT EXISTS paper_categories (
+    category TEXT NOT NULL,
+    paper_id TEXT NOT NULL REFERENCES papers (id) ON DELETE CASCADE,
+    PRIMARY KEY (category, paper_id)
+);
+CREATE INDEX IF NOT EXISTS idx_paper_categories_paper ON paper_categories (paper_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class SqlitePaperStore(PaperStore):
+    """One row per paper; tags and categories in indexed side tables."""
+
+    name = "sqlite"
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.executescript(SQLITE_SCHEMA)
+        self.last_stats = {"inserted": 0, "updated": 0, "deleted": 0}
+
+    @staticmethod
+    def _encode(paper: dict) -> tuple[str, str]:
+        record = json.dumps(paper, ensure_ascii=False, separators=(",", ":"))
+        return record, hashlib.sha1(record.encode("utf-8")).hexdigest()
+
+    def _meta(self, key: str, default: str = "") -> str:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self.conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    def upsert(self, papers: Iterable[dict]) -> tuple[int, int]:
+        """Insert new papers and rewrite changed ones; return (inserted, updated)."""
+        stored = dict(self.conn.execute("SELECT id, record_hash FROM papers"))
+        inserted = updated = 0
+        for paper in papers:
+            pid = paper["id"]
+            record, record_hash = self._encode(paper)
+            previous = stored.get(pid)
+            if previous == record_hash:
+                continue
+            self.conn.execute(
+                "INSERT INTO papers (id, published, updated, record_hash, record) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET published = excluded.published, "
+                "updated = excluded.updated, record_hash = excluded.record_hash, record = excluded.record",
+                (pid, paper.get("published") or "", paper.get("updated") or "", record_hash, record),
+            )
+            self.conn.execute("DELETE FROM paper_tags WHERE paper_id = ?", (pid,))
+            self.conn.execute("DELETE FROM paper_categories WHERE paper_id = ?", (pid,))
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO paper_tags (tag, paper_id) VALUES (?, ?)",
+                [(tag, pid) for tag in paper.get("tags", [])],
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO paper_categories (category, paper_id) VALUES (?, ?)",
+                [(cat, pid) for cat in paper.get("categories", [])],
+            )
+            if previous is None:
+                inserted += 1
+            else:
+                updated += 1
+        return inserted, updated
+
+    def delete(self, ids: Iterable[str]) -> int:
+        cur = self.conn.executemany("DELETE FROM papers WHERE id = ?", [(pid,) for pid in ids])
+        return cur.rowcount
+
+    def query(self, since: str | None = None, until: str | None = None,
+              tag: str | None = None, category: str | None = None,
+              limit: int | None = None) -> list[dict]:
+        """Papers newest first, optionally filtered by published range, tag and category."""
+        sql = ["SELECT p.record FROM papers p"]
+        where: list[str] = []
+        args: list = []
+        if tag:
+            sql.append("JOIN paper_tags t ON t.paper_id = p.id AND t.tag = ?")
+            args.append(tag)
+        if category:
+            sql.append("JOIN paper_categories c ON c.paper_id = p.id AND c.category = ?")
+            args.append(category)
+        if since:
+            where.append("p.published >= ?")
+            args.append(since)
+        if until:
+            where.append("p.published < ?")
+            args.append(until)
+        if where:
+            sql.append("WHERE " + " AND ".join(where))
+        sql.append("ORDER BY p.published DESC, p.id DESC")
+        if limit:
+            sql.append("LIMIT ?")
+            args.append(limit)
+        return [json.loads(row[0]) for row in self.conn.execute(" ".join(sql), args)]
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+
+    def load(self) -> dict:
+        papers = self.query()
+        self.last_updated = self._meta("last_updated")
+        return {
+            "last_updated": self.last_updated,
+            "total_count": len(papers),
+            "papers": papers,
+        }
+
+    def save(self, papers: list[dict]) -> bool:
+        with self.conn:
+            inserted, updated = self.upsert(papers)
+            keep = {p["id"] for p in papers}
+            stale = [pid for (pid,) in self.conn.execute("SELECT id FROM papers") if pid not in keep]
+            deleted = self.delete(stale) if stale else 0
+            self.last_stats = {"inserted": inserted, "updated": updated, "deleted": deleted}
+            if not (inserted or updated or deleted):
+                return False
+            self.last_updated = utc_now_iso()
+            self._set_meta("last_updated", self.last_updated)
+            self._set_meta("revision", str(int(self._meta("revision", "0")) + 1))
+        return True
+
+    def revision(self) -> str:
+        return f"{self._meta('revision', '0')}:{self._meta('last_updated')}"
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+LOG_FORMAT_VERSION = 1
+LOG_COMPACT_RATIO = 0.5  # compact once the log outgrows this fraction of the snapshot
+
+
+def encode_line(obj: dict) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def paper_sort_key(paper: dict) -> tuple[str, str]:
+    return paper.get("published") or "", paper["id"]
+
+
+class LogPaperStore(PaperStore):
+    """Snapshot plus append-only change log, both JSON Lines.
+
+    The snapshot's first line is a header {"format", "seq", "last_updated"};
+    every following line is one paper. Each log line is
+    {"seq", "ts", "op": "put", "paper": {...}} or {"seq", "ts", "op": "del", "id"}.
+    Loading streams the snapshot and replays log entries with a seq above
+    the snapshot's, so a compaction interrupted before the log is truncated
+    replays cleanly. A torn last log line (crash mid-append) is ignored and
+    cut off before the next append.
+    """
+
+    name = "log"
+
+    def __init__(self, snapshot_path: Path, log_path: Path, legacy_json: Path | None = None):
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path
+        self.legacy_json = legacy_json
+        self.last_stats = {"inserted": 0, "updated": 0, "deleted": 0}
+        self.compacted = False
+        self._records: dict[str, str] | None = None  # id -> encoded paper as of the last replay
+        self._seq = 0
+        self._last_updated = ""
+        self._log_valid_bytes = 0
+
+    @property
+    def last_updated(self) -> str:
+        return self._last_updated
+
+    def _read_snapshot(self) -> Iterator[dict]:
+        """Yield the header, then each paper of the snapshot."""
+        if not self.snapshot_path.exists():
+            return
+        with open(self.snapshot_path, "r", encoding="utf-8") as f:
+            header = json.loads(f.readline() or "{}")
+            if header.get("format") != LOG_FORMAT_VERSION:
+                raise ValueError(f"{self.snapshot_path}: unsupported snapshot format {header.get('format')!r}")
+            yield header
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _read_log(self) -> Iterator[dict]:
+        """Yield complete log entries; remember where the last one ends."""
+        self._log_valid_bytes = 0
+        if not self.log_path.exists():
+            return
+        with open(self.log_path, "rb") as f:
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    print(f"  Ignoring a torn last line in {self.log_path.name}.")
+                    break
+                if raw.strip():
+                    yield json.loads(raw)
+                self._log_valid_bytes += len(raw)
+
+    def _replay(self) -> dict[str, dict]:
+        papers: dict[str, dict] = {}
+        self._seq, self._last_updated = 0, ""
+        snapshot = self._read_snapshot()
+        header = next(snapshot, None)
+        if header is not None:
+            self._seq = header.get("seq", 0)
+            self._last_updated = header.get("last_updated", "")
+            for paper in snapshot:
+                papers[paper["id"]] = paper
+        elif not self.log_path.exists() and self.legacy_json and self.legacy_json.exists():
+            # First run after switching backends: start from papers.json; the
+            # first save writes it out as the snapshot.
+            legacy = JsonPaperStore(self.legacy_json).load()
+            self._last_updated = legacy.get("last_updated", "")
+            papers = {p["id"]: p for p in legacy.get("papers", [])}
+        for entry in self._read_log():
+            if entry["seq"] <= self._seq:
+                continue
+            if entry["op"] == "put":
+                papers[entry["paper"]["id"]] = entry["paper"]
+            elif entry["op"] == "del":
+                papers.pop(entry["id"], None)
+            self._seq = entry["seq"]
+            self._last_updated = entry.get("ts", self._last_updated)
+        self._records = {pid: encode_line(p) for pid, p in papers.items()}
+        return papers
+
+    def load(self) -> dict:
+        papers = sorted(self._replay().values(), key=paper_sort_key, reverse=True)
+        return {
+            "last_updated": self._last_updated,
+            "total_count": len(papers),
+            "papers": papers,
+        }
+
+    def save(self, papers: list[dict]) -> bool:
+        if self._records is None:
+            self._replay()
+        records = self._records
+        ts = utc_now_iso()
+        entries: list[str] = []
+        inserted = updated = 0
+        keep: set[str] = set()
+        for paper in papers:
+            pid = paper["id"]
+            keep.add(pid)
+            encoded = encode_line(paper)
+            previous = records.get(pid)
+            if previous == encoded:
+                continue
+            self._seq += 1
+            entries.append(encode_line({"seq": self._seq, "ts": ts, "op": "put", "paper": paper}))
+            records[pid] = encoded
+            if previous is None:
+                inserted += 1
+            else:
+                updated += 1
+        stale = [pid for pid in records if pid not in keep]
+        for pid in stale:
+            self._seq += 1
+            entries.append(encode_line({"seq": self._seq, "ts": ts, "op": "del", "id": pid}))
+            del records[pid]
+        self.last_stats = {"inserted": inserted, "updated": updated, "deleted": len(stale)}
+        self.compacted = False
+        if not entries and self.snapshot_path.exists():
+            return False
+
+        self._last_updated = ts
+        if not self.snapshot_path.exists():
+            self.compact()
+            return True
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "ab") as f:
+            if f.tell() > self._log_valid_bytes:
+                f.truncate(self._log_valid_bytes)
+            f.write("".join(entries).encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+            self._log_valid_bytes = f.tell()
+        if self._log_valid_bytes > LOG_COMPACT_RATIO * self.snapshot_path.stat().st_size:
+            self.compact()
+        return True
+
+    def compact(self) -> int:
+        """Fold the change log into a fresh snapshot, truncate the log; return the paper count."""
+        if self._records is None:
+            self._replay()
+        papers = sorted((json.loads(r) for r in self._records.values()), key=paper_sort_key, reverse=True)
+        header = {"format": LOG_FORMAT_VERSION, "seq": self._seq, "last_updated": self._last_updated}
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.snapshot_path.parent, prefix=f".{self.snapshot_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(encode_line(header))
+                for paper in papers:
+                    f.write(self._records[paper["id"]])
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp, FILE_MODE)
+            os.replace(tmp, self.snapshot_path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        # Entries up to header["seq"] are now in the snapshot; replay skips them
+        # even if the process dies before this truncation.
+        with open(self.log_path, "wb"):
+            pass
+        self._log_valid_bytes = 0
+        self.compacted = True
+        return len(papers)
+
+    def _last_log_entry(self) -> dict | None:
+        if not self.log_path.exists():
+            return None
+        with open(self.log_path, "rb") as f:
+            end = f.seek(0, os.SEEK_END)
+            pos, tail = end, b""
+            while pos > 0:
+                step = min(65536, pos)
+                pos -= step
+                f.seek(pos)
+                tail = f.read(step) + tail
+                lines = tail.split(b"\n")
+                # lines[-1] is empty (complete) or torn; lines[-2] is the last full entry
+                if len(lines) >= 3 or (pos == 0 and len(lines) >= 2):
+                    candidate = lines[-2]
+                    return json.loads(candidate) if candidate.strip() else None
+        return None
+
+    def revision(self) -> str:
+        """Last applied seq and timestamp, read from the snapshot header and the log tail."""
+        seq, last_updated = 0, ""
+        header = next(self._read_snapshot(), None)
+        if header is not None:
+            seq, last_updated = header.get("seq", 0), header.get("last_updated", "")
+        entry = self._last_log_entry()
+        if entry and entry["seq"] > seq:
+            seq, last_updated = entry["seq"], entry.get("ts", last_updated)
+        if not seq and not last_updated and self.legacy_json and self.legacy_json.exists():
+            return "json:" + JsonPaperStore(self.legacy_json).revision()
+        return f"{seq}:{last_updated}"
+
+
+def open_store(kind: str | None = None, data_dir: Path | None = None) -> PaperStore:
+    """Open the configured backend (PAPER_STORE) under data_dir."""
+    kind = kind or PAPER_STORE
+    data_dir = data_dir or DATA_DIR
+    if kind == "json":
+        return JsonPaperStore(data_dir / "papers.json")
+    if kind == "sqlite":
+        return SqlitePaperStore(data_dir / "papers.sqlite")
+    if kind == "log":
+        return LogPaperStore(data_dir / "papers.snapshot.jsonl", data_dir / "papers.log.jsonl",
+                             legacy_json=data_dir / "papers.json")
+    raise ValueError(f"Unknown PAPER_STORE {kind!r} (expected 'json', 'sqlite' or 'log')")
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Inspect or convert the paper store.")
+    parser.add_argument("--store", default=PAPER_STORE, help="backend: json, sqlite or log")
+    sub = parser.add_subparsers(dest="command", required=True)
+    imp = sub.add_parser("import-json", help="load a papers.json snapshot into the backend")
+    imp.add_argument("path", nargs="?", type=Path, default=DATA_DIR / "papers.json")
+    exp = sub.add_parser("export-json", help="write the backend's corpus as papers.json")
+    exp.add_argument("path", nargs="?", type=Path, default=DATA_DIR / "papers.json")
+    sub.add_parser("compact", help="fold the change log into the snapshot (log backend)")
+    q = sub.add_parser("query", help="list papers (sqlite backend)")
+    q.add_argument("--since", help="published >= (ISO date)")
+    q.add_argument("--until", help="published < (ISO date)")
+    q.add_argument("--tag")
+    q.add_argument("--category")
+    q.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    store = open_store(args.store)
+    try:
+        if args.command == "import-json":
+            papers = JsonPaperStore(args.path).load().get("papers", [])
+            changed = store.save(papers)
+            print(f"Imported {len(papers)} papers into {store.name} store ({'changed' if changed else 'no changes'}).")
+        elif args.command == "export-json":
+            store.export_json(args.path)
+            print(f"Exported {store.name} store to {args.path}")
+        elif args.command == "compact":
+            if not isinstance(store, LogPaperStore):
+                parser.error("compact needs --store log")
+            count = store.compact()
+            print(f"Compacted {count} papers into {store.snapshot_path} (revision {store.revision()}).")
+        elif args.command == "query":
+            if not isinstance(store, SqlitePaperStore):
+                parser.error("query needs --store sqlite")
+            for paper in store.query(args.since, args.until, args.tag, args.category, args.limit):
+                print(f"{paper.get('published', '')[:10]}  {paper['id']}  {paper.get('title', '')}")
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
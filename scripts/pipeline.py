@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Run the pipeline stages in one process.
+
+  fetch    fetch_papers (--full / --sharded / --async are passed through)
+  build    build_site
+  feeds    generate_rss
+  run-all  fetch, build and feeds in order; build and feeds reuse the corpus
+           fetch just saved instead of re-reading the paper store
+           (with --skip-fetch the store is read once for both)
+
+A stage's module is imported only when the stage runs: `build` and `feeds`
+never import requests, and bs4 is imported only by the "soup" figure
+parser and brotli only when a .br sibling is written.
+Each stage writes its usual run report (fetch_papers, build_site,
+generate_rss) with an extra "import" stage; the first report also gets a
+"startup" stage: the CPU seconds the interpreter used before this runner
+started (startup is CPU bound, so it stands in for the wall time too).
+"""
+from __future__ import annotations
+
+import time
+
+STARTUP_CPU = time.process_time()
+
+import argparse
+import importlib
+
+from instrumentation import run_report
+from paper_model import compact_corpus
+
+# stage -> (module, entry point); imported on first use
+STAGES = {
+    "fetch": ("fetch_papers", "main"),
+    "build": ("build_site", "build"),
+    "feeds": ("generate_rss", "generate_rss"),
+}
+
+_startup_pending = True  # the startup stage goes into the first report only
+
+
+def run_stage(stage: str, *args, load: bool = False):
+    """Import a stage's module and call its entry point inside its run report.
+
+    With ``load``, the corpus is read by the module's load_papers() (as the
+    report's "load" stage), passed to the entry point and returned, compacted
+    (see paper_model.compact_corpus) so later stages share the records.
+    """
+    global _startup_pending
+    module_name, func_name = STAGES[stage]
+    with run_report(module_name) as report:
+        if _startup_pending:
+            report.add_stage("startup", STARTUP_CPU, STARTUP_CPU)
+            _startup_pending = False
+        with report.stage("import"):
+            module = importlib.import_module(module_name)
+        print(f"[{stage}] imported {module_name} in {report.stages['import']['wall'] * 1000:.0f} ms")
+        if load:
+            with report.stage("load"):
+                corpus = compact_corpus(module.load_papers())
+            getattr(module, func_name)(*args, corpus)
+            return corpus
+        return getattr(module, func_name)(*args)
+
+
+def fetch_argv(args: argparse.Namespace) -> list[str]:
+    flags = (("--full", args.full), ("--sharded", args.sharded), ("--async", args.use_async))
+    return [flag for flag, on in flags if on]
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the pipeline stages in one process.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    fetch_flags = argparse.ArgumentParser(add_help=False)
+    fetch_flags.add_argument("--full", action="store_true",
+                             help="ignore the harvest watermark and re-sync (see fetch_papers.py)")
+    fetch_flags.add_argument("--sharded", action="store_true",
+                             help="re-sync as concurrent date shards (see fetch_papers.py)")
+    fetch_flags.add_argument("--async", dest="use_async", action="store_true",
+                             help="overlap paging, merging, figures and saving (see async_fetch.py)")
+    sub.add_parser("fetch", parents=[fetch_flags], help="fetch papers from arXiv into the paper store")
+    sub.add_parser("build", help="build the static site into dist/")
+    sub.add_parser("feeds", help="generate the RSS, Atom and JSON feeds")
+    run_all = sub.add_parser("run-all", parents=[fetch_flags], help="fetch, build and feeds in one process")
+    run_all.add_argument("--skip-fetch", action="store_true",
+                         help="build and generate feeds from the current paper store")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    print(f"Interpreter startup: {STARTUP_CPU * 1000:.0f} ms CPU")
+    if args.command == "fetch":
+        run_stage("fetch", fetch_argv(args))
+    elif args.command == "build":
+        run_stage("build")
+    elif args.command == "feeds":
+        run_stage("feeds")
+    elif args.skip_fetch:
+        corpus = run_stage("build", load=True)
+        run_stage("feeds", corpus)
+    else:
+        corpus = compact_corpus(run_stage("fetch", fetch_argv(args)))
+        run_stage("build", corpus)
+        run_stage("feeds", corpus)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Build-time inverted index for the site's search box.
+
+Format (version 1), all ordinals refer to positions in the card index:
+  terms      sorted list of normalized tokens
+  postings   one string per term: ascending ordinals, delta-encoded as
+             base64 VLQ (5 data bits per char, 0x20 = continuation)
+  facets     {"tags": {tag: bitset}, "years": {year: bitset}}; each bitset is
+             base64 of a little-endian bit array (bit i = ordinal i)
+  stopwords  tokens left out of the index; the client drops them from queries
+"""
+from __future__ import annotations
+
+import base64
+import re
+import unicodedata
+
+SEARCH_INDEX_VERSION = 1
+MIN_TOKEN_LENGTH = 2
+STOPWORDS = frozenset(
+    "a an and are as at be by for from in into is it its of on or our that the "
+    "their this to we which with".split()
+)
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+VLQ_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+
+
+def normalize(text: str) -> str:
+    """Lowercase and strip diacritics (mirrors normalizeText in app.js)."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def tokenize(text: str) -> set[str]:
+    """Distinct index terms of a text."""
+    return {
+        tok for tok in TOKEN_RE.findall(normalize(text))
+        if len(tok) >= MIN_TOKEN_LENGTH and tok not in STOPWORDS
+    }
+
+
+def encode_vlq(ordinals: list[int]) -> str:
+    """Delta + base64-VLQ encode an ascending list of non-negative ints."""
+    out: list[str] = []
+    prev = 0
+    for value in ordinals:
+        delta = value - prev
+        prev = value
+        while True:
+            digit = delta & 31
+            delta >>= 5
+            if delta:
+                out.append(VLQ_ALPHABET[digit | 32])
+            else:
+                out.append(VLQ_ALPHABET[digit])
+                break
+    return "".join(out)
+
+
+def decode_vlq(encoded: str) -> list[int]:
+    """Inverse of encode_vlq (used for verification and benchmarks)."""
+    values: list[int] = []
+    prev = value = shift = 0
+    for ch in encoded:
+        digit = VLQ_ALPHABET.index(ch)
+        value |= (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+        else:
+            prev += value
+            values.append(prev)
+            value = shift = 0
+    return values
+
+
+def encode_bitset(ordinals: list[int], size: int) -> str:
+    bits = bytearray((size + 7) // 8)
+    for i in ordinals:
+        bits[i >> 3] |= 1 << (i & 7)
+    return base64.b64encode(bytes(bits)).decode("ascii")
+
+
+def paper_search_text(paper: dict) -> str:
+    return " ".join((
+        paper.get("title", ""),
+        " ".join(paper.get("authors", [])),
+        paper.get("abstract", ""),
+        " ".join(paper.get("tags", [])),
+    ))
+
+
+def build_search_index(papers: list[dict]) -> dict:
+    """Build the versioned index for papers in card-index order."""
+    postings: dict[str, list[int]] = {}
+    tag_docs: dict[str, list[int]] = {}
+    year_docs: dict[str, list[int]] = {}
+    for ordinal, paper in enumerate(papers):
+        for term in tokenize(paper_search_text(paper)):
+            postings.setdefault(term, []).append(ordinal)
+        for tag in paper.get("tags", []):
+            tag_docs.setdefault(tag, []).append(ordinal)
+        year = (paper.get("published") or "")[:4]
+        if year.isdigit():
+            year_docs.setdefault(year, []).append(ordinal)
+
+    size = len(papers)
+    terms = sorted(postings)
+    return {
+        "version": SEARCH_INDEX_VERSION,
+        "doc_count": size,
+        "stopwords": sorted(STOPWORDS),
+        "min_token_length": MIN_TOKEN_LENGTH,
+        "terms": terms,
+        "postings": [encode_vlq(postings[t]) for t in terms],
+        "facets": {
+            "tags": {tag: encode_bitset(docs, size) for tag, docs in sorted(tag_docs.items())},
+            "years": {year: encode_bitset(docs, size) for year, docs in sorted(year_docs.items())},
+        },
+    }
@@ -8,6 +8,7 @@
 
   //  State 
   let allPapers = [];
+  let paperById = new Map();
   let filteredPapers = [];
   let displayedCount = 0;
   const PAGE_SIZE = 50;
@@ -17,6 +18,30 @@
   let activeMonth = "";
   let activeTags = new Set();
   let activeSort = "date-desc";
+  let activeAuthor = "";       // folded name (see foldName)
+  let activeAffiliation = "";
+
+  // Detail shards (full records) are fetched on demand; cards are inline
+  let shardUrls = {};
+  const shardRequests = new Map();
+  let modalPaperId = null;
+
+  // Inverted search index (see scripts/search_index.py for the format)
+  const SEARCH_INDEX_VERSION = 1;
+  const VLQ_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/";
+  let searchIndex = null;
+  let searchIndexRequest = null;
+  const postingsCache = new Map();
+  const bitsetCache = new Map();
+
+  // Author / affiliation index (see scripts/author_index.py for the format)
+  const AUTHOR_INDEX_VERSION = 1;
+  const NAME_FOLDS = {
+    "\u00f8": "o", "\u0111": "d", "\u00f0": "d", "\u0142": "l", "\u0131": "i",
+    "\u00df": "ss", "\u00e6": "ae", "\u0153": "oe", "\u00fe": "th",
+  };
+  let authorIndex = null;
+  let authorIndexRequest = null;
 
   //  DOM Elements 
   const $ = (sel) => document.querySelector(sel);
@@ -28,6 +53,11 @@
   const sortSelect      = $("#sortSelect");
   const tagFilterEl     = $("#tagFilter");
   const clearTagsBtn    = $("#clearTags");
+  const peopleSection   = $("#peopleFilter");
+  const authorFilter    = $("#authorFilter");
+  const authorOptions   = $("#authorOptions");
+  const affiliationFilter = $("#affiliationFilter");
+  const clearPeopleBtn  = $("#clearPeople");
   const paperList       = $("#paperList");
   const loadMoreWrap    = $("#loadMore");
   const loadMoreBtn     = $("#loadMoreBtn");
@@ -48,6 +78,8 @@
     // Load papers data (injected by build script)
     if (typeof PAPERS_DATA !== "undefined") {
       allPapers = PAPERS_DATA.papers || [];
+      shardUrls = PAPERS_DATA.shards || {};
+      allPapers.forEach((p) => paperById.set(p.id, p));
       totalCountEl.textContent = PAPERS_DATA.total_count || allPapers.length;
 
       if (PAPERS_DATA.last_updated) {
@@ -147,17 +179,52 @@
   function applyFilters() {
     const query = activeSearchQuery.toLowerCase().trim();
 
-    filteredPapers = allPapers.filter((p) => {
-      // Search
-      if (query) {
-        const haystack = `${p.title} ${p.authors?.join(" ")} ${p.abstract}`.toLowerCase();
-        if (!haystack.includes(query)) return false;
+    // Search uses the prebuilt index, fetched on the first query; until it
+    // arrives, fall back to substring matching on the card data
+    if (query && !searchIndex && !searchIndexRequest) {
+      loadSearchIndex().then((ok) => { if (ok) applyFilters(); });
+    }
+    const mask = query && searchIndex ? searchMask(query) : null;
+
+    // Author / affiliation facets need their index; refilter once it arrives
+    if ((activeAuthor || activeAffiliation) && !authorIndex && !authorIndexRequest) {
+      loadAuthorIndex().then((ok) => { if (ok) applyFilters(); });
+    }
+    const people = authorIndex ? peopleMask() : null;
+
+    filteredPapers = allPapers.filter((p, ord) => {
+      if (people) {
+        if (!bitHas(people, ord)) return false;
+      } else if (activeAuthor) {
+        // Until the index is loaded, match the authors on the card
+        if (!(p.authors || []).some((a) => foldName(a) === activeAuthor)) return false;
       }
 
-      // Year
-      if (activeYear && p.published) {
-        const y = new Date(p.published).getFullYear();
-        if (y !== parseInt(activeYear)) return false;
+      if (mask) {
+        // Search terms, year and tags are already folded into the bitset
+        if (!bitHas(mask, ord)) return false;
+      } else {
+        // Search
+        if (query) {
+          const haystack = `${p.title} ${p.authors?.join(" ")} ${p.abstract}`.toLowerCase();
+          if (!haystack.includes(query)) return false;
+        }
+
+        // Year
+        if (activeYear && p.published) {
+          const y = new Date(p.published).getFullYear();
+          if (y !== parseInt(activeYear)) return false;
+        }
+
+        // Tags (OR logic  paper must have at least one active tag)
+        if (activeTags.size > 0) {
+          const paperTags = new Set(p.tags || []);
+          let hasAny = false;
+          for (const t of activeTags) {
+            if (paperTags.has(t)) { hasAny = true; break; }
+          }
+          if (!hasAny) return false;
+        }
       }
 
       // Month
@@ -166,16 +233,6 @@
         if (m !== parseInt(activeMonth)) return false;
       }
 
-      // Tags (OR logic  paper must have at least one active tag)
-      if (activeTags.size > 0) {
-        const paperTags = new Set(p.tags || []);
-        let hasAny = false;
-        for (const t of activeTags) {
-          if (paperTags.has(t)) { hasAny = true; break; }
-        }
-        if (!hasAny) return false;
-      }
-
       return true;
     });
 
@@ -235,7 +292,7 @@
       : "";
 
     const authorsStr = (paper.authors || []).slice(0, 5).join(", ") +
-      (paper.authors?.length > 5 ? " et al." : "");
+      (paper.et_al || paper.authors?.length > 5 ? " et al." : "");
 
     const tagsHTML = (paper.tags || [])
       .map((t) => `<span class="paper-tag">${t}</span>`)
@@ -265,7 +322,7 @@
       <div class="paper-tags">${tagsHTML}</div>
       <div class="paper-links">
         <a href="${paper.pdf_url || "#"}" target="_blank" rel="noopener" class="paper-link" onclick="event.stopPropagation()">PDF</a>
-        <a href="${paper.abs_url || "#"}" target="_blank" rel="noopener" class="paper-link" onclick="event.stopPropagation()">arXiv</a>
+        <a href="${absUrl(paper)}" target="_blank" rel="noopener" class="paper-link" onclick="event.stopPropagation()">arXiv</a>
       </div>
     `;
 
@@ -275,6 +332,20 @@
 
   //  Modal 
   function openModal(paper) {
+    modalPaperId = paper.id;
+    renderModal(paper);
+
+    modal.style.display = "flex";
+    document.body.style.overflow = "hidden";
+
+    if (!paper.detailLoaded) {
+      loadShard(paper.shard).then(() => {
+        if (modalPaperId === paper.id) renderModal(paper);
+      });
+    }
+  }
+
+  function renderModal(paper) {
     const dateStr = paper.published
       ? new Date(paper.published).toLocaleDateString("en-US", {
           year: "numeric", month: "long", day: "numeric"
@@ -287,15 +358,14 @@
         })
       : "";
 
-    const authors = (paper.authors || []).join(", ");
+    const authors = facetLinks(paper.authors || [], "author", ", ");
     const categories = (paper.categories || []).join(", ");
-    const affiliations = (paper.affiliations || []).filter(Boolean);
-    const affiliationsStr = affiliations.join("; ");
+    const affiliationsStr = facetLinks((paper.affiliations || []).filter(Boolean), "affiliation", "; ");
 
     $("#modalTitle").textContent = paper.title;
     $("#modalMeta").innerHTML = `
-      <div><strong>Authors:</strong> ${escapeHTML(authors)}</div>
-      ${affiliationsStr ? `<div><strong>Affiliations:</strong> ${escapeHTML(affiliationsStr)}</div>` : ""}
+      <div><strong>Authors:</strong> ${authors}</div>
+      ${affiliationsStr ? `<div><strong>Affiliations:</strong> ${affiliationsStr}</div>` : ""}
       <div><strong>Published:</strong> ${dateStr}${updatedStr && updatedStr !== dateStr ? `  Updated: ${updatedStr}` : ""}</div>
       <div><strong>Categories:</strong> ${escapeHTML(categories)}</div>
       <div><strong>ID:</strong> ${escapeHTML(paper.id || "")}</div>
@@ -330,13 +400,11 @@
 
     $("#modalAbstract").textContent = paper.abstract || "";
     $("#modalPdf").href = paper.pdf_url || "#";
-    $("#modalArxiv").href = paper.abs_url || "#";
-
-    modal.style.display = "flex";
-    document.body.style.overflow = "hidden";
+    $("#modalArxiv").href = absUrl(paper);
   }
 
   function closeModal() {
+    modalPaperId = null;
     modal.style.display = "none";
     document.body.style.overflow = "";
   }
@@ -348,6 +416,8 @@
     if (activeYear) params.set("year", activeYear);
     if (activeMonth) params.set("month", activeMonth);
     if (activeTags.size > 0) params.set("tags", [...activeTags].join(","));
+    if (activeAuthor) params.set("author", activeAuthor);
+    if (activeAffiliation) params.set("affiliation", activeAffiliation);
     if (activeSort !== "date-desc") params.set("sort", activeSort);
 
     const search = params.toString();
@@ -388,6 +458,14 @@
       }, 0);
     }
 
+    if (params.has("author") || params.has("affiliation")) {
+      // Shown with their display names once the author index is loaded
+      activeAuthor = foldName(params.get("author") || "");
+      activeAffiliation = foldName(params.get("affiliation") || "");
+      authorFilter.value = params.get("author") || "";
+      clearPeopleBtn.style.display = "inline";
+    }
+
     if (params.has("sort")) {
       activeSort = params.get("sort");
       sortSelect.value = activeSort;
@@ -452,6 +530,38 @@
       syncURL();
     });
 
+    // Author / affiliation facets; their index is fetched on first use
+    ["focusin", "pointerenter"].forEach((type) => {
+      peopleSection.addEventListener(type, () => { loadAuthorIndex(); }, { once: true });
+    });
+
+    let authorTimer;
+    authorFilter.addEventListener("input", () => {
+      clearTimeout(authorTimer);
+      authorTimer = setTimeout(suggestAuthors, 150);
+    });
+
+    authorFilter.addEventListener("change", () => {
+      setPeopleFacet("author", authorFilter.value);
+    });
+
+    affiliationFilter.addEventListener("change", () => {
+      setPeopleFacet("affiliation", affiliationFilter.value);
+    });
+
+    clearPeopleBtn.addEventListener("click", () => {
+      setPeopleFacet("author", "");
+      setPeopleFacet("affiliation", "");
+    });
+
+    // "Papers by this author / affiliation" from the modal
+    $("#modalMeta").addEventListener("click", (e) => {
+      const link = e.target.closest(".facet-link");
+      if (!link) return;
+      closeModal();
+      setPeopleFacet(link.dataset.kind, link.textContent);
+    });
+
     // Load more
     loadMoreBtn.addEventListener("click", renderNextBatch);
 
@@ -477,6 +587,282 @@
     });
   }
 
+  //  Detail shards 
+  function loadShard(key) {
+    if (shardRequests.has(key)) return shardRequests.get(key);
+    const url = shardUrls[key];
+    if (!url) return Promise.resolve();
+
+    const request = fetch(url)
+      .then((resp) => (resp.ok ? resp.json() : {}))
+      .then((details) => {
+        Object.entries(details).forEach(([id, detail]) => {
+          const paper = paperById.get(id);
+          if (paper) Object.assign(paper, detail, { detailLoaded: true });
+        });
+      })
+      .catch(() => {
+        // Allow a retry on the next modal open / search
+        shardRequests.delete(key);
+      });
+    shardRequests.set(key, request);
+    return request;
+  }
+
+  //  Search index 
+  function loadSearchIndex() {
+    if (searchIndexRequest) return searchIndexRequest;
+    const url = typeof PAPERS_DATA !== "undefined" ? PAPERS_DATA.search_index : null;
+    if (!url) {
+      searchIndexRequest = Promise.resolve(false);
+      return searchIndexRequest;
+    }
+    searchIndexRequest = fetch(url)
+      .then((resp) => (resp.ok ? resp.json() : null))
+      .then((index) => {
+        // Ordinals are only meaningful for the card index built alongside
+        if (!index || index.version !== SEARCH_INDEX_VERSION ||
+            index.doc_count !== allPapers.length) {
+          return false;
+        }
+        index.stopwordSet = new Set(index.stopwords || []);
+        searchIndex = index;
+        return true;
+      })
+      .catch(() => false);
+    return searchIndexRequest;
+  }
+
+  function normalizeText(str) {
+    return str.normalize("NFKD").replace(/[\u0300-\u036f]/g, "").toLowerCase();
+  }
+
+  function queryTokens(query) {
+    const minLength = searchIndex.min_token_length || 1;
+    return (normalizeText(query).match(/[a-z0-9]+/g) || [])
+      .filter((t) => t.length >= minLength && !searchIndex.stopwordSet.has(t));
+  }
+
+  function termPostings(termIndex) {
+    let ordinals = postingsCache.get(termIndex);
+    if (ordinals) return ordinals;
+    ordinals = decodePostings(searchIndex.postings[termIndex]);
+    postingsCache.set(termIndex, ordinals);
+    return ordinals;
+  }
+
+  // Delta-encoded base64 VLQ: 5 data bits per char, 0x20 = continuation
+  function decodePostings(encoded) {
+    const ordinals = [];
+    let prev = 0, value = 0, shift = 0;
+    for (let i = 0; i < encoded.length; i++) {
+      const digit = VLQ_ALPHABET.indexOf(encoded[i]);
+      value |= (digit & 31) << shift;
+      if (digit & 32) {
+        shift += 5;
+      } else {
+        prev += value;
+        ordinals.push(prev);
+        value = 0;
+        shift = 0;
+      }
+    }
+    return ordinals;
+  }
+
+  // Number of ordinals in an encoded postings list, without decoding it
+  function postingsCount(encoded) {
+    let count = 0;
+    for (let i = 0; i < encoded.length; i++) {
+      if (!(VLQ_ALPHABET.indexOf(encoded[i]) & 32)) count++;
+    }
+    return count;
+  }
+
+  function lowerBound(sorted, key) {
+    let lo = 0, hi = sorted.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (sorted[mid] < key) lo = mid + 1; else hi = mid;
+    }
+    return lo;
+  }
+
+  function decodeBitset(encoded) {
+    if (!encoded) return new Uint8Array((allPapers.length + 7) >> 3);
+    let bits = bitsetCache.get(encoded);
+    if (!bits) {
+      const raw = atob(encoded);
+      bits = new Uint8Array(raw.length);
+      for (let i = 0; i < raw.length; i++) bits[i] = raw.charCodeAt(i);
+      bitsetCache.set(encoded, bits);
+    }
+    return bits;
+  }
+
+  function bitHas(bits, ord) {
+    return (bits[ord >> 3] & (1 << (ord & 7))) !== 0;
+  }
+
+  function andBits(a, b) {
+    const out = new Uint8Array(a.length);
+    for (let i = 0; i < a.length; i++) out[i] = a[i] & (b[i] || 0);
+    return out;
+  }
+
+  // Bitset of papers matching every query token (as a term prefix), the
+  // active year and at least one active tag. Null when the query has no
+  // indexable tokens, so the caller falls back to substring matching.
+  function searchMask(query) {
+    const tokens = queryTokens(query);
+    if (tokens.length === 0) return null;
+
+    const size = (allPapers.length + 7) >> 3;
+    const terms = searchIndex.terms;
+    let mask = null;
+    tokens.forEach((token) => {
+      const tokenMask = new Uint8Array(size);
+      for (let i = lowerBound(terms, token); i < terms.length && terms[i].startsWith(token); i++) {
+        termPostings(i).forEach((ord) => { tokenMask[ord >> 3] |= 1 << (ord & 7); });
+      }
+      mask = mask ? andBits(mask, tokenMask) : tokenMask;
+    });
+
+    const facets = searchIndex.facets || {};
+    if (activeYear) {
+      mask = andBits(mask, decodeBitset((facets.years || {})[activeYear]));
+    }
+    if (activeTags.size > 0) {
+      const anyTag = new Uint8Array(size);
+      activeTags.forEach((tag) => {
+        const bits = decodeBitset((facets.tags || {})[tag]);
+        for (let i = 0; i < size; i++) anyTag[i] |= bits[i];
+      });
+      mask = andBits(mask, anyTag);
+    }
+    return mask;
+  }
+
+  //  Author / affiliation index 
+  function loadAuthorIndex() {
+    if (authorIndexRequest) return authorIndexRequest;
+    const url = typeof PAPERS_DATA !== "undefined" ? PAPERS_DATA.author_index : null;
+    if (!url) {
+      authorIndexRequest = Promise.resolve(false);
+      return authorIndexRequest;
+    }
+    authorIndexRequest = fetch(url)
+      .then((resp) => (resp.ok ? resp.json() : null))
+      .then((index) => {
+        if (!index || index.version !== AUTHOR_INDEX_VERSION ||
+            index.doc_count !== allPapers.length) {
+          return false;
+        }
+        authorIndex = index;
+        initAffiliationOptions();
+        const author = findName("authors", activeAuthor);
+        if (author >= 0) authorFilter.value = index.authors.names[author];
+        return true;
+      })
+      .catch(() => false);
+    return authorIndexRequest;
+  }
+
+  // Mirrors fold_name in scripts/author_index.py
+  function foldName(str) {
+    return normalizeText(str)
+      .replace(/[\u00f8\u0111\u00f0\u0142\u0131\u00df\u00e6\u0153\u00fe]/g, (c) => NAME_FOLDS[c])
+      .replace(/[^a-z0-9]+/g, " ")
+      .trim();
+  }
+
+  function findName(kind, key) {
+    const keys = authorIndex[kind].keys;
+    const i = lowerBound(keys, key);
+    return key && keys[i] === key ? i : -1;
+  }
+
+  // The exact name when it is indexed, else every name with a word starting with it
+  function matchingNames(kind, key) {
+    const exact = findName(kind, key);
+    if (exact >= 0) return [exact];
+    const matches = [];
+    authorIndex[kind].keys.forEach((k, i) => {
+      if (k.startsWith(key) || k.includes(` ${key}`)) matches.push(i);
+    });
+    return matches;
+  }
+
+  function facetBits(kind, key) {
+    const size = (allPapers.length + 7) >> 3;
+    const bits = new Uint8Array(size);
+    matchingNames(kind, key).forEach((i) => {
+      decodePostings(authorIndex[kind].postings[i]).forEach((ord) => { bits[ord >> 3] |= 1 << (ord & 7); });
+    });
+    return bits;
+  }
+
+  // Bitset of papers matching the active author and affiliation, or null
+  function peopleMask() {
+    let mask = null;
+    if (activeAuthor) mask = facetBits("authors", activeAuthor);
+    if (activeAffiliation) {
+      const bits = facetBits("affiliations", activeAffiliation);
+      mask = mask ? andBits(mask, bits) : bits;
+    }
+    return mask;
+  }
+
+  function initAffiliationOptions() {
+    const { names, postings } = authorIndex.affiliations;
+    names
+      .map((name, i) => ({ name, key: authorIndex.affiliations.keys[i], count: postingsCount(postings[i]) }))
+      .sort((a, b) => b.count - a.count || a.name.localeCompare(b.name))
+      .forEach(({ name, key, count }) => {
+        const opt = document.createElement("option");
+        opt.value = key;
+        opt.textContent = `${name} (${count})`;
+        affiliationFilter.appendChild(opt);
+      });
+    affiliationFilter.value = activeAffiliation;
+  }
+
+  function suggestAuthors() {
+    authorOptions.innerHTML = "";
+    const key = foldName(authorFilter.value);
+    if (!authorIndex || key.length < 2) return;
+    const { names, postings } = authorIndex.authors;
+    matchingNames("authors", key)
+      .map((i) => ({ name: names[i], count: postingsCount(postings[i]) }))
+      .sort((a, b) => b.count - a.count)
+      .slice(0, 10)
+      .forEach(({ name }) => {
+        const opt = document.createElement("option");
+        opt.value = name;
+        authorOptions.appendChild(opt);
+      });
+  }
+
+  function setPeopleFacet(kind, value) {
+    const key = foldName(value || "");
+    if (kind === "author") {
+      activeAuthor = key;
+      authorFilter.value = value || "";
+    } else {
+      activeAffiliation = key;
+      affiliationFilter.value = key;
+    }
+    clearPeopleBtn.style.display = activeAuthor || activeAffiliation ? "inline" : "none";
+    applyFilters();
+    syncURL();
+  }
+
+  function facetLinks(names, kind, separator) {
+    return names
+      .map((name) => `<button type="button" class="facet-link" data-kind="${kind}">${escapeHTML(name)}</button>`)
+      .join(separator);
+  }
+
   //  Helpers 
   function getLocalDateKey(date) {
     return `${date.getFullYear()}-${date.getMonth()}-${date.getDate()}`;
@@ -497,6 +883,11 @@
     return getLocalDateKey(d) === getLocalDateKey(targetDate);
   }
 
+  function absUrl(paper) {
+    if (paper.abs_url) return paper.abs_url;
+    return paper.id ? `https://arxiv.org/abs/${paper.id}` : "#";
+  }
+
   function escapeHTML(str) {
     const div = document.createElement("div");
     div.textContent = str;
@@ -524,6 +915,11 @@
     activeTags.clear();
     $$(".tag-badge").forEach((el) => el.classList.remove("active"));
     clearTagsBtn.style.display = "none";
+    authorFilter.value = "";
+    activeAuthor = "";
+    affiliationFilter.value = "";
+    activeAffiliation = "";
+    clearPeopleBtn.style.display = "none";
     applyFilters();
     syncURL();
   };
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The pipeline modules are flat scripts, imported the way they import each other
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
@@ -0,0 +1,29 @@
+import json
+
+from fetch_papers import HarvestWatermark
+
+
+def test_save_prunes_ids_behind_the_overlap_window(tmp_path):
+    path = tmp_path / "harvest_state.json"
+    watermark = HarvestWatermark()
+    watermark.observe("2406.00001", "2024-06-01T00:00:00Z", "2024-06-01T00:00:00Z")
+    watermark.observe("2506.00001", "2025-06-01T00:00:00Z", "2025-06-01T00:00:00Z")
+    watermark.save(path)
+
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert saved["seen"] == {"2506.00001": "2025-06-01T00:00:00Z"}
+    assert HarvestWatermark.load(path).seen == saved["seen"]
+
+
+def test_load_accepts_bare_ids_and_prunes_them_on_save(tmp_path):
+    path = tmp_path / "harvest_state.json"
+    path.write_text(json.dumps({
+        "newest_published": "2025-06-01T00:00:00Z",
+        "newest_updated": "2025-06-01T00:00:00Z",
+        "seen_ids": ["2406.00001"],
+    }), encoding="utf-8")
+    watermark = HarvestWatermark.load(path)
+    assert watermark.is_known("2406.00001", "", watermark.overlap_cutoff())
+
+    watermark.save(path)
+    assert json.loads(path.read_text(encoding="utf-8"))["seen"] == {}